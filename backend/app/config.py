@@ -1,18 +1,52 @@
-from typing import List
+import re
+from functools import cached_property
+from pathlib import Path
+from typing import List, Optional
 
-from dotenv import load_dotenv
 from pydantic import Field
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
-# Load environment variables from the .env file
-load_dotenv()
+# The .env file lives in the backend package, independent of the working directory
+ENV_FILE_PATH = Path(__file__).resolve().parent.parent / ".env"
+
+# Matches a single token in a comma-separated list, excluding whitespace and quotes
+_TOKEN_RE = re.compile(r"[^,\s'\"]+")
+
+
+class SecretsConfiguration(BaseSettings):
+    """
+    Credentials and connection settings that are only required by some components.
+    Loaded on first access via AppConfiguration.secrets instead of at import time; each
+    setting is optional so that a component is not blocked by the secrets of another.
+    """
+
+    model_config = SettingsConfigDict(
+        env_file=ENV_FILE_PATH,
+        env_file_encoding="utf-8",
+        extra="ignore",
+        frozen=True,
+    )
+
+    # Bitbucket OAuth2 Configuration
+    BITBUCKET_CLIENT_ID: Optional[str] = Field(
+        default=None, description="Bitbucket OAuth2 client ID"
+    )
+    BITBUCKET_SECRET: Optional[str] = Field(
+        default=None, description="Bitbucket OAuth2 client secret"
+    )
+
+    # Database Configuration
+    MONGO_URI: Optional[str] = Field(default=None, description="MongoDB connection URI")
+    MONGO_DB_NAME: Optional[str] = Field(
+        default=None, description="Default database name"
+    )
 
 
 class AppConfiguration(BaseSettings):
     """Application configuration with environment variables."""
 
     model_config = SettingsConfigDict(
-        env_file=".env",
+        env_file=ENV_FILE_PATH,
         env_file_encoding="utf-8",
         extra="ignore",
         frozen=True,
@@ -25,6 +59,27 @@ class AppConfiguration(BaseSettings):
     SERVER_PORT: int = Field(
         default=5000, ge=1, le=65535, description="Port number for the server"
     )
+    GRAPHQL_CACHE_SIZE: int = Field(
+        default=128,
+        ge=1,
+        description="Number of parsed and validated GraphQL queries kept for reuse",
+    )
+    GRAPHQL_MAX_DEPTH: int = Field(
+        default=8, ge=1, description="Maximum selection depth of a GraphQL operation"
+    )
+    GRAPHQL_MAX_BATCH_SIZE: int = Field(
+        default=10,
+        ge=1,
+        description="Maximum number of operations in a batched request",
+    )
+    MAX_JOBS_PAGE_SIZE: int = Field(
+        default=100, ge=1, description="Maximum number of jobs returned per page"
+    )
+    MAX_FETCH_PROJECTS_REPOS: int = Field(
+        default=1000,
+        ge=1,
+        description="Maximum number of repositories fetched by the fetchProjects query",
+    )
 
     # Platform Configurations
     GITLAB_BASE_URL: str = Field(
@@ -53,8 +108,6 @@ class AppConfiguration(BaseSettings):
     )
 
     # Bitbucket OAuth2 Configuration
-    BITBUCKET_CLIENT_ID: str = Field(description="Bitbucket OAuth2 client ID")
-    BITBUCKET_SECRET: str = Field(description="Bitbucket OAuth2 client secret")
     BITBUCKET_TOKEN_URL: str = Field(
         default="https://bitbucket.org/site/oauth2/access_token",
         description="URL for Bitbucket OAuth2 token endpoint",
@@ -87,9 +140,58 @@ class AppConfiguration(BaseSettings):
         ge=1,
         description="Maximum backoff time for exponential retry in seconds",
     )
+    MAX_CONCURRENT_JOBS: int = Field(
+        default=8,
+        ge=1,
+        description="Maximum number of fetch jobs running at the same time; further jobs wait",
+    )
+    MAX_JOB_LOG_LINES: int = Field(
+        default=10000,
+        ge=1,
+        description="Maximum number of log entries kept per job; older entries are dropped",
+    )
     MAX_CONCURRENT_REQUESTS: int = Field(
         default=10, ge=1, description="Maximum simultaneous HTTP requests allowed"
     )
+    RATE_LIMIT_RATE: float = Field(
+        default=10.0,
+        gt=0.0,
+        description="Maximum request rate per second of the REST rate limiter",
+    )
+    RATE_LIMIT_BURST: int = Field(
+        default=10, ge=1, description="Maximum request burst of the REST rate limiter"
+    )
+    HTTP_POOL_SIZE: int = Field(
+        default=100,
+        ge=1,
+        description="Maximum connections of the shared HTTP client",
+    )
+    HTTP_KEEPALIVE_CONNECTIONS: int = Field(
+        default=50,
+        ge=1,
+        description="Maximum idle keep-alive connections of the shared HTTP client",
+    )
+    HTTP_KEEPALIVE_EXPIRY: float = Field(
+        default=60.0,
+        ge=0.0,
+        description="Seconds an idle connection (and its TLS session) is kept open for reuse",
+    )
+    RESPONSE_CACHE_TTL: float = Field(
+        default=300.0,
+        ge=0.0,
+        description="Seconds cached GraphQL responses are reused (0 disables the cache)",
+    )
+    RESPONSE_CACHE_SIZE: int = Field(
+        default=256, ge=1, description="Maximum number of cached GraphQL responses"
+    )
+    JOBS_CACHE_TTL: float = Field(
+        default=5.0,
+        ge=0.0,
+        description="Seconds listed jobs are served from memory until a job is written (0 disables the cache)",
+    )
+    JOBS_CACHE_SIZE: int = Field(
+        default=64, ge=1, description="Maximum number of cached job listings"
+    )
     USER_AGENT: str = Field(
         default="Project/1.0 (+https://example.com/contact)",
         description=(
@@ -99,8 +201,6 @@ class AppConfiguration(BaseSettings):
     )
 
     # Database Configuration
-    MONGO_URI: str = Field(description="MongoDB connection URI")
-    MONGO_DB_NAME: str = Field(description="Default database name")
     FETCH_JOBS_COLLECTION: str = Field(
         default="fetch_jobs", description="Collection name for storing fetch jobs"
     )
@@ -123,28 +223,53 @@ class AppConfiguration(BaseSettings):
         default="INFO",
         description="Application log level (DEBUG|INFO|WARNING|ERROR|CRITICAL)",
     )
+    JOB_LOG_LEVEL: str = Field(
+        default="DEBUG",
+        pattern="(?i)^(DEBUG|INFO|WARNING|ERROR|EXCEPTION)$",
+        description="Minimum level of messages stored in job logs (DEBUG|INFO|WARNING|ERROR|EXCEPTION)",
+    )
 
     TOKEN_BAN_COOLDOWN: int = Field(
         default=600,  # 10 minutes
         ge=1,
         description="Cooldown in seconds for banned tokens before they are available again",
     )
+    GITHUB_TOKEN_RATE: float = Field(
+        default=5000 / 3600,
+        gt=0.0,
+        description="Requests per second per GitHub token (GitHub allows 5000 per hour)",
+    )
+    GITLAB_TOKEN_RATE: float = Field(
+        default=2000 / 60,
+        gt=0.0,
+        description="Requests per second per GitLab token (GitLab allows 2000 per minute)",
+    )
+    TOKEN_RATE_BURST: int = Field(
+        default=10, ge=1, description="Maximum request burst per API token"
+    )
+    RATE_LIMIT_JITTER: float = Field(
+        default=0.1,
+        ge=0.0,
+        description="Random extra wait of rate limited requests, as a fraction of the wait",
+    )
+    TOKEN_STRATEGY: str = Field(
+        default="round_robin",
+        pattern="^(round_robin|fill_first|least_used)$",
+        description="Token selection strategy (round_robin|fill_first|least_used)",
+    )
+
+    @cached_property
+    def secrets(self) -> SecretsConfiguration:
+        """Credentials and database settings, resolved on first access."""
+        return SecretsConfiguration()
 
-    @property
+    @cached_property
     def github_tokens(self) -> List[str]:
-        return [
-            t.strip().strip('"').strip("'")
-            for t in self.GITHUB_TOKENS.split(",")
-            if t.strip()
-        ]
+        return _TOKEN_RE.findall(self.GITHUB_TOKENS)
 
-    @property
+    @cached_property
     def gitlab_tokens(self) -> List[str]:
-        return [
-            t.strip().strip('"').strip("'")
-            for t in self.GITLAB_TOKENS.split(",")
-            if t.strip()
-        ]
+        return _TOKEN_RE.findall(self.GITLAB_TOKENS)
 
 
 app_configuration = AppConfiguration()
@@ -1,12 +1,25 @@
+from contextlib import asynccontextmanager
+
 import uvicorn
 from fastapi import FastAPI
+from fastapi.responses import ORJSONResponse
 
 from backend.app.config import app_configuration
+from backend.fetchers.http_client import close_http_client
 from backend.graphql.router import graphql_router, file_router
 from backend.utils.logger import logger
 
+
+@asynccontextmanager
+async def lifespan(_: FastAPI):
+    """Close shared resources when the application shuts down."""
+    yield
+    await close_http_client()
+
+
 # Initialize FastAPI
-app = FastAPI()
+# Plain responses (e.g. file download errors) are encoded with orjson as well
+app = FastAPI(lifespan=lifespan, default_response_class=ORJSONResponse)
 
 # Include GraphQL routes
 app.include_router(graphql_router, prefix="/graphql")
@@ -1,42 +1,90 @@
-from typing import List, Optional
+import threading
+from functools import lru_cache
+from typing import Any, Dict, Iterable, Iterator, List, Optional
 
 from bson import ObjectId
 from pymongo import errors
 from pymongo.collection import Collection
-from pymongo.results import InsertOneResult, DeleteResult, UpdateResult
-from strawberry import asdict
+from pymongo.results import (
+    InsertOneResult,
+    InsertManyResult,
+    DeleteResult,
+    UpdateResult,
+)
 
+from backend.app.config import app_configuration
 from backend.database.mongodb import get_collection, ensure_indexes
 from backend.graphql.git_types import FetchJob
 from backend.utils.db_utils import (
     validate_is_dataclass,
-    convert_enums_to_strings,
+    convert_job_to_document,
     find_one_as_dict,
     convert_strings_to_enums,
 )
 from backend.utils.logger import logger
+from backend.utils.response_cache import ResponseCache
+
+# FetchJob fields without defaults, always included in projections
+_REQUIRED_JOB_FIELDS = ("jobId", "name", "mode", "platform", "state")
+
+# Collections with ensured indexes, keyed by the requested collection name
+_collections: Dict[Optional[str], Collection] = {}
+_collections_lock = threading.Lock()
+
+# Job listings of the default collection (raw documents), cleared on every job write
+# except log appends. The TTL bounds how long changes made outside this process and
+# new log entries stay invisible.
+_jobs_cache = ResponseCache(
+    ttl=app_configuration.JOBS_CACHE_TTL, maxsize=app_configuration.JOBS_CACHE_SIZE
+)
 
 
 def _get_or_create_collection(collection_name: Optional[str] = None) -> Collection:
     """
     Get the MongoDB collection, create it if it does not exist and ensure indexes.
+    The collection is cached, so indexes are only ensured once per process.
     """
-    collection = get_collection(collection_name)
-    # Ensure an index on jobId for fast lookups
-    ensure_indexes(collection, [{"jobId": 1}])
+    collection = _collections.get(collection_name)
+    if collection is not None:
+        return collection
+
+    with _collections_lock:
+        collection = _collections.get(collection_name)
+        if collection is None:
+            collection = get_collection(collection_name)
+            # Ensure an index on jobId for fast lookups
+            ensure_indexes(collection, [{"jobId": 1}])
+            _collections[collection_name] = collection
     return collection
 
 
+def _resolve_collection(collection: Optional[Collection] = None) -> Collection:
+    """Return the given collection or the default one."""
+    return collection if collection is not None else _get_or_create_collection()
+
+
+def _build_projection(fields: Optional[Iterable[str]]) -> Optional[Dict[str, int]]:
+    """Build a MongoDB projection for the given fields plus the required job fields."""
+    if fields is None:
+        return None
+    return {field: 1 for field in (*_REQUIRED_JOB_FIELDS, *fields)}
+
+
+def _job_to_document(job: FetchJob) -> dict:
+    """Convert a fetch job into a MongoDB document."""
+    return convert_job_to_document(job)
+
+
 def create_job(job: FetchJob, collection: Optional[Collection] = None) -> str:
     """
     Create a new fetch job in the database.
     If no collection is provided, uses the default from config.
     """
     validate_is_dataclass(job, "job")
-    db_collection = collection or _get_or_create_collection()
+    db_collection = _resolve_collection(collection)
 
     try:
-        job_dict = convert_enums_to_strings(asdict(job))
+        job_dict = _job_to_document(job)
         new_id = ObjectId()
 
         # Ensure consistent IDs in both database and string formats
@@ -45,6 +93,7 @@ def create_job(job: FetchJob, collection: Optional[Collection] = None) -> str:
         result: InsertOneResult = db_collection.insert_one(job_dict)
         if result.inserted_id != new_id:
             raise RuntimeError("Job ID mismatch during insertion")
+        _jobs_cache.clear()
         logger.info(f"Created new job with ID {new_id}")
         return str(new_id)
     except errors.PyMongoError as e:
@@ -52,23 +101,55 @@ def create_job(job: FetchJob, collection: Optional[Collection] = None) -> str:
         raise RuntimeError(f"Job creation failed: {e}") from e
 
 
+def create_jobs(
+    jobs: List[FetchJob], collection: Optional[Collection] = None
+) -> List[str]:
+    """
+    Create multiple fetch jobs with a single bulk insert.
+    Returns the new job IDs in the order of the given jobs.
+    """
+    if not jobs:
+        return []
+    for job in jobs:
+        validate_is_dataclass(job, "job")
+    db_collection = _resolve_collection(collection)
+
+    try:
+        documents = []
+        for job in jobs:
+            new_id = ObjectId()
+            documents.append(
+                _job_to_document(job) | {"_id": new_id, "jobId": str(new_id)}
+            )
+
+        result: InsertManyResult = db_collection.insert_many(documents, ordered=False)
+        _jobs_cache.clear()
+        job_ids = [str(inserted_id) for inserted_id in result.inserted_ids]
+        logger.info(f"Created {len(job_ids)} new jobs")
+        return job_ids
+    except errors.PyMongoError as e:
+        logger.error(f"Bulk job creation failed: {e}")
+        raise RuntimeError(f"Bulk job creation failed: {e}") from e
+
+
 def update_job(job: FetchJob, collection: Optional[Collection] = None) -> None:
     """
     Update existing job with new values.
     """
     validate_is_dataclass(job, "job")
-    _validate_job_id(job.jobId)
-    db_collection = collection or _get_or_create_collection()
+    object_id = _validate_job_id(job.jobId)
+    db_collection = _resolve_collection(collection)
 
     try:
-        job_dict = convert_enums_to_strings(asdict(job))
+        job_dict = _job_to_document(job)
 
         # Prevent modification of immutable identifiers
         immutable_fields = {"_id", "jobId"}
         update_data = {k: v for k, v in job_dict.items() if k not in immutable_fields}
         result: UpdateResult = db_collection.update_one(
-            {"_id": ObjectId(job.jobId)}, {"$set": update_data}
+            {"_id": object_id}, {"$set": update_data}
         )
+        _jobs_cache.clear()
         if result.matched_count == 0:
             logger.warning(f"Job not found with ID: {job.jobId}")
             raise ValueError(f"Job not found with ID: {job.jobId}")
@@ -77,43 +158,126 @@ def update_job(job: FetchJob, collection: Optional[Collection] = None) -> None:
         raise RuntimeError(f"Job update failed: {e}") from e
 
 
-def get_job(job_id: str, collection: Optional[Collection] = None) -> Optional[FetchJob]:
+def update_job_log(
+    job_id: str, log: List[str], collection: Optional[Collection] = None
+) -> None:
+    """
+    Replace the log of an existing job.
+    Running jobs append log entries far more often than anything else changes, so this
+    writes only the log and keeps the cached job listings; they pick up the new entries
+    when they expire.
+    """
+    object_id = _validate_job_id(job_id)
+    db_collection = _resolve_collection(collection)
+
+    try:
+        result: UpdateResult = db_collection.update_one(
+            {"_id": object_id}, {"$set": {"log": log}}
+        )
+        if result.matched_count == 0:
+            logger.warning(f"Job not found with ID: {job_id}")
+            raise ValueError(f"Job not found with ID: {job_id}")
+    except errors.PyMongoError as e:
+        logger.error(f"Job log update failed: {e}")
+        raise RuntimeError(f"Job log update failed: {e}") from e
+
+
+def get_job(
+    job_id: str,
+    collection: Optional[Collection] = None,
+    fields: Optional[Iterable[str]] = None,
+) -> Optional[FetchJob]:
     """
     Retrieve a single job by ID.
+    If fields are given, only those (plus the required job fields) are loaded.
     """
-    _validate_job_id(job_id)
-    db_collection = collection or _get_or_create_collection()
+    object_id = _validate_job_id(job_id)
+    db_collection = _resolve_collection(collection)
 
     try:
-        document = find_one_as_dict(db_collection, {"_id": ObjectId(job_id)})
+        document = find_one_as_dict(
+            db_collection, {"_id": object_id}, _build_projection(fields)
+        )
         return convert_strings_to_enums(document) if document else None
     except errors.PyMongoError as e:
         logger.error(f"Job retrieval failed: {e}")
         raise RuntimeError(f"Job retrieval failed: {e}") from e
 
 
-def get_all_jobs(collection: Optional[Collection] = None) -> List[FetchJob]:
-    """
-    Retrieve all jobs from the collection.
-    """
-    db_collection = collection or _get_or_create_collection()
+def _iter_job_documents(
+    collection: Optional[Collection] = None,
+    projection: Optional[Dict[str, int]] = None,
+    limit: Optional[int] = None,
+    after: Optional[str] = None,
+) -> Iterator[Dict[str, Any]]:
+    """Lazily yield the raw job documents for iter_jobs."""
+    db_collection = _resolve_collection(collection)
+    query = {"_id": {"$gt": _validate_job_id(after)}} if after else {}
 
     try:
-        return [convert_strings_to_enums(doc) for doc in db_collection.find()]
+        cursor = db_collection.find(query, projection=projection)
+        if limit is not None or after:
+            cursor = cursor.sort("_id", 1)
+        if limit is not None:
+            cursor = cursor.limit(limit)
+        yield from cursor
     except errors.PyMongoError as e:
         logger.error(f"Failed to retrieve jobs: {e}")
         raise RuntimeError(f"Failed to retrieve jobs: {e}") from e
 
 
+def iter_jobs(
+    collection: Optional[Collection] = None,
+    projection: Optional[Dict[str, int]] = None,
+    limit: Optional[int] = None,
+    after: Optional[str] = None,
+) -> Iterator[FetchJob]:
+    """
+    Lazily yield jobs from the collection, one document at a time.
+    With a limit or an after job ID, jobs are paged in creation (ID) order by MongoDB.
+    """
+    for doc in _iter_job_documents(collection, projection, limit, after):
+        yield convert_strings_to_enums(doc)
+
+
+def get_all_jobs(
+    collection: Optional[Collection] = None,
+    fields: Optional[Iterable[str]] = None,
+    limit: Optional[int] = None,
+    after: Optional[str] = None,
+) -> List[FetchJob]:
+    """
+    Retrieve all jobs from the collection, or a page of at most limit jobs created after
+    the job with the ID after.
+    If fields are given, only those (plus the required job fields) are loaded.
+    Listings of the default collection are cached until the next job write, so polling
+    clients do not scan the collection on every request.
+    """
+    projection = _build_projection(fields)
+    if collection is not None:
+        return list(iter_jobs(collection, projection, limit, after))
+
+    cache_key = ResponseCache.make_key(
+        repr(sorted(projection)) if projection else "", repr(limit), after or ""
+    )
+    documents = _jobs_cache.get(cache_key)
+    if documents is None:
+        documents = list(_iter_job_documents(None, projection, limit, after))
+        _jobs_cache.set(cache_key, documents)
+    # Each call converts the cached documents into new job objects
+    return [convert_strings_to_enums(doc) for doc in documents]
+
+
 def delete_job(job_id: str, collection: Optional[Collection] = None) -> bool:
     """
     Delete a job by ID.
     """
-    _validate_job_id(job_id)
-    db_collection = collection or _get_or_create_collection()
+    object_id = _validate_job_id(job_id)
+    db_collection = _resolve_collection(collection)
 
     try:
-        result: DeleteResult = db_collection.delete_one({"_id": ObjectId(job_id)})
+        result: DeleteResult = db_collection.delete_one({"_id": object_id})
+        _jobs_cache.clear()
         if result.deleted_count > 0:
             logger.info(f"Deleted job with ID {job_id}")
         else:
@@ -124,12 +288,15 @@ def delete_job(job_id: str, collection: Optional[Collection] = None) -> bool:
         raise RuntimeError(f"Job deletion failed: {e}") from e
 
 
-def _is_valid_object_id(object_id: str) -> bool:
-    """Check if string is a valid MongoDB ObjectId."""
-    return ObjectId.is_valid(object_id)
+@lru_cache(maxsize=4096)
+def _to_object_id(object_id: str) -> Optional[ObjectId]:
+    """Parse a string into a MongoDB ObjectId, or None if it is not valid."""
+    return ObjectId(object_id) if ObjectId.is_valid(object_id) else None
 
 
-def _validate_job_id(job_id: str) -> None:
-    """Validate job ID format before database operations."""
-    if not _is_valid_object_id(job_id):
+def _validate_job_id(job_id: str) -> ObjectId:
+    """Validate job ID format before database operations and return its ObjectId."""
+    object_id = _to_object_id(job_id)
+    if object_id is None:
         raise ValueError(f"Invalid job ID format: {job_id}")
+    return object_id
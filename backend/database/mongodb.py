@@ -21,7 +21,7 @@ def get_mongo_client() -> MongoClient:
     if _client is not None:
         return _client
 
-    mongo_uri = getattr(app_configuration, "MONGO_URI", None)
+    mongo_uri = getattr(app_configuration.secrets, "MONGO_URI", None)
     if not mongo_uri:
         raise EnvironmentError("MONGO_URI is not set in the configuration.")
 
@@ -44,7 +44,7 @@ def get_database() -> Database:
     If the database does not exist, it will be created.
     """
     client = get_mongo_client()
-    db_name = getattr(app_configuration, "MONGO_DB_NAME", None)
+    db_name = getattr(app_configuration.secrets, "MONGO_DB_NAME", None)
     if not db_name:
         raise EnvironmentError("MONGO_DB_NAME is not set in the configuration.")
     return client[db_name]
@@ -1,17 +1,226 @@
 import abc
 import asyncio
-from datetime import datetime
+import re
+import time
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from functools import lru_cache, partial
 from http import HTTPStatus
-from typing import Optional, Any, Dict, Callable, List
+from operator import methodcaller
+from typing import (
+    AbstractSet,
+    Optional,
+    Any,
+    Dict,
+    Callable,
+    FrozenSet,
+    Iterable,
+    List,
+    Tuple,
+    Union,
+)
 
 import httpx
+import orjson
 from httpx import RequestError, HTTPStatusError
-from tenacity import retry, stop_after_attempt, wait_exponential, retry_if_exception
+from tenacity import (
+    RetryCallState,
+    retry,
+    retry_if_exception,
+    stop_after_attempt,
+    wait_exponential,
+)
+from tenacity.retry import retry_base
+from tenacity.wait import wait_base
 
 from backend.app.config import app_configuration
+from backend.fetchers.http_client import get_http_client, is_shared_http_client
 from backend.graphql.enums import DataType, LogLevel
 from backend.graphql.git_types import MergeRequestData, RepoData
-from backend.utils.token_pool import TokenPool
+from backend.utils.token_pool import (
+    OUTCOME_ERROR,
+    OUTCOME_INVALID,
+    OUTCOME_RATE_LIMITED,
+    OUTCOME_SUCCESS,
+    TokenPool,
+)
+
+# Error message fragments that ban a token during token rotation by default
+DEFAULT_BAN_ON_ERRORS: tuple[str, ...] = (
+    "rate limit",
+    "authentication",
+    "unauthorized",
+)
+
+# Severity order of job log levels, used to filter messages below JOB_LOG_LEVEL
+LOG_LEVEL_ORDER: Dict[LogLevel, int] = {
+    LogLevel.DEBUG: 10,
+    LogLevel.INFO: 20,
+    LogLevel.WARNING: 30,
+    LogLevel.ERROR: 40,
+    LogLevel.EXCEPTION: 50,
+}
+
+# Repository fields parsed by parse_repo_data with their data types
+REPO_FIELD_TYPES: tuple[tuple[str, DataType], ...] = (
+    ("name", DataType.STRING),
+    ("fullName", DataType.STRING),
+    ("description", DataType.STRING),
+    ("createdAt", DataType.STRING),
+    ("updatedAt", DataType.STRING),
+    ("starCount", DataType.INTEGER),
+    ("languages", DataType.LIST),
+)
+
+# Merge request fields parsed by parse_merge_requests with their data types
+MERGE_REQUEST_FIELD_TYPES: tuple[tuple[str, DataType], ...] = (
+    ("authorName", DataType.STRING),
+    ("createdAt", DataType.STRING),
+    ("description", DataType.STRING),
+    ("title", DataType.STRING),
+)
+
+
+@lru_cache(maxsize=32)
+def _compile_ban_pattern(ban_on_errors: tuple[str, ...]) -> re.Pattern:
+    """Compile error fragments into a single case-insensitive search pattern."""
+    return re.compile("|".join(map(re.escape, ban_on_errors)), re.IGNORECASE)
+
+
+@lru_cache(maxsize=512)
+def _split_path(field_path: str) -> tuple[str, ...]:
+    """Split a dotted field path into its keys once per distinct path."""
+    return tuple(field_path.split("."))
+
+
+def _extract_path(data: Any, keys: tuple[str, ...]) -> Any:
+    """Walk the given keys through nested dictionaries, fanning out over lists."""
+    for index, key in enumerate(keys):
+        if isinstance(data, list):
+            remaining = keys[index:]
+            return [_extract_path(item, remaining) for item in data]
+        if not isinstance(data, dict):
+            return None
+        data = data.get(key)
+        if data is None:
+            return None
+    return data
+
+
+# Requested fields resolved to (field, getter, data type), see _compile_fields
+FieldGetters = tuple[tuple[str, Callable[[Any], Any], DataType], ...]
+
+
+@lru_cache(maxsize=512)
+def _compile_getter(field_path: str) -> Callable[[Any], Any]:
+    """Compile a field path into a getter: a plain lookup for top-level keys, a walk otherwise."""
+    keys = _split_path(field_path)
+    if len(keys) == 1:
+        return methodcaller("get", keys[0])
+    return partial(_extract_path, keys=keys)
+
+
+@lru_cache(maxsize=256)
+def _compile_fields(
+    field_types: tuple[tuple[str, DataType], ...],
+    fields: FrozenSet[str],
+    mapping_items: tuple[tuple[str, str], ...],
+) -> FieldGetters:
+    """Resolve the requested fields into (field, getter, data type), once per field set and mapping."""
+    mapping = dict(mapping_items)
+    return tuple(
+        (name, _compile_getter(mapping.get(name, name)), data_type)
+        for name, data_type in field_types
+        if name in fields
+    )
+
+
+def _parse_retry_after(value: Optional[str]) -> Optional[float]:
+    """Parse a Retry-After header given in seconds or as an HTTP date."""
+    if not value:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        retry_at = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    if retry_at.tzinfo is None:
+        retry_at = retry_at.replace(tzinfo=timezone.utc)
+    return max(0.0, (retry_at - datetime.now(timezone.utc)).total_seconds())
+
+
+def _rate_limit_reset_at(response: httpx.Response) -> Optional[float]:
+    """
+    Unix timestamp at which the rate limit of a response resets, if the provider sent one.
+    Uses X-RateLimit-Reset (GitHub) or RateLimit-Reset (GitLab), then Retry-After.
+    """
+    for header in ("X-RateLimit-Reset", "RateLimit-Reset"):
+        value = response.headers.get(header)
+        if value:
+            try:
+                return float(value)
+            except ValueError:
+                pass
+    delay = _parse_retry_after(response.headers.get("Retry-After"))
+    return time.time() + delay if delay is not None else None
+
+
+def _rate_limit_remaining(response: httpx.Response) -> Optional[int]:
+    """
+    Number of requests left in the current rate limit window, if the provider sent it.
+    Uses X-RateLimit-Remaining (GitHub) or RateLimit-Remaining (GitLab).
+    """
+    for header in ("X-RateLimit-Remaining", "RateLimit-Remaining"):
+        value = response.headers.get(header)
+        if value:
+            try:
+                return int(value)
+            except ValueError:
+                pass
+    return None
+
+
+class wait_retry_after(wait_base):
+    """
+    Tenacity wait strategy that honors the Retry-After header of rate limited
+    (429) and unavailable (503) responses and otherwise uses the fallback strategy.
+    """
+
+    RETRY_AFTER_STATUS_CODES: frozenset[int] = frozenset(
+        {HTTPStatus.TOO_MANY_REQUESTS, HTTPStatus.SERVICE_UNAVAILABLE}
+    )
+
+    def __init__(self, fallback: wait_base):
+        self.fallback = fallback
+
+    def __call__(self, retry_state: RetryCallState) -> float:
+        exc = retry_state.outcome.exception() if retry_state.outcome else None
+        if (
+            isinstance(exc, HTTPStatusError)
+            and exc.response is not None
+            and exc.response.status_code in self.RETRY_AFTER_STATUS_CODES
+        ):
+            delay = _parse_retry_after(exc.response.headers.get("Retry-After"))
+            if delay is not None:
+                return delay
+        return self.fallback(retry_state)
+
+
+class retry_if_fetcher_error(retry_base):
+    """
+    Tenacity retry condition for decorated fetcher methods.
+    Resolves _is_retryable_error on the fetcher instance at call time, so the decorator
+    can be built once at class level and still honor subclass overrides.
+    """
+
+    def __call__(self, retry_state: RetryCallState) -> bool:
+        if retry_state.outcome is None or not retry_state.outcome.failed:
+            return False
+        fetcher = retry_state.args[0]
+        return bool(fetcher._is_retryable_error(retry_state.outcome.exception()))
 
 
 class BaseFetcher(abc.ABC):
@@ -27,37 +236,62 @@ class BaseFetcher(abc.ABC):
     BACKOFF_MAX: float = app_configuration.BACKOFF_MAX
     REQUEST_DELAY: float = app_configuration.REQUEST_DELAY
     RETRYABLE_STATUS_CODES: set[int] = {
+        HTTPStatus.TOO_MANY_REQUESTS,  # 429
         HTTPStatus.INTERNAL_SERVER_ERROR,  # 500
         HTTPStatus.BAD_GATEWAY,  # 502
         HTTPStatus.SERVICE_UNAVAILABLE,  # 503
         HTTPStatus.GATEWAY_TIMEOUT,  # 504
     }
     USER_AGENT: str = app_configuration.USER_AGENT
+    JOB_LOG_LEVEL: LogLevel = LogLevel[app_configuration.JOB_LOG_LEVEL.upper()]
     MERGE_REQUESTS_FIELD_MAPPING: Dict[str, str] = {}
 
     def __init__(self):
-        self.client: httpx.AsyncClient = httpx.AsyncClient(
-            timeout=self.DEFAULT_TIMEOUT, headers={"User-Agent": self.USER_AGENT}
-        )
+        self.client: httpx.AsyncClient = get_http_client()
 
     async def close(self) -> None:
-        """Closes the persistent HTTP client."""
-        await self.client.aclose()
+        """
+        Closes the HTTP client if it is owned by this fetcher.
+        The shared client stays open and is closed on application shutdown.
+        """
+        if not is_shared_http_client(self.client):
+            await self.client.aclose()
+
+    def _with_user_agent(
+        self, headers: Optional[Dict[str, str]] = None
+    ) -> Dict[str, str]:
+        """Returns the request headers with the fetcher's User-Agent added."""
+        return {"User-Agent": self.USER_AGENT, **(headers or {})}
 
     def _log(
         self,
         level: LogLevel,
-        message: str,
+        message: Union[str, Callable[[], str]],
         job_logger: Optional[Callable[[str], None]] = None,
     ) -> None:
         """
         Central logging method that appends logs with timestamp and level to the job log.
-        Logs are stored in the job log.
+        Logs are stored in the job log; without a job logger or below JOB_LOG_LEVEL
+        nothing is formatted. Expensive messages can be passed as a callable that is
+        only called if the message is logged.
+        """
+        if not self._log_enabled(level, job_logger):
+            return
+        if callable(message):
+            message = message()
+        job_logger(f"{datetime.now().isoformat()} - {level.name} - {message}")
+
+    def _log_enabled(
+        self, level: LogLevel, job_logger: Optional[Callable[[str], None]] = None
+    ) -> bool:
         """
-        timestamp = datetime.now().isoformat()
-        formatted_message = f"{timestamp} - {level.name} - {message}"
-        if job_logger:
-            job_logger(formatted_message)
+        Checks whether a message of the given level would be logged.
+        Lets callers skip building expensive log messages.
+        """
+        return (
+            job_logger is not None
+            and LOG_LEVEL_ORDER[level] >= LOG_LEVEL_ORDER[self.JOB_LOG_LEVEL]
+        )
 
     def _log_progress(
         self,
@@ -65,38 +299,35 @@ class BaseFetcher(abc.ABC):
         total: int,
         stage: str,
         job_logger: Optional[Callable[[str], None]] = None,
-        last_logged_percent: Optional[dict] = None,
+        last_logged_percent: Optional[List[int]] = None,
     ) -> None:
         """
         Logs the progress of a specific stage (e.g. fetching or processing).
         Only logs at new 10% increments or on completion.
+        last_logged_percent is a single-element list holding the last logged step.
         """
         if total <= 0:
             return  # Avoid division by zero
 
-        progress = min((current / total) * 100, 100)
-        rounded = int(progress // 10) * 10
+        # Integer math only: completed 10%-steps and the percentage to display
+        current = min(current, total)
+        rounded = current * 10 // total * 10
+        percent = (current * 200 + total) // (total * 2)
 
         # Log at every new 10%-step and always at 100%
-        should_log = False
+        should_log = True
         if last_logged_percent is not None:
-            last = last_logged_percent.get("value", -1)
-            if rounded > last:
-                should_log = True
-            # Always log at 100% if not already logged
-            if current == total and rounded != last:
-                should_log = True
-        else:
-            should_log = True
+            last = last_logged_percent[0]
+            should_log = rounded > last or (current == total and rounded != last)
 
         if should_log:
             self._log(
                 LogLevel.INFO,
-                f"{stage} progress: {progress:.0f}% ({min(current, total)}/{total}) completed.",
+                f"{stage} progress: {percent}% ({current}/{total}) completed.",
                 job_logger,
             )
             if last_logged_percent is not None:
-                last_logged_percent["value"] = rounded
+                last_logged_percent[0] = rounded
 
     @staticmethod
     def _is_retryable_error(exc: BaseException) -> bool:
@@ -112,6 +343,44 @@ class BaseFetcher(abc.ABC):
             )
         return False
 
+    @retry(
+        stop=stop_after_attempt(DEFAULT_RETRY_ATTEMPTS),
+        wait=wait_retry_after(
+            wait_exponential(
+                multiplier=RETRY_WAIT_MULTIPLIER, min=BACKOFF_MIN, max=BACKOFF_MAX
+            )
+        ),
+        retry=retry_if_exception(_is_retryable_error),
+        reraise=True,
+    )
+    async def _request_with_retry(
+        self,
+        method: str,
+        url: str,
+        params: Optional[Dict[str, Any]] = None,
+        data: Optional[Dict[str, Any]] = None,
+        headers: Optional[Dict[str, str]] = None,
+        auth: Optional[tuple] = None,
+        job_logger: Optional[Callable[[str], None]] = None,
+    ) -> httpx.Response:
+        """
+        Sends a single HTTP request attempt. Retries are handled by the class-level decorator.
+        """
+        try:
+            response = await self.client.request(
+                method=method,
+                url=url,
+                params=params,
+                data=data,
+                headers=self._with_user_agent(headers),
+                auth=auth,
+            )
+            self._check_response_status(response)
+            return response
+        except Exception as e:
+            self._log(LogLevel.ERROR, f"HTTP request failed: {e}", job_logger)
+            raise
+
     async def _send_request(
         self,
         method: str,
@@ -129,34 +398,10 @@ class BaseFetcher(abc.ABC):
             LogLevel.DEBUG, f"Sending {method.upper()} request to {url}", job_logger
         )
 
-        @retry(
-            stop=stop_after_attempt(self.DEFAULT_RETRY_ATTEMPTS),
-            wait=wait_exponential(
-                multiplier=self.RETRY_WAIT_MULTIPLIER,
-                min=self.BACKOFF_MIN,
-                max=self.BACKOFF_MAX,
-            ),
-            retry=retry_if_exception(self._is_retryable_error),
-            reraise=True,
-        )
-        async def _request_with_retry():
-            try:
-                response = await self.client.request(
-                    method=method,
-                    url=url,
-                    params=params,
-                    data=data,
-                    headers=headers,
-                    auth=auth,
-                )
-                self._check_response_status(response)
-                return response
-            except Exception as e:
-                self._log(LogLevel.ERROR, f"HTTP request failed: {e}", job_logger)
-                raise
-
         try:
-            return await _request_with_retry()
+            return await self._request_with_retry(
+                method, url, params, data, headers, auth, job_logger
+            )
         except Exception as e:
             self._log(
                 LogLevel.EXCEPTION,
@@ -165,6 +410,14 @@ class BaseFetcher(abc.ABC):
             )
             raise
 
+    @staticmethod
+    def _preview_body(response: httpx.Response, limit: int) -> str:
+        """
+        Returns the start of the response body for error messages.
+        Only the truncated bytes are decoded, not the whole (possibly large) body.
+        """
+        return response.content[:limit].decode("utf-8", errors="replace")
+
     def _check_response_status(self, response: httpx.Response) -> None:
         """
         Validates HTTP response status.
@@ -174,7 +427,7 @@ class BaseFetcher(abc.ABC):
             error_msg = (
                 f"HTTP Error {response.status_code}\n"
                 f"URL: {response.url}\n"
-                f"Response: {response.text[:500]}..."  # Truncate long responses
+                f"Response: {self._preview_body(response, 500)}..."
             )
             self._log(LogLevel.ERROR, error_msg)
             raise HTTPStatusError(
@@ -204,38 +457,28 @@ class BaseFetcher(abc.ABC):
     ) -> Dict[str, Any]:
         """Ensure valid response structure and handle edge cases."""
         try:
-            data = response.json()
+            data = orjson.loads(response.content)
             if not isinstance(data, dict):
                 raise ValueError("Unexpected response format")
             return data
         except Exception:
             if job_logger:
-                job_logger(f"Invalid JSON response: {response.text[:200]}")
+                job_logger(
+                    f"Invalid JSON response: {BaseFetcher._preview_body(response, 200)}"
+                )
             raise
 
     def _extract_nested_field(self, data: Dict[str, Any], field_path: str) -> Any:
         """
         Extracts a nested field from a dictionary based on a field path.
         """
-        keys = field_path.split(".")
-        for key in keys:
-            if isinstance(data, list):
-                return [
-                    self._extract_nested_field(item, ".".join(keys[1:]))
-                    for item in data
-                ]
-            if not isinstance(data, dict):
-                return None
-            data = data.get(key)
-            if data is None:
-                return None
-        return data
+        return _extract_path(data, _split_path(field_path))
 
     def parse_field(
         self,
         data: Dict[str, Any],
         field_name: str,
-        requested_fields: List[str],
+        requested_fields: AbstractSet[str],
         data_type: DataType,
         mapping: Optional[Dict[str, str]] = None,
     ) -> Any:
@@ -246,7 +489,15 @@ class BaseFetcher(abc.ABC):
             return None
 
         actual_key = mapping.get(field_name, field_name) if mapping else field_name
-        value = self._extract_nested_field(data, actual_key)
+        return self._parse_value(data, actual_key, data_type)
+
+    def _parse_value(
+        self, data: Dict[str, Any], field_path: str, data_type: DataType
+    ) -> Any:
+        """
+        Extracts the value at the field path, falling back to the default of its data type.
+        """
+        value = self._extract_nested_field(data, field_path)
 
         if value is None:
             return self._get_default_value(data_type)
@@ -267,26 +518,55 @@ class BaseFetcher(abc.ABC):
         }
         return defaults.get(data_type, None)
 
+    @staticmethod
+    def compile_repo_fields(
+        fields: Iterable[str], field_mapping: Optional[Dict[str, str]]
+    ) -> FieldGetters:
+        """Compile the requested repository fields into getters for parse_repo_data."""
+        return _compile_fields(
+            REPO_FIELD_TYPES,
+            frozenset(fields),
+            tuple(field_mapping.items()) if field_mapping else (),
+        )
+
+    @staticmethod
+    def compile_merge_request_fields(
+        fields: Iterable[str], field_mapping: Optional[Dict[str, str]]
+    ) -> FieldGetters:
+        """Compile the requested "mergeRequests." fields into getters for parse_merge_requests."""
+        return _compile_fields(
+            MERGE_REQUEST_FIELD_TYPES,
+            frozenset(
+                field.split(".", 1)[1]
+                for field in fields
+                if field.startswith("mergeRequests.")
+            ),
+            tuple(field_mapping.items()) if field_mapping else (),
+        )
+
     def parse_repo_data(
         self,
         data: Dict[str, Any],
-        fields: List[str],
+        fields: Iterable[str],
         field_mapping: Dict[str, str],
         merge_requests: List[MergeRequestData],
+        getters: Optional[FieldGetters] = None,
     ) -> RepoData:
         """
         Parses repository data into a RepoData based on the field mapping and requested fields.
+        Callers parsing many nodes can pass the getters from compile_repo_fields.
         """
-        repo_data = {
-            key: self.parse_field(data, key, fields, DataType.STRING, field_mapping)
-            for key in ["name", "fullName", "description", "createdAt", "updatedAt"]
-        }
-        repo_data["starCount"] = self.parse_field(
-            data, "starCount", fields, DataType.INTEGER, field_mapping
-        )
-        repo_data["languages"] = self.parse_field(
-            data, "languages", fields, DataType.LIST, field_mapping
-        )
+        if getters is None:
+            getters = self.compile_repo_fields(fields, field_mapping)
+        # Only requested fields are parsed; the others keep the RepoData default (None)
+        repo_data = {}
+        for name, getter, data_type in getters:
+            value = getter(data)
+            if value is None:
+                value = self._get_default_value(data_type)
+            elif data_type == DataType.LIST and not isinstance(value, list):
+                value = [value]
+            repo_data[name] = value
 
         return RepoData(**repo_data, mergeRequests=merge_requests)
 
@@ -295,48 +575,57 @@ class BaseFetcher(abc.ABC):
         data: List[Dict[str, Any]],
         fields: List[str],
         field_mapping: Dict[str, str],
+        getters: Optional[FieldGetters] = None,
     ) -> List[MergeRequestData]:
         """
         Parses merge request data into a list of MergeRequestData based on field mapping and requested fields.
+        Callers parsing many repositories can pass the getters from compile_merge_request_fields.
         """
         if not data:
             return []
 
-        merge_request_fields = [
-            field.split(".", 1)[1]
-            for field in fields
-            if field.startswith("mergeRequests.")
-        ]
-        return [
-            MergeRequestData(
-                authorName=self.parse_field(
-                    mr,
-                    "authorName",
-                    merge_request_fields,
-                    DataType.STRING,
-                    field_mapping,
-                ),
-                createdAt=self.parse_field(
-                    mr,
-                    "createdAt",
-                    merge_request_fields,
-                    DataType.STRING,
-                    field_mapping,
-                ),
-                description=self.parse_field(
-                    mr,
-                    "description",
-                    merge_request_fields,
-                    DataType.STRING,
-                    field_mapping,
-                ),
-                title=self.parse_field(
-                    mr, "title", merge_request_fields, DataType.STRING, field_mapping
-                ),
-            )
-            for mr in data
+        if getters is None:
+            getters = self.compile_merge_request_fields(fields, field_mapping)
+        # Resolve the defaults once; unrequested fields stay None per row
+        field_specs = [
+            (name, getter, self._get_default_value(data_type))
+            for name, getter, data_type in getters
         ]
 
+        merge_requests = []
+        for mr in data:
+            values = {}
+            for name, getter, default in field_specs:
+                value = getter(mr)
+                values[name] = default if value is None else value
+            merge_requests.append(MergeRequestData(**values))
+        return merge_requests
+
+    @staticmethod
+    def _classify_token_error(
+        exc: Exception, ban_pattern: re.Pattern
+    ) -> Tuple[str, Optional[float]]:
+        """
+        Map a failed request to a token outcome and the rate limit reset timestamp.
+        HTTP status codes are checked first; error messages matching the ban pattern
+        (e.g. GraphQL errors returned with status 200) count as rate limited.
+        """
+        if isinstance(exc, HTTPStatusError) and exc.response is not None:
+            status = exc.response.status_code
+            reset_at = _rate_limit_reset_at(exc.response)
+            if status == HTTPStatus.TOO_MANY_REQUESTS:
+                return OUTCOME_RATE_LIMITED, reset_at
+            if status == HTTPStatus.FORBIDDEN and (
+                exc.response.headers.get("X-RateLimit-Remaining") == "0"
+                or "Retry-After" in exc.response.headers
+            ):
+                return OUTCOME_RATE_LIMITED, reset_at
+            if status in (HTTPStatus.UNAUTHORIZED, HTTPStatus.FORBIDDEN):
+                return OUTCOME_INVALID, None
+        if ban_pattern.search(str(exc)) is not None:
+            return OUTCOME_RATE_LIMITED, None
+        return OUTCOME_ERROR, None
+
     async def _request_with_token_rotation(
         self,
         token_pool: TokenPool,
@@ -349,33 +638,29 @@ class BaseFetcher(abc.ABC):
         Handles token rotation and banning.
         """
         last_exception = None
-        tokens_to_try = list(token_pool.tokens)
-        ban_on_errors = ban_on_errors or [
-            "rate limit",
-            "authentication",
-            "unauthorized",
-        ]
-        max_attempts = max_attempts or len(tokens_to_try)
+        ban_pattern = _compile_ban_pattern(
+            tuple(ban_on_errors or DEFAULT_BAN_ON_ERRORS)
+        )
+        max_attempts = max_attempts or len(token_pool.tokens)
 
         for _ in range(max_attempts):
-            token = token_pool.get_token()
+            token = await token_pool.acquire()
             if not token:
                 raise RuntimeError(
                     "No tokens available for requests (all are exhausted)."
                 )
 
             try:
-                return await make_request_fn(token)
+                result = await make_request_fn(token)
             except Exception as e:
-                error_str = str(e).lower()
-                should_ban = any(err in error_str for err in ban_on_errors)
-                if should_ban:
+                outcome, reset_at = self._classify_token_error(e, ban_pattern)
+                token_pool.observe(token, outcome, reset_at=reset_at)
+                if outcome != OUTCOME_ERROR:
                     self._log(
                         LogLevel.WARNING,
                         f"Token banned due to error: {e} | Token: {token}",
                         job_logger,
                     )
-                    token_pool.ban_token(token)
                 else:
                     self._log(
                         LogLevel.WARNING,
@@ -384,5 +669,7 @@ class BaseFetcher(abc.ABC):
                     )
                 last_exception = e
                 continue
+            token_pool.observe(token, OUTCOME_SUCCESS)
+            return result
 
         raise RuntimeError(f"All tokens failed. Last error: {last_exception}")
@@ -3,16 +3,124 @@ import asyncio
 import re
 import textwrap
 import time
-from typing import Optional, Dict, Any, List, Callable, Set
+from functools import lru_cache
+from http import HTTPStatus
+from typing import (
+    AbstractSet,
+    AsyncIterator,
+    Optional,
+    Dict,
+    Any,
+    List,
+    Callable,
+    FrozenSet,
+    Iterable,
+    Sequence,
+    Tuple,
+    Union,
+)
 
-from tenacity import stop_after_attempt, wait_exponential, retry_if_exception, retry
+import orjson
+from httpx import HTTPStatusError
+from tenacity import stop_after_attempt, wait_exponential, retry
 
 from backend.app.config import app_configuration
-from backend.fetchers.base_fetcher import BaseFetcher
+from backend.fetchers.base_fetcher import (
+    BaseFetcher,
+    DEFAULT_BAN_ON_ERRORS,
+    FieldGetters,
+    _rate_limit_remaining,
+    _rate_limit_reset_at,
+    retry_if_fetcher_error,
+    wait_retry_after,
+)
 from backend.graphql.enums import LogLevel
 from backend.graphql.git_types import FetcherSettingsInput, RepoData
+from backend.utils.response_cache import ResponseCache
 from backend.utils.token_pool import TokenPool
 
+# Braces and line breaks that delimit the lines of a formatted query
+_QUERY_TOKENS = re.compile(r"([{}\n\r])")
+
+# Leading root field of a single-field query selection, e.g. "search(" or "projects {"
+_ROOT_FIELD = re.compile(r"^\s*(?:query\s*)?\{\s*(\w+)", re.DOTALL)
+
+# Responses of identical queries shared by all fetchers, used when a job enables caching
+_response_cache = ResponseCache(
+    ttl=app_configuration.RESPONSE_CACHE_TTL,
+    maxsize=app_configuration.RESPONSE_CACHE_SIZE,
+)
+
+# Marks the per-page values when a query template is split into its fixed parts
+QUERY_PART_SEPARATOR = "\0"
+
+
+@lru_cache(maxsize=256)
+def _map_fields_cached(
+    fields: Tuple[str, ...], mapping_items: FrozenSet[Tuple[str, str]]
+) -> Tuple[str, ...]:
+    """Map fields to their query selections, cached per field set and mapping."""
+    mapping = dict(mapping_items)
+    mapped_fields = []
+    for field_name in fields:
+        if field_name in mapping:
+            mapped_field = mapping[field_name]
+            if "." in mapped_field:
+                top_level, nested = mapped_field.split(".", 1)
+                mapped_fields.append(f"{top_level} {{ {nested} }}")
+            else:
+                mapped_fields.append(mapped_field)
+    return tuple(mapped_fields)
+
+
+@lru_cache(maxsize=256)
+def _build_merge_requests_query_cached(
+    subfields: Tuple[str, ...],
+    max_mrs: int,
+    mapping_items: FrozenSet[Tuple[str, str]],
+    mr_node_name: str,
+) -> str:
+    """Build the merge requests part of the query, cached per unique input."""
+    fields_str = " ".join(_map_fields_cached(subfields, mapping_items))
+    query = f"""
+    {mr_node_name}(first: {max_mrs}) {{
+        nodes {{
+            {fields_str}
+        }}
+    }}
+    """
+    return textwrap.dedent(query).strip()
+
+
+@lru_cache(maxsize=256)
+def _merge_request_fields(fields: FrozenSet[str]) -> FrozenSet[str]:
+    """Return the requested "mergeRequests." fields, cached per field set."""
+    return frozenset(f for f in fields if f.startswith("mergeRequests."))
+
+
+@lru_cache(maxsize=256)
+def _build_selection_cached(
+    fields: Tuple[str, ...],
+    max_mrs: int,
+    field_mapping_items: FrozenSet[Tuple[str, str]],
+    mr_mapping_items: FrozenSet[Tuple[str, str]],
+    mr_node_name: str,
+) -> str:
+    """Build the field selection of a repository node, cached per field set and settings."""
+    normal_fields = tuple(f for f in fields if not f.startswith("mergeRequests."))
+    merge_requests_subfields = tuple(
+        f.split(".", 1)[1] for f in fields if f.startswith("mergeRequests.")
+    )
+
+    selected_fields_parts = list(_map_fields_cached(normal_fields, field_mapping_items))
+    if merge_requests_subfields:
+        selected_fields_parts.append(
+            _build_merge_requests_query_cached(
+                merge_requests_subfields, max_mrs, mr_mapping_items, mr_node_name
+            )
+        )
+    return "\n".join(selected_fields_parts)
+
 
 class BaseGraphQLFetcher(BaseFetcher, abc.ABC):
     """
@@ -25,14 +133,13 @@ class BaseGraphQLFetcher(BaseFetcher, abc.ABC):
     RETRY_WAIT_MULTIPLIER: float = app_configuration.BACKOFF_FACTOR
     BACKOFF_MIN: float = app_configuration.BACKOFF_MIN
     BACKOFF_MAX: float = app_configuration.BACKOFF_MAX
+    BATCH_SIZE: int = 25  # Maximum number of queries merged into one request
 
     def __init__(self, token_pool: TokenPool, *args, **kwargs):
         super().__init__(*args, **kwargs)
         self.token_pool = token_pool
-
-    async def close(self) -> None:
-        """Closes the persistent HTTP client."""
-        await self.client.aclose()
+        # Request headers per token, see _token_headers
+        self._headers_by_token: Dict[str, Dict[str, str]] = {}
 
     @abc.abstractmethod
     def build_query(
@@ -41,6 +148,79 @@ class BaseGraphQLFetcher(BaseFetcher, abc.ABC):
         """Build the GraphQL query based on provided settings and fields."""
         pass
 
+    @staticmethod
+    def _is_retryable_error(exc: BaseException) -> bool:
+        """
+        Determines if an exception should trigger a retry.
+        Rate limited (429) responses are not retried: token rotation bans the token until
+        its reset and continues with the next token instead of waiting for Retry-After.
+        """
+        if (
+            isinstance(exc, HTTPStatusError)
+            and exc.response is not None
+            and exc.response.status_code == HTTPStatus.TOO_MANY_REQUESTS
+        ):
+            return False
+        return BaseFetcher._is_retryable_error(exc)
+
+    @retry(
+        stop=stop_after_attempt(DEFAULT_RETRY_ATTEMPTS),
+        wait=wait_retry_after(
+            wait_exponential(
+                multiplier=RETRY_WAIT_MULTIPLIER, min=BACKOFF_MIN, max=BACKOFF_MAX
+            )
+        ),
+        retry=retry_if_fetcher_error(),
+        reraise=True,
+    )
+    async def _do_graphql_post(
+        self,
+        base_url: str,
+        content: bytes,
+        headers: Dict[str, str],
+        timeout: Optional[float] = None,
+        job_logger: Optional[Callable[[str], None]] = None,
+        token: Optional[str] = None,
+    ) -> Dict[str, Any]:
+        """
+        Sends the serialized query with the given headers, retrying transient errors.
+        Paces the token by the rate limit headers of the response.
+        Raises a RuntimeError if the API returns GraphQL errors.
+        """
+        # Send request and log duration
+        start_time = time.perf_counter()
+        response = await self.client.post(
+            base_url,
+            content=content,
+            headers=headers,
+            timeout=timeout or self.DEFAULT_TIMEOUT,
+        )
+        if self._log_enabled(LogLevel.DEBUG, job_logger):
+            duration = time.perf_counter() - start_time
+            self._log(
+                LogLevel.DEBUG,
+                f"Request to {base_url} completed in {duration:.2f}s",
+                job_logger,
+            )
+
+        # Check response and handle errors
+        response.raise_for_status()
+        if token:
+            self.token_pool.update_rate_limit(
+                token, _rate_limit_remaining(response), _rate_limit_reset_at(response)
+            )
+        data = orjson.loads(response.content)
+
+        if "errors" in data:
+            error_details = "\n".join([str(err) for err in data["errors"]])
+            self._log(
+                LogLevel.ERROR,
+                f"GraphQL API returned errors:\n{error_details}",
+                job_logger,
+            )
+            raise RuntimeError(error_details)
+        return data
+
     async def _make_request(
         self,
         base_url: str,
@@ -48,109 +228,160 @@ class BaseGraphQLFetcher(BaseFetcher, abc.ABC):
         extra_headers: Optional[Dict[str, str]] = None,
         timeout: Optional[float] = None,
         job_logger: Optional[Callable[[str], None]] = None,
+        use_cache: bool = False,
     ) -> Dict[str, Any]:
         """
         Sends a request to the GraphQL API with the specified query and headers.
         Rotates tokens on failure and handles rate limits and cooldowns.
+        With use_cache, a cached response of the same query is returned if available.
         """
+        if use_cache:
+            cache_key = ResponseCache.make_key(base_url, query)
+            cached = _response_cache.get(cache_key)
+            if cached is not None:
+                self._log(LogLevel.DEBUG, "Using cached response.", job_logger)
+                return cached
+
+        # The body does not change between retries and tokens, so encode it once
+        content = orjson.dumps({"query": query})
 
         async def make_request(token: str):
-            @retry(
-                stop=stop_after_attempt(self.DEFAULT_RETRY_ATTEMPTS),
-                wait=wait_exponential(
-                    multiplier=self.RETRY_WAIT_MULTIPLIER,
-                    min=self.BACKOFF_MIN,
-                    max=self.BACKOFF_MAX,
-                ),
-                retry=retry_if_exception(self._is_retryable_error),
-                reraise=True,
+            headers = self._token_headers(token)
+            if extra_headers:
+                headers = {**headers, **extra_headers}
+            return await self._do_graphql_post(
+                base_url, content, headers, timeout, job_logger, token
             )
-            async def _request_with_retry():
-                # Prepare headers
-                headers = {
+
+        # Token rotation and retry logic
+        response = await self._request_with_token_rotation(
+            self.token_pool,
+            make_request,
+            job_logger=job_logger,
+            ban_on_errors=list(DEFAULT_BAN_ON_ERRORS),
+        )
+        if use_cache:
+            _response_cache.set(cache_key, response)
+        return response
+
+    def _token_headers(self, token: str) -> Dict[str, str]:
+        """Return the request headers for a token, built once per token and reused for every request."""
+        headers = self._headers_by_token.get(token)
+        if headers is None:
+            headers = self._headers_by_token[token] = self._with_user_agent(
+                {
                     "Authorization": f"Bearer {token}",
                     "Content-Type": "application/json",
                 }
-                if extra_headers:
-                    headers.update(extra_headers)
-
-                # Send request and log duration
-                start_time = time.time()
-                response = await self.client.post(
-                    base_url,
-                    json={"query": query},
-                    headers=headers,
-                    timeout=timeout or self.DEFAULT_TIMEOUT,
-                )
-                duration = time.time() - start_time
-                self._log(
-                    LogLevel.DEBUG,
-                    f"Request to {base_url} completed in {duration:.2f}s",
-                    job_logger,
-                )
+            )
+        return headers
 
-                # Check response and handle errors
-                response.raise_for_status()
-                data = response.json()
+    async def batch_query(
+        self,
+        base_url: str,
+        queries: List[str],
+        job_logger: Optional[Callable[[str], None]] = None,
+        use_cache: Union[bool, Sequence[bool]] = False,
+    ) -> List[Dict[str, Any]]:
+        """
+        Sends multiple single-root-field queries as aliased fields of one document per batch.
+        Returns one response per query, shaped as if the query had been sent on its own.
+        use_cache is a flag for all queries or one flag per query. Responses are cached per
+        query under the same key as a request of that query alone, so a batch only sends
+        the queries without a cached response.
+        """
+        if not queries:
+            return []
+        if isinstance(use_cache, bool):
+            use_cache = [use_cache] * len(queries)
 
-                if "errors" in data:
-                    error_details = "\n".join([str(err) for err in data["errors"]])
-                    self._log(
-                        LogLevel.ERROR,
-                        f"GraphQL API returned errors:\n{error_details}",
-                        job_logger,
-                    )
-                    raise RuntimeError(error_details)
-                return data
+        responses: List[Optional[Dict[str, Any]]] = [None] * len(queries)
+        cache_keys: Dict[int, str] = {}
+        root_fields = []
+        selections = []
+        for index, query in enumerate(queries):
+            match = _ROOT_FIELD.match(query)
+            if not match:
+                raise ValueError(f"Cannot batch query without a root field: {query}")
+            root_fields.append(match.group(1))
+            if use_cache[index]:
+                cache_key = ResponseCache.make_key(base_url, query)
+                responses[index] = _response_cache.get(cache_key)
+                if responses[index] is not None:
+                    continue
+                cache_keys[index] = cache_key
+            # Alias the root field and keep the rest of the selection as is
+            body = query[match.start(1) : query.rindex("}")]
+            selections.append((index, f"q{index}: {body}"))
 
-            return await _request_with_retry()
+        if len(selections) < len(queries):
+            self._log(
+                LogLevel.DEBUG,
+                f"Using {len(queries) - len(selections)} cached responses.",
+                job_logger,
+            )
 
-        # Token rotation and retry logic
-        return await self._request_with_token_rotation(
-            self.token_pool,
-            make_request,
-            job_logger=job_logger,
-            ban_on_errors=["rate limit", "authentication", "unauthorized"],
-        )
+        for start in range(0, len(selections), self.BATCH_SIZE):
+            batch = selections[start : start + self.BATCH_SIZE]
+            self._log(
+                LogLevel.DEBUG,
+                f"Sending {len(batch)} queries in one batched request.",
+                job_logger,
+            )
+            response = await self._make_request(
+                base_url,
+                "{\n" + "\n".join(selection for _, selection in batch) + "\n}",
+                job_logger=job_logger,
+            )
+            data = response.get("data") or {}
+            for index, _ in batch:
+                result = data.get(f"q{index}")
+                responses[index] = {"data": {root_fields[index]: result}}
+                if index in cache_keys and result is not None:
+                    _response_cache.set(cache_keys[index], responses[index])
+        return responses
 
     @staticmethod
+    @lru_cache(maxsize=512)
     def format_graphql_query(query: str) -> str:
         """
         Formats a GraphQL query by removing unnecessary indentation and adding line breaks for readability.
+        Results are cached per query string, as the same queries are formatted repeatedly.
         """
-        # Clean up and format the query string
-        query = textwrap.dedent(query).strip()
-        query = re.sub(r"\{", "{\n", query)
-        query = re.sub(r"\}", "\n}\n", query)
-        query = re.sub(r"\n+", "\n", query)
-
         indentation_level = 0
         formatted_lines = []
+        text = ""
 
-        for line in query.splitlines():
-            stripped_line = line.strip()
-            if not stripped_line:
-                continue
-            if stripped_line.startswith("}"):
-                indentation_level = max(indentation_level - 1, 0)
-            formatted_lines.append("    " * indentation_level + stripped_line)
-            if stripped_line.endswith("{"):
+        # One pass over the text between braces and line breaks
+        for part in _QUERY_TOKENS.split(query):
+            if part == "{":
+                formatted_lines.append(
+                    "    " * indentation_level + (text + "{").strip()
+                )
                 indentation_level += 1
+            elif part == "}":
+                text = text.strip()
+                if text:
+                    formatted_lines.append("    " * indentation_level + text)
+                indentation_level = max(indentation_level - 1, 0)
+                formatted_lines.append("    " * indentation_level + "}")
+            elif part == "\n" or part == "\r":
+                text = text.strip()
+                if text:
+                    formatted_lines.append("    " * indentation_level + text)
+            else:
+                text = part
+                continue
+            text = ""
 
+        text = text.strip()
+        if text:
+            formatted_lines.append("    " * indentation_level + text)
         return "\n".join(formatted_lines)
 
     def _map_fields(self, fields: List[str], mapping: Dict[str, str]) -> List[str]:
         """Map fields using the provided mapping dictionary."""
-        mapped_fields = []
-        for field_name in fields:
-            if field_name in mapping:
-                mapped_field = mapping[field_name]
-                if "." in mapped_field:
-                    top_level, nested = mapped_field.split(".", 1)
-                    mapped_fields.append(f"{top_level} {{ {nested} }}")
-                else:
-                    mapped_fields.append(mapped_field)
-        return mapped_fields
+        return list(_map_fields_cached(tuple(fields), frozenset(mapping.items())))
 
     def _build_merge_requests_query(
         self,
@@ -160,127 +391,201 @@ class BaseGraphQLFetcher(BaseFetcher, abc.ABC):
         mr_node_name: str = "mergeRequests",
     ) -> str:
         """Build the merge requests part of the query."""
-        merge_requests_fields = self._map_fields(subfields, field_mapping)
-        fields_str = " ".join(merge_requests_fields)
-        query = f"""
-        {mr_node_name}(first: {max_mrs}) {{
-            nodes {{
-                {fields_str}
-            }}
-        }}
+        return _build_merge_requests_query_cached(
+            tuple(subfields), max_mrs, frozenset(field_mapping.items()), mr_node_name
+        )
+
+    def _build_selection(
+        self, fields: List[str], max_mrs: int, mr_node_name: str = "mergeRequests"
+    ) -> str:
         """
-        return textwrap.dedent(query).strip()
+        Build the field selection for the requested fields using the fetcher's mappings.
+        The selection is the same for every page of a job, so it is cached.
+        """
+        return _build_selection_cached(
+            tuple(fields),
+            max_mrs,
+            frozenset(self.FIELD_MAPPING.items()),
+            frozenset(self.MERGE_REQUESTS_FIELD_MAPPING.items()),
+            mr_node_name,
+        )
 
     def _parse_single_node(
         self,
         node: Dict[str, Any],
-        fields: Set[str],
+        fields: AbstractSet[str],
+        mr_fields: AbstractSet[str],
         repo_field_mapping: Dict[str, str],
         mr_field_mapping: Dict[str, str],
         mr_node_name: str = "mergeRequests",
+        repo_getters: Optional[FieldGetters] = None,
+        mr_getters: Optional[FieldGetters] = None,
     ) -> Optional[RepoData]:
-        """Parse a single repository/project node."""
+        """
+        Parse a single repository/project node.
+        mr_fields are the requested "mergeRequests." fields and the getters the compiled
+        field getters, precomputed by the caller.
+        """
         merge_requests = None
-        if any(field.startswith("mergeRequests.") for field in fields):
+        if mr_fields:
             merge_requests_data = node.get(mr_node_name, {}).get("nodes", [])
             merge_requests = self.parse_merge_requests(
                 data=merge_requests_data,
-                fields=fields,
+                fields=mr_fields,
                 field_mapping=mr_field_mapping,
+                getters=mr_getters,
             )
         return self.parse_repo_data(
             data=node,
             fields=fields,
             field_mapping=repo_field_mapping,
             merge_requests=merge_requests,
+            getters=repo_getters,
         )
 
-    async def _parse_nodes_concurrently(
+    def _parse_batch(
+        self,
+        batch: List[Dict[str, Any]],
+        fields: AbstractSet[str],
+        mr_fields: AbstractSet[str],
+        repo_field_mapping: Dict[str, str],
+        mr_field_mapping: Dict[str, str],
+        mr_node_name: str = "mergeRequests",
+    ) -> Tuple[List[RepoData], List[Tuple[Dict[str, Any], Exception]]]:
+        """
+        Parse a batch of nodes.
+        Returns the parsed repositories and the failed nodes with their exceptions.
+        """
+        # Field paths are resolved once per batch instead of once per node
+        repo_getters = self.compile_repo_fields(fields, repo_field_mapping)
+        mr_getters = self.compile_merge_request_fields(mr_fields, mr_field_mapping)
+        results: List[RepoData] = []
+        errors: List[Tuple[Dict[str, Any], Exception]] = []
+        for node in batch:
+            try:
+                repo = self._parse_single_node(
+                    node,
+                    fields,
+                    mr_fields,
+                    repo_field_mapping,
+                    mr_field_mapping,
+                    mr_node_name,
+                    repo_getters,
+                    mr_getters,
+                )
+            except Exception as e:
+                errors.append((node, e))
+                continue
+            if repo is not None:
+                results.append(repo)
+        return results, errors
+
+    def _log_parse_errors(
+        self,
+        errors: List[Tuple[Dict[str, Any], Exception]],
+        job_logger: Optional[Callable[[str], None]],
+    ) -> None:
+        """Log the nodes that could not be parsed."""
+        for node, error in errors:
+            self._log(
+                LogLevel.ERROR,
+                f"Error parsing node: {error}. Node data: {node}",
+                job_logger,
+            )
+
+    def _parse_nodes(
         self,
         nodes: List[Dict[str, Any]],
-        fields: List[str],
-        settings: FetcherSettingsInput,
+        fields: Iterable[str],
         repo_field_mapping: Dict[str, str],
         mr_field_mapping: Dict[str, str],
         mr_node_name: str = "mergeRequests",
         job_logger: Optional[Callable[[str], None]] = None,
-        executor=None,
     ) -> List[RepoData]:
-        """Parse nodes concurrently using threads or executors."""
-        parsed_data: List[RepoData] = []
-        fields_set: Set[str] = set(fields)
+        """
+        Parse a page of nodes into RepoData. Pages are parsed inline on the event loop:
+        parsing is dict walking under the GIL, so a thread pool costs more than it saves.
+        """
+        # The requested fields are the same for every node and, in the pipeline, for
+        # every page, so the merge request fields are filtered only once per field set
+        fields_set: FrozenSet[str] = frozenset(fields)
+        mr_fields = _merge_request_fields(fields_set)
         valid_nodes = [node for node in nodes if isinstance(node, dict)]
 
         if not valid_nodes:
             self._log(LogLevel.WARNING, "No valid nodes to parse.", job_logger)
-            return parsed_data
+            return []
 
-        batch_size = max(
-            5, min(20, len(valid_nodes) // max(1, (settings.repoCount // 10)))
+        results, errors = self._parse_batch(
+            valid_nodes,
+            fields_set,
+            mr_fields,
+            repo_field_mapping,
+            mr_field_mapping,
+            mr_node_name,
         )
+        self._log_parse_errors(errors, job_logger)
         self._log(
-            LogLevel.DEBUG,
-            f"Processing {len(valid_nodes)} nodes in batches of {batch_size}.",
-            job_logger,
+            LogLevel.INFO, f"Successfully parsed {len(results)} nodes.", job_logger
         )
+        return results
+
+    async def _fetch_and_parse_pipeline(
+        self,
+        pages: AsyncIterator[List[Dict[str, Any]]],
+        fields: List[str],
+        settings: FetcherSettingsInput,
+        repo_field_mapping: Dict[str, str],
+        mr_field_mapping: Dict[str, str],
+        mr_node_name: str = "mergeRequests",
+        job_logger: Optional[Callable[[str], None]] = None,
+    ) -> Tuple[List[RepoData], int]:
+        """
+        Parses fetched pages of nodes while the next pages are being fetched.
+        A producer reads pages until settings.repoCount nodes are fetched and hands them
+        to a consumer over a bounded queue; an error in either cancels the other.
+        Returns the parsed repositories and the number of fetched nodes.
+        """
+        queue: asyncio.Queue = asyncio.Queue(maxsize=2)
+        parsed_data: List[RepoData] = []
+        fetched_count = 0
+        requested_fields = frozenset(fields)
 
-        total_nodes = len(valid_nodes)
-        processed_count = 0
-        loop = asyncio.get_running_loop()
-        last_logged_percent = {"value": -1}
+        async def produce() -> None:
+            nonlocal fetched_count
+            try:
+                async for nodes in pages:
+                    nodes = nodes[: settings.repoCount - fetched_count]
+                    if nodes:
+                        fetched_count += len(nodes)
+                        await queue.put(nodes)
+                    if fetched_count >= settings.repoCount:
+                        break
+            finally:
+                await pages.aclose()
+            await queue.put(None)
 
-        for i in range(0, total_nodes, batch_size):
-            batch = valid_nodes[i : i + batch_size]
-            self._log(
-                LogLevel.DEBUG,
-                f"Processing batch {i // batch_size + 1} with {len(batch)} nodes.",
-                job_logger,
-            )
-            if executor:
-                tasks = [
-                    loop.run_in_executor(
-                        executor,
-                        self._parse_single_node,
-                        node,
-                        fields_set,
-                        repo_field_mapping,
-                        mr_field_mapping,
-                        mr_node_name,
+        async def consume() -> None:
+            while (nodes := await queue.get()) is not None:
+                parsed_data.extend(
+                    self._parse_nodes(
+                        nodes,
+                        requested_fields,
+                        repo_field_mapping=repo_field_mapping,
+                        mr_field_mapping=mr_field_mapping,
+                        mr_node_name=mr_node_name,
+                        job_logger=job_logger,
                     )
-                    for node in batch
-                ]
-            else:
-                tasks = [
-                    asyncio.to_thread(
-                        self._parse_single_node,
-                        node,
-                        fields_set,
-                        repo_field_mapping,
-                        mr_field_mapping,
-                        mr_node_name,
-                    )
-                    for node in batch
-                ]
-            results = await asyncio.gather(*tasks, return_exceptions=True)
-            for idx, result in enumerate(results):
-                if isinstance(result, Exception):
-                    self._log(
-                        LogLevel.ERROR,
-                        f"Error parsing node: {result}. Node data: {batch[idx]}",
-                        job_logger,
-                    )
-                elif result is not None:
-                    parsed_data.append(result)
-            processed_count += len(batch)
-            self._log_progress(
-                processed_count,
-                total_nodes,
-                "Processing",
-                job_logger,
-                last_logged_percent,
-            )
+                )
 
-        self._log(
-            LogLevel.INFO, f"Successfully parsed {len(parsed_data)} nodes.", job_logger
-        )
-        return parsed_data
+        tasks = {asyncio.create_task(produce()), asyncio.create_task(consume())}
+        try:
+            done, _ = await asyncio.wait(tasks, return_when=asyncio.FIRST_EXCEPTION)
+        finally:
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+        for task in done:
+            if task.exception() is not None:
+                raise task.exception()
+        return parsed_data, fetched_count
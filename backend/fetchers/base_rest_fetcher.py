@@ -1,13 +1,21 @@
 import asyncio
 import time
-from typing import Optional, List, Dict, Any, Callable, TypedDict
+from http import HTTPStatus
+from typing import Optional, List, Dict, Any, Awaitable, Callable, Tuple, TypedDict
+from urllib.parse import quote, urlencode
 
 import httpx
-from tenacity import retry, stop_after_attempt, wait_exponential, retry_if_exception
+import orjson
+from tenacity import retry, stop_after_attempt, wait_exponential
 
 from backend.app.config import app_configuration
-from backend.fetchers.base_fetcher import BaseFetcher
+from backend.fetchers.base_fetcher import (
+    BaseFetcher,
+    retry_if_fetcher_error,
+    wait_retry_after,
+)
 from backend.graphql.enums import LogLevel
+from backend.utils.token_bucket import TokenBucket
 
 
 class PaginatedResponse(TypedDict):
@@ -28,15 +36,31 @@ class BaseRestFetcher(BaseFetcher):
     RETRY_WAIT_MULTIPLIER: float = app_configuration.BACKOFF_FACTOR
     BACKOFF_MIN: float = app_configuration.BACKOFF_MIN
     BACKOFF_MAX: float = app_configuration.BACKOFF_MAX
-
-    @retry(
+    RATE_LIMIT_RATE: float = app_configuration.RATE_LIMIT_RATE
+    RATE_LIMIT_BURST: int = app_configuration.RATE_LIMIT_BURST
+    MAX_CONCURRENT_REQUESTS: int = app_configuration.MAX_CONCURRENT_REQUESTS
+    RESULTS_KEY: str = app_configuration.RESULTS_KEY
+    LINK_HEADER: bool = app_configuration.LINK_HEADER
+
+    # Retry policy shared by the REST request methods, built once from the attributes above
+    _REST_RETRY = retry(
         stop=stop_after_attempt(DEFAULT_RETRY_ATTEMPTS),
-        wait=wait_exponential(
-            multiplier=RETRY_WAIT_MULTIPLIER, min=BACKOFF_MIN, max=BACKOFF_MAX
+        wait=wait_retry_after(
+            wait_exponential(
+                multiplier=RETRY_WAIT_MULTIPLIER, min=BACKOFF_MIN, max=BACKOFF_MAX
+            )
         ),
-        retry=retry_if_exception(BaseFetcher._is_retryable_error),
+        retry=retry_if_fetcher_error(),
         reraise=True,
     )
+
+    def __init__(self):
+        super().__init__()
+        self.rate_limiter = TokenBucket(
+            rate=self.RATE_LIMIT_RATE, capacity=self.RATE_LIMIT_BURST
+        )
+
+    @_REST_RETRY
     async def _get(
         self,
         url: str,
@@ -48,34 +72,27 @@ class BaseRestFetcher(BaseFetcher):
         Sends a GET request and returns the JSON response.
         """
         self._log(LogLevel.DEBUG, f"Sending GET request to {url}", job_logger)
-        async with httpx.AsyncClient() as client:
-            try:
-                response = await client.get(
-                    url, headers=headers, params=params, timeout=self.DEFAULT_TIMEOUT
-                )
-                response.raise_for_status()
-                return response.json()
-            except httpx.HTTPStatusError as e:
-                self._log(
-                    LogLevel.ERROR,
-                    f"HTTP error occurred: {e.response.status_code} - {e.response.text}",
-                    job_logger,
-                )
-                raise
-            except httpx.RequestError as e:
-                self._log(
-                    LogLevel.ERROR, f"Request error occurred: {str(e)}", job_logger
-                )
-                raise
+        try:
+            response = await self._paced_get(
+                url,
+                headers=self._with_user_agent(headers),
+                params=params,
+                timeout=self.DEFAULT_TIMEOUT,
+            )
+            response.raise_for_status()
+            return orjson.loads(response.content)
+        except httpx.HTTPStatusError as e:
+            self._log(
+                LogLevel.ERROR,
+                f"HTTP error occurred: {e.response.status_code} - {e.response.text}",
+                job_logger,
+            )
+            raise
+        except httpx.RequestError as e:
+            self._log(LogLevel.ERROR, f"Request error occurred: {str(e)}", job_logger)
+            raise
 
-    @retry(
-        stop=stop_after_attempt(DEFAULT_RETRY_ATTEMPTS),
-        wait=wait_exponential(
-            multiplier=RETRY_WAIT_MULTIPLIER, min=BACKOFF_MIN, max=BACKOFF_MAX
-        ),
-        retry=retry_if_exception(BaseFetcher._is_retryable_error),
-        reraise=True,
-    )
+    @_REST_RETRY
     async def _post(
         self,
         url: str,
@@ -88,29 +105,26 @@ class BaseRestFetcher(BaseFetcher):
         Sends a POST request and returns the JSON response.
         """
         self._log(LogLevel.DEBUG, f"Sending POST request to {url}", job_logger)
-        async with httpx.AsyncClient() as client:
-            try:
-                response = await client.post(
-                    url,
-                    data=data,
-                    headers=headers,
-                    auth=auth,
-                    timeout=self.DEFAULT_TIMEOUT,
-                )
-                response.raise_for_status()
-                return response.json()
-            except httpx.HTTPStatusError as e:
-                self._log(
-                    LogLevel.ERROR,
-                    f"HTTP error occurred: {e.response.status_code} - {e.response.text}",
-                    job_logger,
-                )
-                raise
-            except httpx.RequestError as e:
-                self._log(
-                    LogLevel.ERROR, f"Request error occurred: {str(e)}", job_logger
-                )
-                raise
+        try:
+            response = await self.client.post(
+                url,
+                data=data,
+                headers=self._with_user_agent(headers),
+                auth=auth,
+                timeout=self.DEFAULT_TIMEOUT,
+            )
+            response.raise_for_status()
+            return orjson.loads(response.content)
+        except httpx.HTTPStatusError as e:
+            self._log(
+                LogLevel.ERROR,
+                f"HTTP error occurred: {e.response.status_code} - {e.response.text}",
+                job_logger,
+            )
+            raise
+        except httpx.RequestError as e:
+            self._log(LogLevel.ERROR, f"Request error occurred: {str(e)}", job_logger)
+            raise
 
     async def _paginate(
         self,
@@ -134,7 +148,7 @@ class BaseRestFetcher(BaseFetcher):
                 )
 
                 response = await self._get_response(
-                    client, current_url, params, job_logger
+                    client, current_url, params, job_logger=job_logger
                 )
                 data = self._validate_response_data(response, job_logger)
 
@@ -143,12 +157,9 @@ class BaseRestFetcher(BaseFetcher):
                 results.extend(batch)
 
                 # Determine next page using multiple strategies
-                current_url = self._get_next_url(response, data, job_logger)
+                current_url = self._get_next_url(response, data)
                 page += 1
 
-                # Respect API rate guidelines
-                await self._apply_rate_limits(response.headers)
-
         except Exception as e:
             self._log(
                 LogLevel.EXCEPTION,
@@ -159,6 +170,20 @@ class BaseRestFetcher(BaseFetcher):
 
         return results
 
+    def _get_next_url(
+        self, response: httpx.Response, data: Optional[Dict[str, Any]] = None
+    ) -> Optional[str]:
+        """
+        Determines the URL of the next page from the RFC 5988 link header
+        or the "next" key of the response body.
+        """
+        if self.LINK_HEADER:
+            next_link = response.links.get("next", {}).get("url")
+            if next_link:
+                return next_link
+        return data.get("next") if data else None
+
+    @_REST_RETRY
     async def _get_response(
         self,
         client: httpx.AsyncClient,
@@ -170,44 +195,57 @@ class BaseRestFetcher(BaseFetcher):
         """
         Sends a GET request with retry logic.
         """
-
-        @retry(
-            stop=stop_after_attempt(self.DEFAULT_RETRY_ATTEMPTS),
-            wait=wait_exponential(
-                multiplier=app_configuration.BACKOFF_FACTOR,
-                min=app_configuration.BACKOFF_MIN,
-                max=app_configuration.BACKOFF_MAX,
-            ),
-            retry=retry_if_exception(self._is_retryable_error),
-            reraise=True,
+        response = await self._paced_get(
+            url,
+            client=client,
+            params=params,
+            headers=self._with_user_agent(headers),
+            timeout=self.DEFAULT_TIMEOUT,
         )
-        async def _request_with_retry():
-            response = await client.get(
-                url, params=params, headers=headers, timeout=self.DEFAULT_TIMEOUT
-            )
-            self._check_response_status(response)
-            return response
+        self._check_response_status(response)
+        return response
 
-        return await _request_with_retry()
+    async def _paced_get(
+        self, url: str, client: Optional[httpx.AsyncClient] = None, **kwargs: Any
+    ) -> httpx.Response:
+        """
+        Sends a GET request paced by the rate limiter and adapts the rate to the response.
+        """
+        await self.rate_limiter.acquire()
+        response = await (client or self.client).get(url, **kwargs)
+        if response.status_code == HTTPStatus.TOO_MANY_REQUESTS:
+            self.rate_limiter.observe(success=False)
+        else:
+            await self._apply_rate_limits(response.headers)
+        return response
 
     async def _apply_rate_limits(self, headers: Dict) -> None:
         """
         Handles rate limiting based on API headers.
+        Spreads the remaining quota evenly until the reset and waits for the reset
+        once the quota is used up.
         """
+        self.rate_limiter.observe(success=True)
         remaining = headers.get("X-RateLimit-Remaining")
         reset_time = headers.get("X-RateLimit-Reset")
+        if remaining is None or not reset_time:
+            return
 
-        if remaining == "0" and reset_time:
-            try:
-                wait = float(reset_time) - time.time()
-                if wait > 0:
-                    self._log(
-                        LogLevel.WARNING,
-                        f"Rate limit reached. Waiting for {wait:.2f} seconds.",
-                    )
-                    await asyncio.sleep(wait)
-            except ValueError:
-                self._log(LogLevel.ERROR, "Invalid rate limit reset time received.")
+        try:
+            remaining = int(remaining)
+            wait = float(reset_time) - time.time()
+        except (TypeError, ValueError):
+            self._log(LogLevel.ERROR, "Invalid rate limit reset time received.")
+            return
+
+        if remaining > 0:
+            self.rate_limiter.update_rate(remaining / max(1.0, wait))
+        elif wait > 0:
+            self._log(
+                LogLevel.WARNING,
+                f"Rate limit reached. Waiting for {wait:.2f} seconds.",
+            )
+            await asyncio.sleep(wait)
 
     async def _authenticate(
         self,
@@ -220,31 +258,38 @@ class BaseRestFetcher(BaseFetcher):
         Authenticates with an OAuth2 endpoint to retrieve an access token.
         """
         self._log(LogLevel.INFO, "Authenticating with OAuth2...", job_logger)
-        async with httpx.AsyncClient() as client:
-            response = await client.post(
-                token_url,
-                data={"grant_type": "client_credentials"},
-                auth=(client_id, client_secret),
-                timeout=self.DEFAULT_TIMEOUT,
+        response = await self.client.post(
+            token_url,
+            data={"grant_type": "client_credentials"},
+            headers=self._with_user_agent(),
+            auth=(client_id, client_secret),
+            timeout=self.DEFAULT_TIMEOUT,
+        )
+        response.raise_for_status()
+        token_data = orjson.loads(response.content)
+        access_token = token_data.get("access_token")
+        if access_token:
+            self._log(LogLevel.INFO, "Successfully authenticated.", job_logger)
+        else:
+            self._log(
+                LogLevel.ERROR,
+                "Authentication failed: No access token received.",
+                job_logger,
             )
-            response.raise_for_status()
-            token_data = response.json()
-            access_token = token_data.get("access_token")
-            if access_token:
-                self._log(LogLevel.INFO, "Successfully authenticated.", job_logger)
-            else:
-                self._log(
-                    LogLevel.ERROR,
-                    "Authentication failed: No access token received.",
-                    job_logger,
-                )
-            return access_token
+        return access_token
 
-    def _build_query_params(self, filters: Dict[str, Any]) -> str:
+    def _build_query_params(self, filters: Dict[str, Any], encode: bool = False) -> str:
         """
         Builds query parameters for a REST API request based on a dictionary of filters.
-        Ensures proper formatting without over-encoding special characters like quotes.
+        By default keys and values are joined as-is (e.g. 'name~"git"') without over-encoding
+        special characters like quotes, as required by query languages such as Bitbucket's.
+        With encode=True, standard percent-encoded key=value pairs are returned.
         """
+        if encode:
+            return urlencode(
+                [(key, value) for key, value in filters.items() if value is not None],
+                quote_via=quote,
+            )
         query_parts = [
             f"{key}{value}" for key, value in filters.items() if value is not None
         ]
@@ -260,14 +305,13 @@ class BaseRestFetcher(BaseFetcher):
         Fetches raw merge requests for a repository from the given URL.
         """
         self._log(LogLevel.DEBUG, f"Fetching merge requests from: {url}", job_logger)
-        async with httpx.AsyncClient() as client:
-            response = await client.get(
-                url,
-                headers={"Authorization": f"Bearer {access_token}"},
-                timeout=app_configuration.DEFAULT_TIMEOUT,
-            )
-            response.raise_for_status()
-            data = response.json()
+        response = await self._paced_get(
+            url,
+            headers=self._with_user_agent({"Authorization": f"Bearer {access_token}"}),
+            timeout=app_configuration.DEFAULT_TIMEOUT,
+        )
+        response.raise_for_status()
+        data = orjson.loads(response.content)
 
         return data.get("values", [])
 
@@ -288,24 +332,36 @@ class BaseRestFetcher(BaseFetcher):
 
     async def _process_tasks_concurrently(
         self,
-        tasks: List[asyncio.Task],
+        tasks: List[Awaitable[Any]],
         stage: str,
         job_logger: Optional[Callable[[str], None]] = None,
+        max_concurrency: Optional[int] = None,
     ) -> List[Any]:
         """
-        Processes tasks concurrently and logs progress in 10%-steps.
+        Processes tasks concurrently, at most max_concurrency at a time if given,
+        and logs progress in 10%-steps. Results are returned in task order.
         """
-        results = []
         total = len(tasks)
+        results: List[Any] = [None] * total
         processed = 0
-        last_logged_percent = {"value": -1}
+        last_logged_percent = [-1]
 
         if total == 0:
             return results
 
-        for task in asyncio.as_completed(tasks):
-            result = await task
-            results.append(result)
+        semaphore = asyncio.Semaphore(max_concurrency) if max_concurrency else None
+
+        async def run(index: int, task: Awaitable[Any]) -> Tuple[int, Any]:
+            if semaphore is None:
+                return index, await task
+            async with semaphore:
+                return index, await task
+
+        for completed in asyncio.as_completed(
+            [run(index, task) for index, task in enumerate(tasks)]
+        ):
+            index, result = await completed
+            results[index] = result
             processed += 1
             self._log_progress(processed, total, stage, job_logger, last_logged_percent)
 
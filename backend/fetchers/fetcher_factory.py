@@ -1,3 +1,6 @@
+from types import MappingProxyType
+from typing import Callable, Mapping
+
 from backend.app.config import app_configuration
 from backend.fetchers.base_fetcher import BaseFetcher
 from backend.fetchers.graphql.github_fetcher import GitHubFetcher
@@ -7,23 +10,47 @@ from backend.graphql.enums import PlatformEnum
 from backend.utils.token_pool import TokenPool
 
 
+def _create_github_fetcher() -> BaseFetcher:
+    return GitHubFetcher(
+        base_url=app_configuration.GITHUB_BASE_URL,
+        token_pool=TokenPool(
+            app_configuration.github_tokens,
+            rate=app_configuration.GITHUB_TOKEN_RATE,
+        ),
+    )
+
+
+def _create_gitlab_fetcher() -> BaseFetcher:
+    return GitLabFetcher(
+        base_url=app_configuration.GITLAB_BASE_URL,
+        token_pool=TokenPool(
+            app_configuration.gitlab_tokens,
+            rate=app_configuration.GITLAB_TOKEN_RATE,
+        ),
+    )
+
+
+def _create_bitbucket_fetcher() -> BaseFetcher:
+    return BitbucketFetcher(base_url=app_configuration.BITBUCKET_BASE_URL)
+
+
+# Fetcher constructors by platform, read-only so the mapping cannot be changed at runtime
+_FETCHER_REGISTRY: Mapping[PlatformEnum, Callable[[], BaseFetcher]] = MappingProxyType(
+    {
+        PlatformEnum.GITHUB: _create_github_fetcher,
+        PlatformEnum.GITLAB: _create_gitlab_fetcher,
+        PlatformEnum.BITBUCKET: _create_bitbucket_fetcher,
+    }
+)
+
+
 class FetcherFactory:
     """Factory for creating fetcher instances for different platforms."""
 
     @staticmethod
     def get_fetcher(platform: PlatformEnum) -> BaseFetcher:
         """Return a new fetcher instance for the given platform."""
-        if platform == PlatformEnum.GITHUB:
-            return GitHubFetcher(
-                base_url=app_configuration.GITHUB_BASE_URL,
-                token_pool=TokenPool(app_configuration.github_tokens),
-            )
-        elif platform == PlatformEnum.GITLAB:
-            return GitLabFetcher(
-                base_url=app_configuration.GITLAB_BASE_URL,
-                token_pool=TokenPool(app_configuration.gitlab_tokens),
-            )
-        elif platform == PlatformEnum.BITBUCKET:
-            return BitbucketFetcher(base_url=app_configuration.BITBUCKET_BASE_URL)
-        else:
+        create_fetcher = _FETCHER_REGISTRY.get(platform)
+        if create_fetcher is None:
             raise ValueError(f"Unsupported platform: {platform}")
+        return create_fetcher()
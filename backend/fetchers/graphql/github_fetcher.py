@@ -1,20 +1,38 @@
-import os
-from concurrent.futures import ThreadPoolExecutor
-from dataclasses import dataclass, field
+import asyncio
+from dataclasses import dataclass
+from functools import lru_cache
 from time import time
-from typing import List, Dict, Any, Optional, Callable
+from typing import AsyncIterator, List, Dict, Any, Optional, Callable, Tuple
 
-from backend.fetchers.base_graphql_fetcher import BaseGraphQLFetcher
+from backend.app.config import app_configuration
+from backend.fetchers.base_graphql_fetcher import (
+    QUERY_PART_SEPARATOR,
+    BaseGraphQLFetcher,
+)
 from backend.graphql.enums import LogLevel
 from backend.graphql.git_types import FetcherSettingsInput, RepoData
 from backend.utils.token_pool import TokenPool
 
 
+@lru_cache(maxsize=256)
+def _build_search_filters(
+    search_term: Optional[str], programming_language: Optional[str]
+) -> str:
+    """Build the search qualifiers, cached as they are the same for every page of a job."""
+    filters = []
+    if search_term:
+        filters.append(search_term)
+    if programming_language:
+        filters.append(f"language:{programming_language}")
+    if not filters:
+        filters.append("stars:>=0")
+    return " ".join(filters)
+
+
 @dataclass
 class GitHubFetcher(BaseGraphQLFetcher):
     base_url: str
     token_pool: TokenPool
-    executor: ThreadPoolExecutor = field(init=False, default=None)
 
     # Field mappings for repositories and merge requests
     FIELD_MAPPING = {
@@ -34,12 +52,45 @@ class GitHubFetcher(BaseGraphQLFetcher):
         "title": "title",
     }
 
+    MAX_REPOS_PER_QUERY = 1000  # GitHub API limit for a single search
+    PAGE_SIZE = 50  # Repositories requested per search page
+    MAX_CONCURRENT_PAGES = app_configuration.MAX_CONCURRENT_REQUESTS
+
+    # Sort modes paginated in parallel to fetch more repositories than a single search allows
+    SORT_MODES = (
+        "stars-desc",  # Most starred repositories
+        "updated-desc",  # Recently updated repositories
+        "forks-desc",  # Most forked repositories
+        "help-wanted-issues-desc",  # Repositories with the most help-wanted issues
+        "best-match",  # Default GitHub sorting
+        "stars-asc",  # Least starred repositories
+        "updated-asc",  # Least recently updated repositories
+        "forks-asc",  # Least forked repositories
+    )
+
+    # Sort mode whose result order is not stable, so its responses are not cached
+    UNCACHED_SORT_MODE = "best-match"
+
+    # Query skeleton, filled in per page by build_query
+    QUERY_TEMPLATE = """
+        {{
+            search(query: "{filters} sort:{sort_mode}" type: REPOSITORY first: {first}{after_clause}) {{
+                nodes {{
+                    ... on Repository {{
+                        {fields}
+                    }}
+                }}
+                pageInfo {{
+                    hasNextPage
+                    endCursor
+                }}
+            }}
+        }}
+        """
 
     def __post_init__(self):
-        """Initialize the base class and set up a ThreadPoolExecutor for I/O-bound tasks."""
+        """Ensure the base class is initialized to set up the persistent HTTP client."""
         super().__init__(token_pool=self.token_pool)
-        max_threads = min(32, (os.cpu_count() or 1) * 2)
-        self.executor = ThreadPoolExecutor(max_workers=max_threads)
 
     # ===========================
     # Public Methods
@@ -55,116 +106,21 @@ class GitHubFetcher(BaseGraphQLFetcher):
         self._log(LogLevel.INFO, "Fetching repositories from GitHub...", job_logger)
         start_time = time()
 
-        all_repositories: List[Dict[str, Any]] = []
-        cursor = None
-        remaining_limit = settings.repoCount
-        fetched_count = 0
-        max_repos_per_query = 1000  # GitHub API limit for a single query
-        iteration_count = 0  # To track the number of iterations
-
-        # Define dynamic sort modes
-        sort_modes = [
-            "stars-desc",  # Most starred repositories
-            "updated-desc",  # Recently updated repositories
-            "forks-desc",  # Most forked repositories
-            "help-wanted-issues-desc",  # Repositories with the most help-wanted issues
-            "best-match",  # Default GitHub sorting
-            "stars-asc",  # Least starred repositories
-            "updated-asc",  # Least recently updated repositories
-            "forks-asc",  # Least forked repositories
-        ]
-
         try:
-            # Initial fetch
-            query = self.build_query(settings, fields, cursor)
-            self._log(
-                LogLevel.DEBUG,
-                f"GraphQL Query:\n{self.format_graphql_query(query)}",
-                job_logger,
-            )
-            response = await self._make_request(
-                self.base_url, query, job_logger=job_logger
-            )
-            repositories = self._extract_repositories(response)
-            if repositories:
-                all_repositories.extend(repositories)
-                fetched_count += len(repositories)
-                remaining_limit -= len(repositories)
-
-            page_info = response["data"]["search"]["pageInfo"]
-            cursor = (
-                page_info.get("endCursor") if page_info.get("hasNextPage") else None
-            )
-
-            # Pagination and sort mode cycling
-            while remaining_limit > 0:
-                iteration_count += 1
-                self._log(
-                    LogLevel.DEBUG,
-                    f"Starting iteration {iteration_count} for fetching repositories.",
-                    job_logger,
-                )
-                current_limit = min(remaining_limit, max_repos_per_query)
-
-                while current_limit > 0:
-                    sort_mode = (
-                        sort_modes[iteration_count % len(sort_modes)]
-                        if settings.repoCount > max_repos_per_query
-                        else "best-match"
-                    )
-                    query = self.build_query(settings, fields, cursor, sort_mode)
-                    self._log(
-                        LogLevel.DEBUG,
-                        f"GraphQL Query (sort: {sort_mode}):\n{self.format_graphql_query(query)}",
-                        job_logger,
-                    )
-                    response = await self._make_request(
-                        self.base_url, query, job_logger=job_logger
-                    )
-                    repositories = self._extract_repositories(response)
-
-                    if not repositories:
-                        self._log(
-                            LogLevel.WARNING, "No more repositories found.", job_logger
-                        )
-                        break
-
-                    all_repositories.extend(repositories)
-                    fetched_count += len(repositories)
-                    current_limit -= len(repositories)
-                    remaining_limit -= len(repositories)
-                    self._log_progress(
-                        fetched_count, settings.repoCount, "Fetching", job_logger
-                    )
-
-                    page_info = response["data"]["search"]["pageInfo"]
-                    if not page_info.get("hasNextPage"):
-                        break
-                    cursor = page_info.get("endCursor")
-
-                if remaining_limit > 0:
-                    self._log(
-                        LogLevel.INFO,
-                        "GitHub API-Limit reached - Switching to the next sort mode to fetch more repositories.",
-                        job_logger,
-                    )
-                    cursor = None
-
-            if not all_repositories:
-                self._log(LogLevel.ERROR, "No repositories found.", job_logger)
-                raise RuntimeError("No repositories found.")
-
-            all_repositories = all_repositories[: settings.repoCount]
-            parsed_data = await self._parse_nodes_concurrently(
-                all_repositories,
+            # Repositories are parsed page by page while the next page is fetched
+            parsed_data, fetched_count = await self._fetch_and_parse_pipeline(
+                self._iter_repository_pages(settings, fields, job_logger),
                 fields,
                 settings,
                 repo_field_mapping=self.FIELD_MAPPING,
                 mr_field_mapping=self.MERGE_REQUESTS_FIELD_MAPPING,
                 mr_node_name="pullRequests",
                 job_logger=job_logger,
-                executor=self.executor,
             )
+            if not fetched_count:
+                self._log(LogLevel.ERROR, "No repositories found.", job_logger)
+                raise RuntimeError("No repositories found.")
+
             duration = time() - start_time
             self._log(
                 LogLevel.INFO,
@@ -210,7 +166,9 @@ class GitHubFetcher(BaseGraphQLFetcher):
                 f"Raw query executed successfully. Retrieved {repo_count} repositories in {duration:.2f} seconds.",
                 job_logger,
             )
-            self._log(LogLevel.DEBUG, f"Raw query response: {response}", job_logger)
+            self._log(
+                LogLevel.DEBUG, lambda: f"Raw query response: {response}", job_logger
+            )
 
             return {
                 "response": response,
@@ -231,74 +189,292 @@ class GitHubFetcher(BaseGraphQLFetcher):
         fields: List[str],
         after_cursor: Optional[str] = None,
         sort_mode: str = "stars-desc",
+        page_size: Optional[int] = None,
     ) -> str:
-        """Build a GraphQL query with pagination and sorting support."""
-        normal_fields = [f for f in fields if not f.startswith("mergeRequests.")]
-        merge_requests_subfields = [
-            f.split(".", 1)[1] for f in fields if f.startswith("mergeRequests.")
-        ]
-
-        selected_fields_parts = self._map_fields(normal_fields, self.FIELD_MAPPING)
-        if merge_requests_subfields:
-            merge_requests_query = self._build_merge_requests_query(
-                merge_requests_subfields,
-                settings.maxMRs,
-                self.MERGE_REQUESTS_FIELD_MAPPING,
-                mr_node_name="pullRequests",
-            )
-            selected_fields_parts.append(merge_requests_query)
-
-        query_filters = self._build_query_filters(settings)
-        after_clause = f', after: "{after_cursor}"' if after_cursor else ""
-        query = f"""
-        {{
-            search(query: "{query_filters} sort:{sort_mode}" type: REPOSITORY first: {min(settings.repoCount, 50)}{after_clause}) {{
-                edges {{
-                    node {{
-                        ... on Repository {{
-                            {"\n".join(selected_fields_parts)}
-                        }}
-                    }}
-                }}
-                pageInfo {{
-                    hasNextPage
-                    endCursor
-                }}
-            }}
-        }}
         """
-        return query
+        Build a GraphQL query with pagination and sorting support.
+        page_size defaults to repoCount, capped at GitHub's page size.
+        """
+        return self._fill_query(
+            self._prepare_query(settings, fields),
+            sort_mode,
+            page_size or min(settings.repoCount, self.PAGE_SIZE),
+            after_cursor,
+        )
 
     # ===========================
     # Private Methods
     # ===========================
 
+    async def _iter_repository_pages(
+        self,
+        settings: FetcherSettingsInput,
+        fields: List[str],
+        job_logger: Optional[Callable[[str], None]] = None,
+    ) -> AsyncIterator[List[Dict[str, Any]]]:
+        """
+        Fetch repository pages and yield their nodes.
+        Up to GitHub's search limit a single sort mode is paginated; beyond it all sort modes
+        are paginated, each contributing its share of the requested repositories.
+        """
+        if settings.repoCount <= self.MAX_REPOS_PER_QUERY:
+            sort_modes = [self.SORT_MODES[0]]
+        else:
+            sort_modes = list(self.SORT_MODES)
+            if settings.repoCount > self.MAX_REPOS_PER_QUERY * len(sort_modes):
+                self._log(
+                    LogLevel.WARNING,
+                    f"At most {self.MAX_REPOS_PER_QUERY * len(sort_modes)} repositories can be fetched from GitHub search.",
+                    job_logger,
+                )
+        share = min(self.MAX_REPOS_PER_QUERY, -(-settings.repoCount // len(sort_modes)))
+
+        if len(sort_modes) == 1:
+            pages = self._iter_sort_mode_pages(
+                settings, fields, sort_modes[0], share, asyncio.Semaphore(1), job_logger
+            )
+        else:
+            pages = self._iter_batched_sort_mode_pages(
+                settings, fields, sort_modes, share, job_logger
+            )
+
+        fetched_count = 0
+        try:
+            async for repositories in pages:
+                fetched_count += len(repositories)
+                self._log_progress(
+                    min(fetched_count, settings.repoCount),
+                    settings.repoCount,
+                    "Fetching",
+                    job_logger,
+                )
+                yield repositories
+        finally:
+            await pages.aclose()
+
+    async def _iter_batched_sort_mode_pages(
+        self,
+        settings: FetcherSettingsInput,
+        fields: List[str],
+        sort_modes: List[str],
+        limit: int,
+        job_logger: Optional[Callable[[str], None]] = None,
+    ) -> AsyncIterator[List[Dict[str, Any]]]:
+        """
+        Paginate several sort modes together: each round sends the next page of every
+        unfinished sort mode as one aliased query, each with its own cursor.
+        Falls back to concurrent requests per sort mode if GitHub rejects the first
+        batched query for exceeding its node limit.
+        """
+        prepared = self._prepare_query(settings, fields)
+        cursors: Dict[str, Optional[str]] = {sort_mode: None for sort_mode in sort_modes}
+        fetched: Dict[str, int] = {sort_mode: 0 for sort_mode in sort_modes}
+        total_fetched = 0
+        first_round = True
+
+        while cursors and total_fetched < settings.repoCount:
+            # Page sizes of a round never add up to more than the repositories still missing,
+            # so the last round does not fetch pages that would be cut off afterwards
+            remaining = settings.repoCount - total_fetched
+            active, queries = [], []
+            for sort_mode, cursor in cursors.items():
+                page_size = min(self.PAGE_SIZE, limit - fetched[sort_mode], remaining)
+                if page_size <= 0:
+                    break
+                remaining -= page_size
+                active.append(sort_mode)
+                queries.append(self._fill_query(prepared, sort_mode, page_size, cursor))
+            try:
+                # best-match ordering drifts between requests, so its pages are never cached
+                responses = await self.batch_query(
+                    self.base_url,
+                    queries,
+                    job_logger,
+                    use_cache=[
+                        settings.fetchCacheEnabled
+                        and sort_mode != self.UNCACHED_SORT_MODE
+                        for sort_mode in active
+                    ],
+                )
+            except RuntimeError as e:
+                if not first_round or "MAX_NODE_LIMIT_EXCEEDED" not in str(e):
+                    raise
+                self._log(
+                    LogLevel.WARNING,
+                    "Batched query exceeds GitHub's node limit - Fetching sort modes separately.",
+                    job_logger,
+                )
+                async for repositories in self._iter_concurrent_sort_mode_pages(
+                    settings, fields, sort_modes, limit, job_logger
+                ):
+                    yield repositories
+                return
+            first_round = False
+
+            for sort_mode, response in zip(active, responses):
+                repositories = self._extract_repositories(response)
+                if not repositories:
+                    self._log(
+                        LogLevel.WARNING,
+                        f"No more repositories found (sort: {sort_mode}).",
+                        job_logger,
+                    )
+                    del cursors[sort_mode]
+                    continue
+
+                repositories = repositories[: limit - fetched[sort_mode]]
+                fetched[sort_mode] += len(repositories)
+                total_fetched += len(repositories)
+                page_info = response["data"]["search"]["pageInfo"]
+                if fetched[sort_mode] >= limit or not page_info.get("hasNextPage"):
+                    del cursors[sort_mode]
+                else:
+                    cursors[sort_mode] = page_info.get("endCursor")
+                yield repositories
+
+    async def _iter_concurrent_sort_mode_pages(
+        self,
+        settings: FetcherSettingsInput,
+        fields: List[str],
+        sort_modes: List[str],
+        limit: int,
+        job_logger: Optional[Callable[[str], None]] = None,
+    ) -> AsyncIterator[List[Dict[str, Any]]]:
+        """Paginate each sort mode in its own task, bounded by MAX_CONCURRENT_PAGES."""
+        semaphore = asyncio.Semaphore(self.MAX_CONCURRENT_PAGES)
+        queue: asyncio.Queue = asyncio.Queue()
+
+        async def paginate(sort_mode: str) -> None:
+            try:
+                async for repositories in self._iter_sort_mode_pages(
+                    settings, fields, sort_mode, limit, semaphore, job_logger
+                ):
+                    await queue.put(repositories)
+            except Exception as e:
+                await queue.put(e)
+            else:
+                await queue.put(None)
+
+        # Tasks are cancelled once the consumer stops reading, e.g. after enough repositories
+        tasks = [asyncio.create_task(paginate(sort_mode)) for sort_mode in sort_modes]
+        finished = 0
+        try:
+            while finished < len(tasks):
+                item = await queue.get()
+                if item is None:
+                    finished += 1
+                    continue
+                if isinstance(item, Exception):
+                    raise item
+                yield item
+        finally:
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+
+    async def _iter_sort_mode_pages(
+        self,
+        settings: FetcherSettingsInput,
+        fields: List[str],
+        sort_mode: str,
+        limit: int,
+        semaphore: asyncio.Semaphore,
+        job_logger: Optional[Callable[[str], None]] = None,
+    ) -> AsyncIterator[List[Dict[str, Any]]]:
+        """Paginate a single sort mode with its own cursor until the limit is reached."""
+        prepared = self._prepare_query(settings, fields)
+        cursor = None
+        fetched_count = 0
+
+        while fetched_count < limit:
+            query = self._fill_query(
+                prepared, sort_mode, min(self.PAGE_SIZE, limit - fetched_count), cursor
+            )
+            self._log(
+                LogLevel.DEBUG,
+                lambda: f"GraphQL Query (sort: {sort_mode}):\n{self.format_graphql_query(query)}",
+                job_logger,
+            )
+            async with semaphore:
+                response = await self._make_request(
+                    self.base_url,
+                    query,
+                    job_logger=job_logger,
+                    use_cache=settings.fetchCacheEnabled
+                    and sort_mode != self.UNCACHED_SORT_MODE,
+                )
+            repositories = self._extract_repositories(response)
+
+            if not repositories:
+                self._log(
+                    LogLevel.WARNING,
+                    f"No more repositories found (sort: {sort_mode}).",
+                    job_logger,
+                )
+                break
+
+            repositories = repositories[: limit - fetched_count]
+            fetched_count += len(repositories)
+            yield repositories
+
+            page_info = response["data"]["search"]["pageInfo"]
+            if not page_info.get("hasNextPage"):
+                break
+            cursor = page_info.get("endCursor")
+
+    def _prepare_query(
+        self, settings: FetcherSettingsInput, fields: List[str]
+    ) -> Tuple[str, str, str]:
+        """
+        Fill in the parts of the query that are the same for every page of a job.
+        Returns the query text before the sort mode, between the sort mode and the page size,
+        and after the page arguments.
+        """
+        head, middle, tail = self.QUERY_TEMPLATE.format(
+            filters=self._build_query_filters(settings),
+            sort_mode=QUERY_PART_SEPARATOR,
+            first=QUERY_PART_SEPARATOR,
+            after_clause="",
+            fields=self._build_selection(
+                fields, settings.maxMRs, mr_node_name="pullRequests"
+            ),
+        ).split(QUERY_PART_SEPARATOR)
+        return head, middle, tail
+
+    @staticmethod
+    def _fill_query(
+        prepared: Tuple[str, str, str],
+        sort_mode: str,
+        page_size: int,
+        after_cursor: Optional[str] = None,
+    ) -> str:
+        """Build the query of a single page from a prepared query."""
+        head, middle, tail = prepared
+        after_clause = f', after: "{after_cursor}"' if after_cursor else ""
+        return "".join((head, sort_mode, middle, str(page_size), after_clause, tail))
+
     def _build_query_filters(self, settings: FetcherSettingsInput) -> str:
         """Build query filters for the GraphQL query."""
-        filters = []
-        if settings.searchTerm:
-            filters.append(settings.searchTerm)
-        if settings.programmingLanguage:
-            filters.append(f"language:{settings.programmingLanguage}")
-        if not filters:
-            filters.append("stars:>=0")
-        return " ".join(filters)
+        return _build_search_filters(settings.searchTerm, settings.programmingLanguage)
 
     def _extract_repositories(self, response: Dict[str, Any]) -> List[Dict[str, Any]]:
         """Extract repository nodes from the GraphQL response."""
         try:
-            edges = response["data"]["search"].get("edges", [])
-            nodes = [
-                edge.get("node") for edge in edges if isinstance(edge.get("node"), dict)
-            ]
-            for edge in edges:
-                if not isinstance(edge.get("node"), dict):
-                    self._log(
-                        LogLevel.WARNING,
-                        f"Skipping invalid repository node: {edge.get('node')}",
-                        None,
-                    )
-            return nodes
+            nodes = response["data"]["search"].get("nodes", [])
+            repositories = []
+            invalid_count = 0
+            for node in nodes:
+                if isinstance(node, dict):
+                    repositories.append(node)
+                else:
+                    invalid_count += 1
+            if invalid_count:
+                self._log(
+                    LogLevel.WARNING,
+                    f"Skipping {invalid_count} invalid repository node(s).",
+                    None,
+                )
+            return repositories
         except (KeyError, TypeError):
             self._log(LogLevel.ERROR, f"Invalid response structure: {response}", None)
             raise ValueError("Invalid response structure.")
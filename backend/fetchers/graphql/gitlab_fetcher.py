@@ -1,14 +1,32 @@
 from dataclasses import dataclass, field
+from functools import lru_cache
 from textwrap import dedent
 from time import time
-from typing import List, Dict, Any, Optional, Callable
+from typing import AsyncIterator, List, Dict, Any, Optional, Callable, Tuple
 
-from backend.fetchers.base_graphql_fetcher import BaseGraphQLFetcher
+from backend.fetchers.base_graphql_fetcher import (
+    QUERY_PART_SEPARATOR,
+    BaseGraphQLFetcher,
+)
 from backend.graphql.enums import LogLevel
 from backend.graphql.git_types import RepoData, FetcherSettingsInput
 from backend.utils.token_pool import TokenPool
 
 
+@lru_cache(maxsize=256)
+def _build_project_filters(
+    search_term: Optional[str], programming_language: Optional[str]
+) -> str:
+    """Build the project filter arguments, cached as they are the same for every page of a job."""
+    filters = [
+        f'search: "{search_term}"' if search_term else None,
+        f'programmingLanguageName: "{programming_language}"'
+        if programming_language
+        else None,
+    ]
+    return ", ".join(filter(None, filters))
+
+
 @dataclass
 class GitLabFetcher(BaseGraphQLFetcher):
     base_url: str
@@ -32,6 +50,23 @@ class GitLabFetcher(BaseGraphQLFetcher):
         "title": "title",
     }
 
+    PAGE_SIZE = 100  # Projects requested per page, the maximum GitLab returns
+
+    # Query skeleton, filled in per page by build_query
+    QUERY_TEMPLATE = dedent("""
+        {{
+            projects(first: {first}{after_clause}{filters}) {{
+                nodes {{
+                    {fields}
+                }}
+                pageInfo {{
+                    hasNextPage
+                    endCursor
+                }}
+            }}
+        }}
+    """).strip()
+
     def __post_init__(self):
         """Ensure the base class is initialized to set up the persistent HTTP client."""
         super().__init__(token_pool=self.token_pool)
@@ -50,46 +85,10 @@ class GitLabFetcher(BaseGraphQLFetcher):
         self._log(LogLevel.INFO, "Fetching repositories from GitLab...", job_logger)
         start_time = time()
 
-        all_projects: List[Dict[str, Any]] = []
-        cursor = None
-        remaining_limit = settings.repoCount
-
         try:
-            while remaining_limit > 0:
-                query = self.build_query(settings, fields, cursor)
-                self._log(
-                    LogLevel.DEBUG,
-                    f"GraphQL Query:\n{self.format_graphql_query(query)}",
-                    job_logger,
-                )
-                response = await self._make_request(
-                    self.base_url, query, job_logger=job_logger
-                )
-                projects = self._extract_projects(response)
-
-                if not projects:
-                    self._log(
-                        LogLevel.WARNING, "No more repositories found.", job_logger
-                    )
-                    break
-
-                all_projects.extend(projects)
-                remaining_limit -= len(projects)
-                self._log_progress(
-                    len(all_projects), settings.repoCount, "Fetching", job_logger
-                )
-
-                page_info = response["data"]["projects"]["pageInfo"]
-                if not page_info.get("hasNextPage"):
-                    break
-                cursor = page_info.get("endCursor")
-
-            if not all_projects:
-                raise RuntimeError("No repositories found.")
-
-            all_projects = all_projects[: settings.repoCount]
-            parsed_data = await self._parse_nodes_concurrently(
-                all_projects,
+            # Projects are parsed page by page while the next page is fetched
+            parsed_data, fetched_count = await self._fetch_and_parse_pipeline(
+                self._iter_project_pages(settings, fields, job_logger),
                 fields,
                 settings,
                 repo_field_mapping=self.FIELD_MAPPING,
@@ -97,6 +96,9 @@ class GitLabFetcher(BaseGraphQLFetcher):
                 mr_node_name="mergeRequests",
                 job_logger=job_logger,
             )
+            if not fetched_count:
+                raise RuntimeError("No repositories found.")
+
             duration = time() - start_time
             self._log(
                 LogLevel.INFO,
@@ -133,7 +135,9 @@ class GitLabFetcher(BaseGraphQLFetcher):
                 f"Raw query executed successfully. Retrieved {repo_count} repositories in {duration:.2f} seconds.",
                 job_logger,
             )
-            self._log(LogLevel.DEBUG, f"Raw query response: {response}", job_logger)
+            self._log(
+                LogLevel.DEBUG, lambda: f"Raw query response: {response}", job_logger
+            )
             return {
                 "response": response,
                 "repo_count": repo_count,
@@ -150,48 +154,70 @@ class GitLabFetcher(BaseGraphQLFetcher):
         settings: FetcherSettingsInput,
         fields: List[str],
         cursor: Optional[str] = None,
+        page_size: Optional[int] = None,
     ) -> str:
-        """Build the GraphQL query dynamically based on client-requested fields and settings."""
-        normal_fields = [
-            field for field in fields if not field.startswith("mergeRequests.")
-        ]
-        merge_requests_subfields = [
-            field.split(".", 1)[1]
-            for field in fields
-            if field.startswith("mergeRequests.")
-        ]
-
-        selected_fields_parts = self._map_fields(normal_fields, self.FIELD_MAPPING)
-        if merge_requests_subfields:
-            merge_requests_query = self._build_merge_requests_query(
-                merge_requests_subfields,
-                settings.maxMRs,
-                self.MERGE_REQUESTS_FIELD_MAPPING,
-                mr_node_name="mergeRequests",
-            )
-            selected_fields_parts.append(merge_requests_query)
-
-        query_filters = self._build_query_filters(settings)
-        after_clause = f', after: "{cursor}"' if cursor else ""
-        query = dedent(f"""
-            {{
-                projects(first: {settings.repoCount}{after_clause}{"," if query_filters else ""} {query_filters}) {{
-                    nodes {{
-                        {"\n".join(selected_fields_parts)}
-                    }}
-                    pageInfo {{
-                        hasNextPage
-                        endCursor
-                    }}
-                }}
-            }}
-        """).strip()
-        return query
+        """
+        Build the GraphQL query dynamically based on client-requested fields and settings.
+        page_size defaults to repoCount, capped at GitLab's page size.
+        """
+        return self._fill_query(
+            self._prepare_query(settings, fields),
+            page_size or min(settings.repoCount, self.PAGE_SIZE),
+            cursor,
+        )
 
     # ================================================================
     # Private Methods
     # ================================================================
 
+    async def _iter_project_pages(
+        self,
+        settings: FetcherSettingsInput,
+        fields: List[str],
+        job_logger: Optional[Callable[[str], None]] = None,
+    ) -> AsyncIterator[List[Dict[str, Any]]]:
+        """Fetch project pages one after another and yield their nodes."""
+        prepared = self._prepare_query(settings, fields)
+        cursor = None
+        fetched_count = 0
+
+        while fetched_count < settings.repoCount:
+            query = self._fill_query(
+                prepared,
+                min(self.PAGE_SIZE, settings.repoCount - fetched_count),
+                cursor,
+            )
+            self._log(
+                LogLevel.DEBUG,
+                lambda: f"GraphQL Query:\n{self.format_graphql_query(query)}",
+                job_logger,
+            )
+            response = await self._make_request(
+                self.base_url,
+                query,
+                job_logger=job_logger,
+                use_cache=settings.fetchCacheEnabled,
+            )
+            projects = self._extract_projects(response)
+
+            if not projects:
+                self._log(LogLevel.WARNING, "No more repositories found.", job_logger)
+                break
+
+            fetched_count += len(projects)
+            self._log_progress(
+                min(fetched_count, settings.repoCount),
+                settings.repoCount,
+                "Fetching",
+                job_logger,
+            )
+            yield projects
+
+            page_info = response["data"]["projects"]["pageInfo"]
+            if not page_info.get("hasNextPage"):
+                break
+            cursor = page_info.get("endCursor")
+
     def _extract_projects(self, response: Dict[str, Any]) -> List[Dict[str, Any]]:
         """Extract project nodes from the GraphQL response."""
         try:
@@ -203,12 +229,33 @@ class GitLabFetcher(BaseGraphQLFetcher):
             self._log(LogLevel.ERROR, f"Invalid response structure: {e}", None)
             raise ValueError("Invalid response structure.")
 
+    def _prepare_query(
+        self, settings: FetcherSettingsInput, fields: List[str]
+    ) -> Tuple[str, str]:
+        """
+        Fill in the parts of the query that are the same for every page of a job.
+        Returns the query text before and after the page arguments.
+        """
+        query_filters = self._build_query_filters(settings)
+        head, tail = self.QUERY_TEMPLATE.format(
+            first=QUERY_PART_SEPARATOR,
+            after_clause="",
+            filters=f", {query_filters}" if query_filters else " ",
+            fields=self._build_selection(
+                fields, settings.maxMRs, mr_node_name="mergeRequests"
+            ),
+        ).split(QUERY_PART_SEPARATOR)
+        return head, tail
+
+    @staticmethod
+    def _fill_query(
+        prepared: Tuple[str, str], page_size: int, cursor: Optional[str] = None
+    ) -> str:
+        """Build the query of a single page from a prepared query."""
+        head, tail = prepared
+        after_clause = f', after: "{cursor}"' if cursor else ""
+        return "".join((head, str(page_size), after_clause, tail))
+
     def _build_query_filters(self, settings: FetcherSettingsInput) -> str:
         """Build query filters dynamically based on settings input."""
-        filters = [
-            f'search: "{settings.searchTerm}"' if settings.searchTerm else None,
-            f'programmingLanguageName: "{settings.programmingLanguage}"'
-            if settings.programmingLanguage
-            else None,
-        ]
-        return ", ".join(filter(None, filters))
+        return _build_project_filters(settings.searchTerm, settings.programmingLanguage)
@@ -0,0 +1,44 @@
+from typing import Optional
+
+import httpx
+
+from backend.app.config import app_configuration
+
+# Module-level HTTP client shared by all fetchers
+_client: Optional[httpx.AsyncClient] = None
+
+
+def get_http_client() -> httpx.AsyncClient:
+    """
+    Return the shared HTTP client used by all fetchers.
+    If the client does not exist or was closed, it will be created.
+    """
+    global _client
+
+    if _client is None or _client.is_closed:
+        _client = httpx.AsyncClient(
+            timeout=app_configuration.DEFAULT_TIMEOUT,
+            http2=True,
+            # Idle connections stay open across pages and jobs, so their TLS sessions
+            # (each multiplexing many HTTP/2 requests) are not set up again
+            limits=httpx.Limits(
+                max_connections=app_configuration.HTTP_POOL_SIZE,
+                max_keepalive_connections=app_configuration.HTTP_KEEPALIVE_CONNECTIONS,
+                keepalive_expiry=app_configuration.HTTP_KEEPALIVE_EXPIRY,
+            ),
+        )
+    return _client
+
+
+def is_shared_http_client(client: httpx.AsyncClient) -> bool:
+    """Check whether the given client is the shared HTTP client."""
+    return client is _client
+
+
+async def close_http_client() -> None:
+    """Close the shared HTTP client, e.g. on application shutdown."""
+    global _client
+
+    if _client is not None:
+        await _client.aclose()
+        _client = None
@@ -1,6 +1,6 @@
 import time
-from dataclasses import dataclass
-from typing import Callable, List, Dict, Any, Optional
+from dataclasses import dataclass, field
+from typing import AbstractSet, Callable, List, Dict, Any, Optional
 
 from backend.app.config import app_configuration
 from backend.fetchers.base_rest_fetcher import BaseRestFetcher
@@ -16,8 +16,12 @@ class BitbucketFetcher(BaseRestFetcher):
 
     base_url: str = app_configuration.BITBUCKET_BASE_URL
     token_url: str = app_configuration.BITBUCKET_TOKEN_URL
-    client_id: str = app_configuration.BITBUCKET_CLIENT_ID
-    client_secret: str = app_configuration.BITBUCKET_SECRET
+    client_id: str = field(
+        default_factory=lambda: app_configuration.secrets.BITBUCKET_CLIENT_ID
+    )
+    client_secret: str = field(
+        default_factory=lambda: app_configuration.secrets.BITBUCKET_SECRET
+    )
     access_token: Optional[str] = None
 
     FIELD_MAPPING = {
@@ -36,6 +40,10 @@ class BitbucketFetcher(BaseRestFetcher):
         "title": "title",
     }
 
+    def __post_init__(self):
+        """Ensure the base class is initialized to set up the shared HTTP client."""
+        super().__init__()
+
     # ===========================
     # Public Methods
     # ===========================
@@ -63,11 +71,21 @@ class BitbucketFetcher(BaseRestFetcher):
         repositories = self._extract_values_list(data, job_logger)
         repositories = repositories[: settings.repoCount]
 
-        parsed_data = await self._process_tasks_concurrently(
-            [self._parse_repository(repo, fields, job_logger) for repo in repositories],
-            "Processing",
-            job_logger,
+        requested_fields = frozenset(fields)
+        merge_requests = await self._fetch_all_merge_requests(
+            repositories, requested_fields, job_logger
         )
+        getters = self.compile_repo_fields(requested_fields, self.FIELD_MAPPING)
+        parsed_data = [
+            self.parse_repo_data(
+                data=repo,
+                fields=requested_fields,
+                field_mapping=self.FIELD_MAPPING,
+                merge_requests=repo_merge_requests,
+                getters=getters,
+            )
+            for repo, repo_merge_requests in zip(repositories, merge_requests)
+        ]
         duration = time.time() - start_time
 
         self._log(
@@ -114,40 +132,41 @@ class BitbucketFetcher(BaseRestFetcher):
         query_params = self._build_query_params(filters)
         return f"{self.base_url}/repositories?role=member&q={query_params}"
 
-    async def _parse_repository(
-        self,
-        repo: Dict[str, Any],
-        fields: List[str],
-        job_logger: Optional[Callable[[str], None]],
-    ) -> RepoData:
-        """Parse a single repository dictionary into RepoData."""
-        merge_requests = await self._fetch_merge_requests_if_needed(
-            repo, fields, job_logger
-        )
-        return self.parse_repo_data(
-            data=repo,
-            fields=fields,
-            field_mapping=self.FIELD_MAPPING,
-            merge_requests=merge_requests,
-        )
+    @staticmethod
+    def _collect_pr_url(repo: Dict[str, Any]) -> Optional[str]:
+        """Return the pull request URL of a repository, if it has one."""
+        return repo.get("links", {}).get("pullrequests", {}).get("href")
 
-    async def _fetch_merge_requests_if_needed(
+    async def _fetch_all_merge_requests(
         self,
-        repo: Dict[str, Any],
-        fields: List[str],
+        repositories: List[Dict[str, Any]],
+        fields: AbstractSet[str],
         job_logger: Optional[Callable[[str], None]],
-    ) -> List[MergeRequestData]:
-        """Fetch merge requests for a repository if required."""
-        if any(field.startswith("mergeRequests") for field in fields):
-            url = repo.get("links", {}).get("pullrequests", {}).get("href")
-            if url:
-                return await self._fetch_merge_requests(url, fields, job_logger)
-        return []
+    ) -> List[List[MergeRequestData]]:
+        """
+        Fetch the merge requests of all repositories if required, in repository order.
+        The pull request URLs are collected first and fetched concurrently,
+        at most MAX_CONCURRENT_REQUESTS at a time.
+        """
+        if not any(field.startswith("mergeRequests") for field in fields):
+            return [[] for _ in repositories]
+
+        async def fetch(url: Optional[str]) -> List[MergeRequestData]:
+            if not url:
+                return []
+            return await self._fetch_merge_requests(url, fields, job_logger)
+
+        return await self._process_tasks_concurrently(
+            [fetch(self._collect_pr_url(repo)) for repo in repositories],
+            "Fetching merge requests",
+            job_logger,
+            max_concurrency=self.MAX_CONCURRENT_REQUESTS,
+        )
 
     async def _fetch_merge_requests(
         self,
         url: str,
-        fields: List[str],
+        fields: AbstractSet[str],
         job_logger: Optional[Callable[[str], None]] = None,
     ) -> List[MergeRequestData]:
         """Fetch and map merge requests for a repository from the given URL."""
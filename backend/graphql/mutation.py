@@ -1,5 +1,4 @@
 import asyncio
-from datetime import datetime
 from typing import List, Optional, Annotated
 
 import strawberry
@@ -19,15 +18,29 @@ from backend.utils.mutation_utils import (
     update_job_fields,
     fetch_and_validate_job,
     finalize_job,
+    start_job,
     process_fetch_job_based_on_mode,
     intern_job_log,
 )
 from backend.utils.plugin_enum import PluginEnum
 from backend.utils.plugin_registry import PluginRegistry
 
+# Running fetch job tasks by job ID; finished tasks remove themselves
 running_tasks = {}
 
 
+def _track_task(job_id: str, task: asyncio.Task) -> None:
+    """Register a fetch job task until it is done, so finished jobs do not keep it alive."""
+    running_tasks[job_id] = task
+
+    def untrack(done_task: asyncio.Task) -> None:
+        # A restarted job may already have registered a new task
+        if running_tasks.get(job_id) is done_task:
+            del running_tasks[job_id]
+
+    task.add_done_callback(untrack)
+
+
 @strawberry.type(description="Root mutation for executing operations.")
 class Mutation:
     @strawberry.mutation(description="Create and save a new fetch job.")
@@ -101,14 +114,12 @@ class Mutation:
         ],
     ) -> FetchJob:
         job = fetch_and_validate_job(job_id, disallowed_state=StateEnum.SUCCESSFUL)
-        if job.state in {StateEnum.FAILURE, StateEnum.STOPPED}:
-            intern_job_log(job, "Job resumed")
-        job.state = StateEnum.RUNNING
-        job.startTime = datetime.now()
-        update_job(job)
+        match job.state:
+            case StateEnum.FAILURE | StateEnum.STOPPED:
+                intern_job_log(job, "Job resumed")
+        start_job(job)
         intern_job_log(job, "Execution started")
-        task = asyncio.create_task(process_fetch_job_based_on_mode(job))
-        running_tasks[job_id] = task
+        _track_task(job_id, asyncio.create_task(process_fetch_job_based_on_mode(job)))
         return job
 
     @strawberry.mutation(description="Stop execution and mark job as stopped.")
@@ -188,7 +199,7 @@ class Mutation:
     @strawberry.mutation(
         description="Execute a plugin for a specific job and export plugin results as CSV."
     )
-    def execute_plugin(
+    async def execute_plugin(
         self,
         job_id: Annotated[
             str,
@@ -209,7 +220,11 @@ class Mutation:
         job = fetch_and_validate_job(job_id, allowed_state=StateEnum.SUCCESSFUL)
         try:
             plugin_func = PluginRegistry.get(plugin.value)
-            result = plugin_func(job, local_export=local_export)
+            # Plugins compute and export CSVs synchronously, so they run in a worker thread
+            # instead of blocking running fetch jobs on the event loop
+            result = await asyncio.to_thread(
+                plugin_func, job, local_export=local_export
+            )
             intern_job_log(job, f"Plugin '{plugin.value}' executed successfully.")
             return result
         except Exception as e:
@@ -1,7 +1,10 @@
-from typing import Annotated, List, Optional
+from dataclasses import fields, replace
+from typing import Annotated, List, Optional, Set
 
 import strawberry
+from strawberry.types.nodes import Selection, SelectedField
 
+from backend.app.config import app_configuration
 from backend.database.jobs import get_all_jobs, get_job
 from backend.fetchers.fetcher_factory import FetcherFactory
 from backend.graphql.enums import PlatformEnum
@@ -9,6 +12,45 @@ from backend.graphql.git_types import FetchJob, FetcherSettingsInput, RepoData
 from backend.utils.database_utils import convert_to_dataclass
 from backend.utils.logger import logger
 
+# Names of all FetchJob fields that are stored in the database
+FETCH_JOB_FIELD_NAMES = frozenset(f.name for f in fields(FetchJob))
+
+
+def _get_selection_paths(selections: List[Selection], prefix: str = "") -> List[str]:
+    """
+    Return the selected leaf fields as dot paths, e.g. "mergeRequests.title".
+    Fragments are resolved into their fields; introspection fields are skipped.
+    """
+    paths = []
+    for selection in selections:
+        if not isinstance(selection, SelectedField):
+            paths.extend(_get_selection_paths(selection.selections, prefix))
+        elif not selection.name.startswith("__"):
+            path = f"{prefix}{selection.name}"
+            if selection.selections:
+                paths.extend(_get_selection_paths(selection.selections, f"{path}."))
+            else:
+                paths.append(path)
+    return paths
+
+
+def _get_selected_job_fields(info: strawberry.types.Info) -> Optional[Set[str]]:
+    """
+    Return the FetchJob fields selected in the query, or None (load all fields) if
+    there is no selection.
+    repoData is narrowed to the selected repository and merge request fields, so
+    MongoDB only returns those; other fields are loaded as a whole.
+    """
+    if not info.selected_fields or not info.selected_fields[0].selections:
+        return None
+
+    selected = set()
+    for path in _get_selection_paths(info.selected_fields[0].selections):
+        name = path.split(".", 1)[0]
+        if name in FETCH_JOB_FIELD_NAMES:
+            selected.add(path if name == "repoData" else name)
+    return selected
+
 
 @strawberry.type(description="Root query for fetching data.")
 class Query:
@@ -31,8 +73,10 @@ class Query:
     ) -> List[RepoData]:
         """Dynamically fetch projects from the specified platform."""
         try:
+            # Nested selections are passed on as dot paths, e.g. "mergeRequests.title",
+            # so the fetchers only request the selected merge request fields
             requested_fields = (
-                [f.name for f in info.selected_fields[0].selections]
+                _get_selection_paths(info.selected_fields[0].selections)
                 if info.selected_fields and info.selected_fields[0].selections
                 else []
             )
@@ -45,6 +89,15 @@ class Query:
 
         logger.debug(f"Requested fields: {requested_fields}")
 
+        # The whole result is returned in one response, so its size is capped
+        if settings.repoCount > app_configuration.MAX_FETCH_PROJECTS_REPOS:
+            logger.warning(
+                f"repoCount {settings.repoCount} exceeds the limit, fetching {app_configuration.MAX_FETCH_PROJECTS_REPOS} repositories."
+            )
+            settings = replace(
+                settings, repoCount=app_configuration.MAX_FETCH_PROJECTS_REPOS
+            )
+
         fetcher = FetcherFactory.get_fetcher(platform)
         if not fetcher:
             logger.error(f"Unsupported platform: {platform}")
@@ -104,25 +157,48 @@ class Query:
                 description="Whether to include Debug logs in the results. Defaults to False."
             ),
         ] = False,
+        first: Annotated[
+            Optional[int],
+            strawberry.argument(
+                description="The maximum number of jobs to retrieve (capped by the server). If not provided, all jobs are retrieved."
+            ),
+        ] = None,
+        after: Annotated[
+            Optional[str],
+            strawberry.argument(
+                description="Only retrieve jobs created after the job with this ID, e.g. the last job of the previous page."
+            ),
+        ] = None,
+        info: strawberry.types.Info = None,
     ) -> List[FetchJob]:
-        """Retrieve fetch jobs from the database, optionally filtering out DEBUG logs."""
+        """Retrieve fetch jobs from the database, optionally paged and filtering out DEBUG logs."""
+        # Only load the selected fields from the database
+        selected_fields = _get_selected_job_fields(info) if info else None
+
         jobs: List[FetchJob]
         if job_id:
-            job = get_job(job_id)
+            job = get_job(job_id, fields=selected_fields)
             if not job:
                 raise ValueError(f"No job found with the given ID: {job_id}")
             jobs = [job]
         else:
-            jobs = get_all_jobs()
+            if first is not None:
+                if first < 1:
+                    raise ValueError("first must be a positive number")
+                first = min(first, app_configuration.MAX_JOBS_PAGE_SIZE)
+            jobs = get_all_jobs(fields=selected_fields, limit=first, after=after)
 
+        # Logs and repoData are only processed if they were loaded (not projected away)
         if not includeDebug:  # Filter out DEBUG logs if includeDebug is False
             for job in jobs:
-                job.log = [log for log in job.log if " - DEBUG - " not in log]
+                if job.log:
+                    job.log = [log for log in job.log if " - DEBUG - " not in log]
 
         # Convert repoData and mergeRequests entries to their respective data classes
         for job in jobs:
-            job.repoData = [
-                convert_to_dataclass(RepoData, repo) for repo in job.repoData
-            ]
+            if job.repoData:
+                job.repoData = [
+                    convert_to_dataclass(RepoData, repo) for repo in job.repoData
+                ]
 
         return jobs
@@ -1,25 +1,152 @@
+import asyncio
+import json
 import os
+import stat
+from email.utils import parsedate_to_datetime
 from tempfile import gettempdir
+from typing import Any, List, Mapping
 
-from fastapi import APIRouter
-from fastapi.responses import FileResponse
+from fastapi import APIRouter, Request, Response
+from fastapi.responses import FileResponse, ORJSONResponse
+from strawberry.exceptions import MissingQueryError
 from strawberry.fastapi import GraphQLRouter
+from strawberry.http.exceptions import HTTPException
+from strawberry.types.unset import UNSET
 
+from backend.app.config import app_configuration
 from backend.graphql.schema import schema
 
+
+class BatchGraphQLRouter(GraphQLRouter):
+    """
+    GraphQL router that also accepts a JSON array of operations in a single POST request.
+    The operations of a batch share one context, run concurrently and are answered with
+    an array of results in the same order. All other requests are handled by Strawberry.
+    """
+
+    async def run(self, request, context=UNSET, root_value=UNSET):
+        if isinstance(request, Request) and request.method == "POST":
+            # Starlette caches the body, so Strawberry can read it again for single operations
+            body = await request.body()
+            if body.lstrip().startswith(b"["):
+                return await self._run_batch(request, body, context, root_value)
+        return await super().run(request, context=context, root_value=root_value)
+
+    async def _run_batch(
+        self, request: Request, body: bytes, context: Any, root_value: Any
+    ) -> Response:
+        """Execute a batch of operations and return their results as a JSON array."""
+        try:
+            operations: List[Any] = self.parse_json(body)
+        except json.JSONDecodeError as e:
+            raise HTTPException(400, "Unable to parse request body as JSON") from e
+        if not operations or len(operations) > app_configuration.GRAPHQL_MAX_BATCH_SIZE:
+            raise HTTPException(
+                400,
+                f"A batch must contain 1 to {app_configuration.GRAPHQL_MAX_BATCH_SIZE} operations",
+            )
+        if not all(
+            isinstance(operation, dict) and operation.get("query")
+            for operation in operations
+        ):
+            raise HTTPException(400, "No GraphQL query found in the request")
+
+        sub_response = await self.get_sub_response(request)
+        if context is UNSET:
+            context = await self.get_context(request, response=sub_response)
+        if root_value is UNSET:
+            root_value = await self.get_root_value(request)
+
+        try:
+            results = await asyncio.gather(
+                *(
+                    self.schema.execute(
+                        operation["query"],
+                        root_value=root_value,
+                        variable_values=operation.get("variables"),
+                        context_value=context,
+                        operation_name=operation.get("operationName"),
+                    )
+                    for operation in operations
+                )
+            )
+        except MissingQueryError as e:
+            raise HTTPException(400, "No GraphQL query found in the request") from e
+
+        response_data = []
+        for result in results:
+            data = await self.process_result(request=request, result=result)
+            if result.errors:
+                self._handle_errors(result.errors, data)
+            response_data.append(data)
+
+        return self.create_response(response_data, sub_response)
+
+    def create_response(self, response_data: Any, sub_response: Response) -> Response:
+        """Encode the results with orjson instead of the standard library json module."""
+        response = ORJSONResponse(
+            response_data, status_code=sub_response.status_code or 200
+        )
+        response.headers.raw.extend(sub_response.headers.raw)
+        return response
+
+
 # GraphQL Router with defined schema
-graphql_router = GraphQLRouter(schema)
+graphql_router = BatchGraphQLRouter(schema)
 
 # File download router
 file_router = APIRouter()
 
 
+def _is_not_modified(
+    request_headers: Mapping[str, str], response_headers: Mapping[str, str]
+) -> bool:
+    """
+    Check whether the client's cached copy of a file is still current, based on
+    If-None-Match (preferred) or If-Modified-Since.
+    """
+    if if_none_match := request_headers.get("if-none-match"):
+        etags = {tag.strip().removeprefix("W/") for tag in if_none_match.split(",")}
+        return "*" in etags or response_headers["etag"] in etags
+
+    if if_modified_since := request_headers.get("if-modified-since"):
+        try:
+            return parsedate_to_datetime(
+                response_headers["last-modified"]
+            ) <= parsedate_to_datetime(if_modified_since)
+        except (TypeError, ValueError):
+            return False
+    return False
+
+
 @file_router.get("/files/{file_name}")
-async def download_file(file_name: str):
+async def download_file(file_name: str, request: Request):
     """
     Endpoint to download a file from the server.
+    Only files directly in the temporary directory are served. The file is stat'ed
+    once for the existence check and the Content-Length/ETag/Last-Modified headers,
+    and unchanged files are answered with 304 Not Modified.
     """
+    if os.path.basename(file_name) != file_name or file_name in ("", ".", ".."):
+        return {"error": "File not found"}
+
     file_path = os.path.join(gettempdir(), file_name)
-    if not os.path.exists(file_path):
+    try:
+        stat_result = os.stat(file_path)
+    except OSError:
         return {"error": "File not found"}
-    return FileResponse(file_path, media_type="text/csv", filename=file_name)
+    if not stat.S_ISREG(stat_result.st_mode):
+        return {"error": "File not found"}
+
+    response = FileResponse(
+        file_path, media_type="text/csv", filename=file_name, stat_result=stat_result
+    )
+    if _is_not_modified(request.headers, response.headers):
+        return Response(
+            status_code=304,
+            headers={
+                "etag": response.headers["etag"],
+                "last-modified": response.headers["last-modified"],
+            },
+        )
+    return response
@@ -1,6 +1,17 @@
 import strawberry
+from strawberry.extensions import ParserCache, QueryDepthLimiter, ValidationCache
 
+from backend.app.config import app_configuration
 from backend.graphql.mutation import Mutation
 from backend.graphql.query import Query
 
-schema = strawberry.Schema(query=Query, mutation=Mutation)
+# Repeated query documents skip parsing and validation; overly nested ones are rejected
+schema = strawberry.Schema(
+    query=Query,
+    mutation=Mutation,
+    extensions=[
+        QueryDepthLimiter(max_depth=app_configuration.GRAPHQL_MAX_DEPTH),
+        ParserCache(maxsize=app_configuration.GRAPHQL_CACHE_SIZE),
+        ValidationCache(maxsize=app_configuration.GRAPHQL_CACHE_SIZE),
+    ],
+)
@@ -1,10 +1,12 @@
+from collections import defaultdict
 from dataclasses import dataclass, field
-from typing import Dict, Set, Tuple, List
+from typing import DefaultDict, Dict, Iterator, Set, Tuple, List
+
+import numpy as np
 
 from backend.graphql.git_types import FetchJob, PluginResult, PluginUrl
 from backend.utils.plugin_registry import PluginRegistry
 from backend.utils.csv_exporter import CSVExporter
-from itertools import combinations
 
 
 @dataclass
@@ -19,31 +21,128 @@ class LanguageMetrics:
 
 
 def collect_language_metrics(repo_data: List[Dict]) -> LanguageMetrics:
-    metrics = LanguageMetrics()
+    """
+    Collects the language statistics of the given repositories.
+    Languages are encoded as integer ids in sorted order, so mention and pair counts
+    are computed with NumPy instead of one dict update per mention and language pair.
+    """
+    metrics = LanguageMetrics(total_repos=len(repo_data))
+    repo_languages = []
+    language_repos: DefaultDict[str, Set[str]] = defaultdict(set)
     for repo in repo_data:
         repo_name = repo.get("name", "unknown")
         languages = repo.get("languages") or []
-        metrics.total_language_mentions += len(languages)
+        repo_languages.append(languages)
         for lang in languages:
-            metrics.language_repo_count.setdefault(lang, set()).add(repo_name)
-            metrics.language_usage[lang] = metrics.language_usage.get(lang, 0) + 1
-        if len(languages) == 1:
-            metrics.single_language_repo_count[languages[0]] = (
-                metrics.single_language_repo_count.get(languages[0], 0) + 1
-            )
-        elif len(languages) > 1:
-            for lang in languages:
-                metrics.multi_language_repo_count[lang] = (
-                    metrics.multi_language_repo_count.get(lang, 0) + 1
-                )
-            for lang1, lang2 in combinations(sorted(set(languages)), 2):
-                metrics.combination_count[(lang1, lang2)] = (
-                    metrics.combination_count.get((lang1, lang2), 0) + 1
-                )
-    metrics.total_repos = len(repo_data)
+            language_repos[lang].add(repo_name)
+    if not language_repos:
+        return metrics
+    metrics.language_repo_count = dict(language_repos)
+
+    # Ids follow the sorted language names, so ascending ids form a sorted language pair
+    vocabulary = sorted(metrics.language_repo_count)
+    lang_id = {lang: index for index, lang in enumerate(vocabulary)}
+    language_count = len(vocabulary)
+
+    lengths = np.fromiter(
+        map(len, repo_languages), dtype=np.int64, count=len(repo_data)
+    )
+    mentions = np.fromiter(
+        (lang_id[lang] for languages in repo_languages for lang in languages),
+        dtype=np.int64,
+        count=int(lengths.sum()),
+    )
+    metrics.total_language_mentions = len(mentions)
+
+    usage = np.bincount(mentions, minlength=language_count)
+    single = np.bincount(
+        mentions[np.repeat(lengths, lengths) == 1], minlength=language_count
+    )
+    # Every mention outside a single language repository is part of a multi language one
+    multi = usage - single
+    metrics.language_usage = dict(zip(vocabulary, usage.tolist()))
+    metrics.single_language_repo_count = {
+        vocabulary[index]: int(single[index]) for index in np.flatnonzero(single)
+    }
+    metrics.multi_language_repo_count = {
+        vocabulary[index]: int(multi[index]) for index in np.flatnonzero(multi)
+    }
+
+    # Repositories with the same number of distinct languages share their pair indices,
+    # so the pairs of each group are enumerated in a single array operation
+    repos_by_size: Dict[int, List[List[int]]] = {}
+    for languages in repo_languages:
+        if len(languages) > 1:
+            ids = sorted({lang_id[lang] for lang in languages})
+            if len(ids) > 1:
+                repos_by_size.setdefault(len(ids), []).append(ids)
+
+    pair_codes = []
+    for size, rows in repos_by_size.items():
+        ids = np.array(rows, dtype=np.int64)
+        first, second = np.triu_indices(size, k=1)
+        pair_codes.append((ids[:, first] * language_count + ids[:, second]).ravel())
+    if pair_codes:
+        all_codes = np.concatenate(pair_codes)
+        if len(all_codes) >= language_count * language_count:
+            # Many pairs over few languages: count into a dense language x language
+            # table, which takes a single pass instead of sorting all pairs
+            table = np.bincount(all_codes, minlength=language_count * language_count)
+            codes = np.flatnonzero(table)
+            counts = table[codes]
+        else:
+            codes, counts = np.unique(all_codes, return_counts=True)
+        for code, count in zip(codes.tolist(), counts.tolist()):
+            lang1, lang2 = divmod(code, language_count)
+            metrics.combination_count[(vocabulary[lang1], vocabulary[lang2])] = count
     return metrics
 
 
+def _percentages(counts: np.ndarray, total: int) -> List[float]:
+    """Return the counts as percentages of the total, rounded to two decimals."""
+    if not total:
+        return [0] * len(counts)
+    return np.round(counts / total * 100, 2).tolist()
+
+
+def _language_rows(metrics: LanguageMetrics) -> Iterator[Dict]:
+    """Yield the main statistics row of each language, most used languages first."""
+    ranked = sorted(
+        metrics.language_repo_count.items(), key=lambda x: len(x[1]), reverse=True
+    )
+    repo_counts = np.fromiter(
+        (len(repos) for _, repos in ranked), dtype=np.int64, count=len(ranked)
+    )
+    usage = np.fromiter(
+        (metrics.language_usage[lang] for lang, _ in ranked),
+        dtype=np.int64,
+        count=len(ranked),
+    )
+    # All percentages are computed at once, only the formatting is done per row
+    percents_of_repos = _percentages(repo_counts, metrics.total_repos)
+    percents_of_mentions = _percentages(usage, metrics.total_language_mentions)
+
+    for (lang, _), repo_count, percent_of_repos, percent_of_mentions in zip(
+        ranked, repo_counts.tolist(), percents_of_repos, percents_of_mentions
+    ):
+        yield {
+            "language": lang,
+            "repoCount": repo_count,
+            "percentOfRepos": f"{percent_of_repos} %",
+            "percentOfMentions": f"{percent_of_mentions} %",
+            "singleLanguageRepoCount": metrics.single_language_repo_count.get(lang, 0),
+            "multiLanguageRepoCount": metrics.multi_language_repo_count.get(lang, 0),
+        }
+
+
+def _combination_rows(metrics: LanguageMetrics) -> Iterator[Dict]:
+    """Yield the count of each language pair, most frequent pairs first."""
+    for (lang1, lang2), count in sorted(
+        metrics.combination_count.items(), key=lambda x: x[1], reverse=True
+    ):
+        yield {"language1": lang1, "language2": lang2, "combinationCount": count}
+
+
 def language_metrics_plugin(job: FetchJob, local_export: bool = False) -> PluginResult:
     """
     Calculates statistics for each programming language across the fetched repositories.
@@ -70,60 +169,26 @@ def language_metrics_plugin(job: FetchJob, local_export: bool = False) -> Plugin
 
     metrics = collect_language_metrics(job.repoData)
 
-    # Prepare main language statistics
-    results = []
-    for lang, repos in sorted(
-        metrics.language_repo_count.items(), key=lambda x: len(x[1]), reverse=True
-    ):
-        repo_count = len(repos)
-        percent_of_repos = (
-            (repo_count / metrics.total_repos * 100) if metrics.total_repos else 0
-        )
-        percent_of_mentions = (
-            (metrics.language_usage[lang] / metrics.total_language_mentions * 100)
-            if metrics.total_language_mentions
-            else 0
-        )
-        results.append(
-            {
-                "language": lang,
-                "repoCount": repo_count,
-                "percentOfRepos": f"{round(percent_of_repos, 2)} %",
-                "percentOfMentions": f"{round(percent_of_mentions, 2)} %",
-                "singleLanguageRepoCount": metrics.single_language_repo_count.get(
-                    lang, 0
-                ),
-                "multiLanguageRepoCount": metrics.multi_language_repo_count.get(
-                    lang, 0
-                ),
-            }
-        )
-
     # Predefined file names
     metrics_csv_name = f"language_metrics_{job.jobId}.csv"
     combination_csv_name = f"language_combinations_{job.jobId}.csv"
 
     # Export main statistics as CSV
     file_path = CSVExporter.export_plugin_data_to_csv(
-        results, job.jobId, local_export=local_export, file_name=metrics_csv_name
+        _language_rows(metrics),
+        job.jobId,
+        local_export=local_export,
+        file_name=metrics_csv_name,
     )
     language_metrics_csv = (
         file_path if local_export else CSVExporter.generate_file_url(file_path)
     )
 
-    # Prepare language combination statistics
-    combination_results = [
-        {"language1": lang1, "language2": lang2, "combinationCount": count}
-        for (lang1, lang2), count in sorted(
-            metrics.combination_count.items(), key=lambda x: x[1], reverse=True
-        )
-    ]
-
     urls = {"language_metrics_csv": language_metrics_csv}
     message = "Language plugin CSVs exported."
-    if combination_results:
+    if metrics.combination_count:
         combination_file_path = CSVExporter.export_plugin_data_to_csv(
-            combination_results,
+            _combination_rows(metrics),
             job.jobId,
             local_export=local_export,
             file_name=combination_csv_name,
@@ -5,6 +5,18 @@ import pytest
 from backend.utils.csv_exporter import CSVExporter
 
 
+def _read_csv_lines(file_path, count=1):
+    """
+    Read the header and the first count - 1 data lines of an exported CSV file,
+    split into their cells. Cheaper than pd.read_csv for checking columns.
+    """
+    with open(file_path, "rb") as file:
+        return [
+            tuple(file.readline().decode("utf-8-sig").rstrip("\r\n").split(";"))
+            for _ in range(count)
+        ]
+
+
 class TestCSVExporter:
     def test_flatten_dict(self):
         """
@@ -33,33 +45,31 @@ class TestCSVExporter:
         result = CSVExporter.flatten_dict(data)
         assert result == expected
 
-    def test_export_repo_data_to_csv_server(self, repo_export_data_simple):
+    def test_export_repo_data_to_csv_server(self, repo_export_data_simple, export_dir):
         """Test export_repo_data_to_csv with server export (default)."""
         job_id = "test_job"
         file_url = CSVExporter.export_repo_data_to_csv(
             repo_export_data_simple, job_id, local_export=False
         )
         # The file is in tempdir, extract path from URL
-        file_name = file_url.split("/")[-1]
-        temp_dir = os.getenv("TMPDIR") or os.getenv("TEMP") or "/tmp"
-        file_path = os.path.join(temp_dir, file_name)
+        file_path = export_dir / file_url.split("/")[-1]
         assert os.path.exists(file_path)
-        df = pd.read_csv(file_path, sep=";")
-        assert "name" in df.columns
-        os.remove(file_path)
+        (header,) = _read_csv_lines(file_path)
+        assert "name" in header
 
-    def test_export_repo_data_to_csv_local(self, repo_export_data_simple):
+    def test_export_repo_data_to_csv_local(self, repo_export_data_simple, export_dir):
         """Test export_repo_data_to_csv with local export (unique file name)."""
         job_id = "test_job"
         file_path = CSVExporter.export_repo_data_to_csv(
             repo_export_data_simple, job_id, local_export=True
         )
         assert os.path.exists(file_path)
-        df = pd.read_csv(file_path, sep=";")
-        assert "fullName" in df.columns
-        os.remove(file_path)
+        (header,) = _read_csv_lines(file_path)
+        assert "fullName" in header
 
-    def test_export_plugin_data_to_csv_custom_name(self, repo_export_data_simple):
+    def test_export_plugin_data_to_csv_custom_name(
+        self, repo_export_data_simple, export_dir
+    ):
         """Test export_plugin_data_to_csv with custom file name."""
         job_id = "plugin_test"
         file_name = "custom_plugin_export.csv"
@@ -68,18 +78,52 @@ class TestCSVExporter:
         )
         assert file_path.endswith(file_name)
         assert os.path.exists(file_path)
-        os.remove(file_path)
 
-    def test_special_characters(self, repo_data_special_chars):
+    def test_export_plugin_data_to_csv_from_generator(self, export_dir):
+        """Test export_plugin_data_to_csv with rows produced by a generator."""
+        rows = ({"language": f"Lang{i}", "repoCount": i} for i in range(3))
+        file_path = CSVExporter.export_plugin_data_to_csv(
+            rows, "generator_test", local_export=True, file_name="generator_export.csv"
+        )
+        df = pd.read_csv(file_path, sep=";")
+        assert list(df.columns) == ["language", "repoCount"]
+        assert df["repoCount"].tolist() == [0, 1, 2]
+
+    def test_export_plugin_data_to_csv_single_column(self, export_dir):
+        """Test export_plugin_data_to_csv with a single column and delimiters in values."""
+        file_path = CSVExporter.export_plugin_data_to_csv(
+            [{"language": "C;C++"}, {"language": "Go"}],
+            "single_column_test",
+            local_export=True,
+            file_name="single_column_export.csv",
+        )
+        df = pd.read_csv(file_path, sep=";")
+        assert df["language"].tolist() == ["C;C++", "Go"]
+
+    def test_export_plugin_data_to_csv_different_keys(self, export_dir):
+        """Test export_plugin_data_to_csv with rows that have different keys."""
+        file_path = CSVExporter.export_plugin_data_to_csv(
+            [{"a": 1}, {"a": 2, "b": 3}, {"b": 4}],
+            "different_keys_test",
+            local_export=True,
+            file_name="different_keys_export.csv",
+        )
+        assert _read_csv_lines(file_path, count=4) == [
+            ("a", "b"),
+            ("1", ""),
+            ("2", "3"),
+            ("", "4"),
+        ]
+
+    def test_special_characters(self, repo_data_special_chars, export_dir):
         """Test export_repo_data_to_csv with special characters."""
         job_id = "special_characters_job"
         file_path = CSVExporter.export_repo_data_to_csv(
             repo_data_special_chars, job_id, local_export=True
         )
         assert os.path.exists(file_path)
-        df = pd.read_csv(file_path, sep=";")
-        assert df.loc[0, "name"] == "Репозиторий"  # repository
-        os.remove(file_path)
+        header, first_row = _read_csv_lines(file_path, count=2)
+        assert first_row[header.index("name")] == "Репозиторий"  # repository
 
     def test_empty_repo_data(self, repo_data_empty):
         """Test export_repo_data_to_csv with empty repository data."""
@@ -95,7 +139,7 @@ class TestCSVExporter:
         with pytest.raises(ValueError, match="No data available for export."):
             CSVExporter.export_plugin_data_to_csv(repo_data_empty, job_id)
 
-    def test_unique_file_path_generation(self, repo_export_data_simple, tmp_path):
+    def test_unique_file_path_generation(self, repo_export_data_simple, export_dir):
         """Test that unique file names are generated for local export if file exists."""
         job_id = "unique_test"
         # First export
@@ -109,5 +153,3 @@ class TestCSVExporter:
         assert file_path1 != file_path2
         assert os.path.exists(file_path1)
         assert os.path.exists(file_path2)
-        os.remove(file_path1)
-        os.remove(file_path2)
@@ -1,15 +1,25 @@
+from collections import Counter
+
 import pytest
 from bson import ObjectId
 
 from backend.database.jobs import (
     create_job,
+    create_jobs,
     update_job,
+    update_job_log,
     get_job,
     get_all_jobs,
     delete_job,
+    _jobs_cache,
 )
 from backend.graphql.enums import PlatformEnum, StateEnum, FetchJobMode
-from backend.graphql.git_types import FetchJob, FetcherSettings
+from backend.graphql.git_types import (
+    FetchJob,
+    FetcherSettings,
+    MergeRequestData,
+    RepoData,
+)
 
 
 class TestDbJobs:
@@ -26,25 +36,48 @@ class TestDbJobs:
 
     def test_create_job(self, mock_collection, sample_fetch_job):
         """Should create a job and store it in the database."""
-        job_id = create_job(sample_fetch_job, collection=mock_collection)
-        job = mock_collection.find_one({"_id": ObjectId(job_id)})
+        object_id = ObjectId(create_job(sample_fetch_job, collection=mock_collection))
+        job = mock_collection.find_one({"_id": object_id})
         assert job is not None
-        assert job["_id"] == ObjectId(job_id)
+        assert job["_id"] == object_id
         assert job["name"] == sample_fetch_job.name
         assert job["state"] == StateEnum.CREATED.value
         assert job["platform"] == PlatformEnum.GITHUB.value
 
+    def test_create_job_with_repo_data(self, mock_collection, sample_fetch_job):
+        """Should store nested repository and merge request data as plain dicts."""
+        sample_fetch_job.repoData = [
+            RepoData(name="repo", mergeRequests=[MergeRequestData(title="Fix bug")])
+        ]
+        job_id = create_job(sample_fetch_job, collection=mock_collection)
+        job = mock_collection.find_one({"_id": ObjectId(job_id)})
+        assert job["settings"]["repoCount"] == 10
+        assert job["repoData"][0]["name"] == "repo"
+        assert job["repoData"][0]["mergeRequests"][0]["title"] == "Fix bug"
+
+    def test_create_jobs(self, mock_collection, sample_fetch_job):
+        """Should create multiple jobs with a single bulk insert."""
+        job_ids = create_jobs(
+            [sample_fetch_job, sample_fetch_job], collection=mock_collection
+        )
+        assert len(job_ids) == 2
+        assert len(set(job_ids)) == 2
+        for job_id in job_ids:
+            job = mock_collection.find_one({"_id": ObjectId(job_id)})
+            assert job["jobId"] == job_id
+            assert job["state"] == StateEnum.CREATED.value
+
     def test_update_job(self, mock_collection, create_sample_job):
         """Should update an existing job's fields."""
-        sample_fetch_job, job_id = create_sample_job
+        sample_fetch_job, _, object_id = create_sample_job
         sample_fetch_job.name = "Updated Job Name"
         update_job(sample_fetch_job, collection=mock_collection)
-        updated_job = mock_collection.find_one({"_id": ObjectId(job_id)})
+        updated_job = mock_collection.find_one({"_id": object_id})
         assert updated_job["name"] == "Updated Job Name"
 
     def test_get_job(self, mock_collection, create_sample_job):
         """Should retrieve a job by its ID."""
-        sample_fetch_job, job_id = create_sample_job
+        sample_fetch_job, job_id, _ = create_sample_job
         job = get_job(job_id, collection=mock_collection)
         assert job is not None
         assert job.name == sample_fetch_job.name
@@ -52,18 +85,91 @@ class TestDbJobs:
         assert job.settings == sample_fetch_job.settings
         assert job.platform == sample_fetch_job.platform
 
+    def test_get_job_with_fields(self, mock_collection, create_sample_job):
+        """Should only load the requested fields of a single job."""
+        sample_fetch_job, job_id, _ = create_sample_job
+        job = get_job(job_id, collection=mock_collection, fields={"requestedFields"})
+        assert job.name == sample_fetch_job.name
+        assert job.requestedFields == sample_fetch_job.requestedFields
+        assert job.settings is None
+
     def test_get_all_jobs(self, mock_collection, sample_fetch_job):
         """Should retrieve all jobs from the collection."""
         self._create_multiple_jobs(mock_collection, sample_fetch_job, count=3)
         jobs = get_all_jobs(collection=mock_collection)
         assert len(jobs) == 3
 
+    def test_get_all_jobs_with_fields(self, mock_collection, sample_fetch_job):
+        """Should only load the requested fields besides the required ones."""
+        self._create_multiple_jobs(mock_collection, sample_fetch_job, count=2)
+        jobs = get_all_jobs(collection=mock_collection, fields={"log"})
+        assert len(jobs) == 2
+        assert all(job.name == sample_fetch_job.name for job in jobs)
+        assert all(job.settings is None for job in jobs)
+
+    def test_get_all_jobs_paged(self, mock_collection, sample_fetch_job):
+        """Should page jobs in creation order, continuing after the given job ID."""
+        self._create_multiple_jobs(mock_collection, sample_fetch_job, count=5)
+        all_job_ids = [job.jobId for job in get_all_jobs(collection=mock_collection)]
+
+        first_page = get_all_jobs(collection=mock_collection, limit=2)
+        assert [job.jobId for job in first_page] == all_job_ids[:2]
+
+        next_page = get_all_jobs(
+            collection=mock_collection, limit=2, after=first_page[-1].jobId
+        )
+        assert [job.jobId for job in next_page] == all_job_ids[2:4]
+
+        with pytest.raises(ValueError):
+            get_all_jobs(collection=mock_collection, after="invalid_id")
+
+    def test_get_all_jobs_cached_until_write(
+        self, mocker, mock_collection, sample_fetch_job
+    ):
+        """Should serve listings of the default collection from memory until a job is written."""
+        mocker.patch(
+            "backend.database.jobs._get_or_create_collection",
+            return_value=mock_collection,
+        )
+        _jobs_cache.clear()
+        create_job(sample_fetch_job)
+        assert len(get_all_jobs()) == 1
+
+        # Writes that bypass the job functions are not seen until the cache is cleared
+        mock_collection.insert_one(mock_collection.find_one({}, {"_id": 0}))
+        jobs = get_all_jobs()
+        assert len(jobs) == 1
+        jobs[0].name = "changed"
+        assert get_all_jobs()[0].name == sample_fetch_job.name
+
+        create_job(sample_fetch_job)
+        assert len(get_all_jobs()) == 3
+
+    def test_update_job_log_keeps_cache(
+        self, mocker, mock_collection, sample_fetch_job
+    ):
+        """Should write only the job log and keep the cached job listings."""
+        mocker.patch(
+            "backend.database.jobs._get_or_create_collection",
+            return_value=mock_collection,
+        )
+        _jobs_cache.clear()
+        job_id = create_job(sample_fetch_job)
+        assert get_all_jobs()[0].log == sample_fetch_job.log
+
+        update_job_log(job_id, ["Entry"])
+
+        assert get_job(job_id).log == ["Entry"]
+        assert get_all_jobs()[0].log == sample_fetch_job.log
+        with pytest.raises(ValueError, match="Job not found with ID"):
+            update_job_log(str(ObjectId()), ["Entry"])
+
     def test_delete_job(self, mock_collection, create_sample_job):
         """Should delete a job by its ID."""
-        sample_fetch_job, job_id = create_sample_job
+        sample_fetch_job, job_id, object_id = create_sample_job
         success = delete_job(job_id, collection=mock_collection)
         assert success is True
-        job = mock_collection.find_one({"_id": ObjectId(job_id)})
+        job = mock_collection.find_one({"_id": object_id})
         assert job is None
 
     # ===========================
@@ -118,39 +224,23 @@ class TestDbJobs:
         assert len(jobs) == 0
 
     def test_get_jobs_by_state(self, mock_collection, sample_fetch_job):
-        """Should filter jobs by state."""
+        """Should load jobs with their state."""
         sample_fetch_job.state = StateEnum.CREATED
         create_job(sample_fetch_job, collection=mock_collection)
         sample_fetch_job.state = StateEnum.RUNNING
         create_job(sample_fetch_job, collection=mock_collection)
-        created_jobs = [
-            job
-            for job in get_all_jobs(collection=mock_collection)
-            if job.state == StateEnum.CREATED
-        ]
-        running_jobs = [
-            job
-            for job in get_all_jobs(collection=mock_collection)
-            if job.state == StateEnum.RUNNING
-        ]
-        assert len(created_jobs) == 1
-        assert len(running_jobs) == 1
+        # One scan, counted per state
+        counts = Counter(job.state for job in get_all_jobs(collection=mock_collection))
+        assert counts == {StateEnum.CREATED: 1, StateEnum.RUNNING: 1}
 
     def test_get_jobs_by_platform(self, mock_collection, sample_fetch_job):
-        """Should filter jobs by platform."""
+        """Should load jobs with their platform."""
         sample_fetch_job.platform = PlatformEnum.GITHUB
         create_job(sample_fetch_job, collection=mock_collection)
         sample_fetch_job.platform = PlatformEnum.GITLAB
         create_job(sample_fetch_job, collection=mock_collection)
-        github_jobs = [
-            job
-            for job in get_all_jobs(collection=mock_collection)
-            if job.platform == PlatformEnum.GITHUB
-        ]
-        gitlab_jobs = [
-            job
-            for job in get_all_jobs(collection=mock_collection)
-            if job.platform == PlatformEnum.GITLAB
-        ]
-        assert len(github_jobs) == 1
-        assert len(gitlab_jobs) == 1
+        # One scan, counted per platform
+        counts = Counter(
+            job.platform for job in get_all_jobs(collection=mock_collection)
+        )
+        assert counts == {PlatformEnum.GITHUB: 1, PlatformEnum.GITLAB: 1}
@@ -1,11 +1,13 @@
 import re
 from typing import List, Optional, Any
-from unittest.mock import AsyncMock
 
 import pytest
 
 from backend.graphql.git_types import RepoData
 
+# Runs of whitespace collapsed by normalize_query
+_WHITESPACE = re.compile(r"\s+")
+
 
 class FetcherTestUtils:
     """
@@ -42,9 +44,17 @@ class FetcherTestUtils:
         return_value: Optional[Any] = None,
         side_effect: Optional[Exception] = None,
     ) -> None:
-        """Helper to mock a specific method on the fetcher."""
-        mock = AsyncMock(return_value=return_value, side_effect=side_effect)
-        setattr(self.fetcher, method_name, mock)
+        """
+        Helper to replace a specific method on the fetcher with a coroutine that returns
+        return_value or raises side_effect. Use an AsyncMock directly where calls are asserted.
+        """
+
+        async def replacement(*args: Any, **kwargs: Any) -> Any:
+            if side_effect is not None:
+                raise side_effect
+            return return_value
+
+        setattr(self.fetcher, method_name, replacement)
 
     def assert_repositories(
         self,
@@ -62,7 +72,7 @@ class FetcherTestUtils:
     @staticmethod
     def normalize_query(query: str) -> str:
         """Normalize a GraphQL query by removing extra whitespaces and line breaks."""
-        return re.sub(r"\s+", " ", query.strip())
+        return _WHITESPACE.sub(" ", query.strip())
 
     @pytest.mark.parametrize(
         "query, expected_query",
@@ -0,0 +1,34 @@
+from unittest.mock import MagicMock
+
+from backend.fetchers.base_fetcher import BaseFetcher
+from backend.graphql.enums import LogLevel
+
+
+def test_job_log_level_filters_messages():
+    """Test that messages below JOB_LOG_LEVEL are neither formatted nor stored."""
+    fetcher = BaseFetcher()
+    fetcher.JOB_LOG_LEVEL = LogLevel.INFO
+    messages = []
+
+    assert not fetcher._log_enabled(LogLevel.DEBUG, messages.append)
+    assert not fetcher._log_enabled(LogLevel.ERROR, None)
+
+    fetcher._log(LogLevel.DEBUG, "debug message", messages.append)
+    fetcher._log(LogLevel.WARNING, "warning message", messages.append)
+    assert len(messages) == 1
+    assert messages[0].endswith("WARNING - warning message")
+
+
+def test_log_builds_callable_messages_lazily():
+    """Test that message callables are only called for messages that are logged."""
+    fetcher = BaseFetcher()
+    fetcher.JOB_LOG_LEVEL = LogLevel.INFO
+    messages = []
+    build_message = MagicMock(return_value="formatted query")
+
+    fetcher._log(LogLevel.DEBUG, build_message, messages.append)
+    build_message.assert_not_called()
+
+    fetcher._log(LogLevel.INFO, build_message, messages.append)
+    build_message.assert_called_once()
+    assert messages[0].endswith("INFO - formatted query")
@@ -0,0 +1,168 @@
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import orjson
+import pytest
+from backend.utils.token_pool import TokenPool
+from backend.fetchers.base_graphql_fetcher import BaseGraphQLFetcher
+from backend.graphql.git_types import FetcherSettingsInput
+from backend.utils.response_cache import ResponseCache
+
+
+class DummyFetcher(BaseGraphQLFetcher):
+    def build_query(self, fetch_settings, fields):
+        return ""
+
+
+def test_parse_nodes_keeps_node_order():
+    """Test that parsed repositories keep the original node order and skip invalid nodes."""
+    fetcher = DummyFetcher(token_pool=TokenPool(["token"]))
+    nodes = [{"name": f"repo-{i}"} for i in range(60)]
+
+    parsed = fetcher._parse_nodes(nodes + ["invalid"], ["name"], {"name": "name"}, {})
+
+    assert [repo.name for repo in parsed] == [node["name"] for node in nodes]
+
+
+@pytest.mark.asyncio
+async def test_fetch_and_parse_pipeline_limits_and_propagates_errors():
+    """Test that the pipeline stops at repoCount and re-raises errors of the page producer."""
+    fetcher = DummyFetcher(token_pool=TokenPool(["token"]))
+    settings = FetcherSettingsInput(
+        repoCount=5, maxMRs=0, searchTerm="", programmingLanguage=""
+    )
+
+    async def pages():
+        for page in range(3):
+            yield [{"name": f"repo-{page}-{i}"} for i in range(3)]
+
+    parsed, fetched = await fetcher._fetch_and_parse_pipeline(
+        pages(), ["name"], settings, {"name": "name"}, {}
+    )
+    assert fetched == 5
+    assert [repo.name for repo in parsed] == [
+        "repo-0-0",
+        "repo-0-1",
+        "repo-0-2",
+        "repo-1-0",
+        "repo-1-1",
+    ]
+
+    async def failing_pages():
+        yield [{"name": "repo"}]
+        raise RuntimeError("request failed")
+
+    with pytest.raises(RuntimeError, match="request failed"):
+        await fetcher._fetch_and_parse_pipeline(
+            failing_pages(), ["name"], settings, {"name": "name"}, {}
+        )
+
+
+def test_parse_batch_separates_errors():
+    """Test that failed nodes are returned with their exception, apart from the parsed repositories."""
+    fetcher = DummyFetcher(token_pool=TokenPool(["token"]))
+    broken = {"name": "broken", "mergeRequests": "not a dict"}
+
+    results, errors = fetcher._parse_batch(
+        [{"name": "repo"}, broken],
+        frozenset({"name", "mergeRequests.title"}),
+        frozenset({"mergeRequests.title"}),
+        {"name": "name"},
+        {},
+    )
+
+    assert [repo.name for repo in results] == ["repo"]
+    assert [node for node, _ in errors] == [broken]
+    assert isinstance(errors[0][1], AttributeError)
+
+
+def test_compiled_field_getters():
+    """Test that compiled getters resolve plain, nested and list paths and only requested fields."""
+    fetcher = DummyFetcher(token_pool=TokenPool(["token"]))
+    getters = fetcher.compile_repo_fields(
+        ["name", "languages", "starCount"],
+        {"name": "name", "languages": "languages.name", "description": "description"},
+    )
+    assert [name for name, _, _ in getters] == ["name", "starCount", "languages"]
+
+    repo = fetcher.parse_repo_data(
+        {"name": "repo", "languages": [{"name": "Python"}, {"name": "C"}]},
+        ["name", "languages", "starCount"],
+        {},
+        None,
+        getters=getters,
+    )
+    assert repo.name == "repo"
+    assert repo.languages == ["Python", "C"]
+    assert repo.starCount == 0
+    assert repo.description is None
+
+
+def test_format_graphql_query():
+    """Test that braces are put on their own lines and nested selections are indented."""
+    query = """
+        query { search(first: 2) { nodes { name
+            owner { login } } } }
+    """
+    assert BaseGraphQLFetcher.format_graphql_query(query) == (
+        "query {\n"
+        "    search(first: 2) {\n"
+        "        nodes {\n"
+        "            name\n"
+        "            owner {\n"
+        "                login\n"
+        "            }\n"
+        "        }\n"
+        "    }\n"
+        "}"
+    )
+
+
+@pytest.mark.asyncio
+async def test_batch_query_caches_per_query():
+    """Test that batched queries are cached one by one and only flagged queries use the cache."""
+    fetcher = DummyFetcher(token_pool=TokenPool(["token1"]))
+    sent_queries = []
+
+    async def make_request(base_url, query, job_logger=None, use_cache=False):
+        sent_queries.append(query)
+        aliases = [line.split(":", 1)[0] for line in query.splitlines()[1:-1]]
+        return {"data": {alias: {"alias": alias} for alias in aliases}}
+
+    queries = ['{ search(query: "a") { count } }', '{ search(query: "b") { count } }']
+    with (
+        patch(
+            "backend.fetchers.base_graphql_fetcher._response_cache",
+            ResponseCache(ttl=60.0, maxsize=8),
+        ),
+        patch.object(fetcher, "_make_request", side_effect=make_request),
+    ):
+        first = await fetcher.batch_query("url", queries, use_cache=[True, False])
+        second = await fetcher.batch_query("url", queries, use_cache=[True, False])
+
+    assert len(sent_queries) == 2
+    assert "q0:" in sent_queries[0] and "q1:" in sent_queries[0]
+    assert "q0:" not in sent_queries[1] and "q1:" in sent_queries[1]
+    assert second == first
+
+
+@pytest.mark.asyncio
+async def test_make_request_reuses_cached_response():
+    """Test that cached responses are only used for requests that enable the cache."""
+    fetcher = DummyFetcher(token_pool=TokenPool(["token1"]))
+    fetcher.client = MagicMock()
+    response_mock = MagicMock()
+    response_mock.raise_for_status.return_value = None
+    response_mock.content = orjson.dumps({"data": {"search": {"nodes": []}}})
+    fetcher.client.post = AsyncMock(return_value=response_mock)
+
+    with patch(
+        "backend.fetchers.base_graphql_fetcher._response_cache",
+        ResponseCache(ttl=60.0, maxsize=8),
+    ):
+        first = await fetcher._make_request("url", "{ cached }", use_cache=True)
+        second = await fetcher._make_request("url", "{ cached }", use_cache=True)
+        assert fetcher.client.post.await_count == 1
+        assert second == first
+
+        await fetcher._make_request("url", "{ cached }")
+        assert fetcher.client.post.await_count == 2
@@ -1,7 +1,9 @@
+import asyncio
 from http import HTTPStatus
 from unittest.mock import patch, Mock, AsyncMock
 
 import httpx
+import orjson
 import pytest
 
 from backend.graphql.git_types import RepoData, MergeRequestData
@@ -54,6 +56,14 @@ class TestBitbucketFetcher(FetcherTestHelper):
             f"Expected query '{expected_query}', but got '{query_params}'."
         )
 
+    def test_build_query_params_encoded(self):
+        """Test that _build_query_params percent-encodes key=value pairs when requested."""
+        filters = {"q": 'name~"my repo"', "sort": "-updated_on", "page": None}
+        assert (
+            self.fetcher._build_query_params(filters, encode=True)
+            == "q=name~%22my%20repo%22&sort=-updated_on"
+        )
+
     @pytest.mark.asyncio
     @patch("httpx.AsyncClient.get")
     @patch(
@@ -66,7 +76,7 @@ class TestBitbucketFetcher(FetcherTestHelper):
         # Mock the HTTP response
         mock_response = Mock()
         mock_response.raise_for_status = Mock(return_value=None)
-        mock_response.json = Mock(return_value={"values": self.mock_repositories})
+        mock_response.content = orjson.dumps({"values": self.mock_repositories})
         mock_get.return_value = mock_response
 
         expected_repos = [
@@ -103,48 +113,40 @@ class TestBitbucketFetcher(FetcherTestHelper):
             self._assert_repo_data(actual_repo, expected_repo)
 
     @pytest.mark.asyncio
-    @patch("httpx.AsyncClient.get")
-    @patch(
-        "backend.fetchers.rest_api.bitbucket_fetcher.BitbucketFetcher._ensure_authenticated"
+    @pytest.mark.parametrize(
+        "payload, error",
+        [
+            ({"values": []}, None),
+            ({"invalid": "data"}, ValueError),
+            ({}, ValueError),
+        ],
+        ids=["no_repositories", "invalid_response", "empty_response"],
     )
-    async def test_fetch_projects_no_repositories(
-        self, mock_ensure_authenticated, mock_get
-    ):
-        """Test fetch_projects when no repositories are returned."""
-        mock_ensure_authenticated.return_value = None
-
-        # Mock the HTTP response
-        mock_response = Mock()
-        mock_response.raise_for_status = Mock(return_value=None)
-        mock_response.json = Mock(return_value={"values": []})
-        mock_get.return_value = mock_response
-
-        result = await self.fetcher.fetch_projects(self.settings, self.fields)
-
-        assert result == [], "Expected no repositories to be returned."
-
-    @pytest.mark.asyncio
     @patch("httpx.AsyncClient.get")
     @patch(
         "backend.fetchers.rest_api.bitbucket_fetcher.BitbucketFetcher._ensure_authenticated"
     )
-    async def test_fetch_projects_invalid_response(
-        self, mock_ensure_authenticated, mock_get
+    async def test_fetch_projects_without_repositories(
+        self, mock_ensure_authenticated, mock_get, payload, error
     ):
-        """Test fetch_projects with an invalid response structure."""
+        """Test fetch_projects with responses that contain no repositories."""
         mock_ensure_authenticated.return_value = None
 
         # Mock the HTTP response
         mock_response = Mock()
         mock_response.raise_for_status = Mock(return_value=None)
-        mock_response.json = Mock(return_value={"invalid": "data"})  # Invalid structure
+        mock_response.content = orjson.dumps(payload)
         mock_get.return_value = mock_response
 
-        with pytest.raises(
-            ValueError,
-            match="The API response does not contain the expected 'values' key.",
-        ):
-            await self.fetcher.fetch_projects(self.settings, self.fields)
+        if error is None:
+            result = await self.fetcher.fetch_projects(self.settings, self.fields)
+            assert result == [], "Expected no repositories to be returned."
+        else:
+            with pytest.raises(
+                error,
+                match="The API response does not contain the expected 'values' key.",
+            ):
+                await self.fetcher.fetch_projects(self.settings, self.fields)
 
     @pytest.mark.asyncio
     @patch("httpx.AsyncClient.get")
@@ -160,7 +162,7 @@ class TestBitbucketFetcher(FetcherTestHelper):
         # Mock the HTTP response for repositories
         mock_response_repos = Mock()
         mock_response_repos.raise_for_status = Mock(return_value=None)
-        mock_response_repos.json = Mock(return_value={"values": self.mock_repositories})
+        mock_response_repos.content = orjson.dumps({"values": self.mock_repositories})
         mock_get.return_value = mock_response_repos
 
         # Mock the HTTP response for merge requests
@@ -203,29 +205,6 @@ class TestBitbucketFetcher(FetcherTestHelper):
                 == mock_merge_request_data[0].authorName
             )
 
-    @pytest.mark.asyncio
-    @patch("httpx.AsyncClient.get")
-    @patch(
-        "backend.fetchers.rest_api.bitbucket_fetcher.BitbucketFetcher._ensure_authenticated"
-    )
-    async def test_fetch_projects_with_empty_response(
-        self, mock_ensure_authenticated, mock_get
-    ):
-        """Test fetch_projects when the API returns an empty response."""
-        mock_ensure_authenticated.return_value = None
-
-        # Mock the HTTP response
-        mock_response = Mock()
-        mock_response.raise_for_status = Mock(return_value=None)
-        mock_response.json = Mock(return_value={})  # Empty response
-        mock_get.return_value = mock_response
-
-        with pytest.raises(
-            ValueError,
-            match="The API response does not contain the expected 'values' key.",
-        ):
-            await self.fetcher.fetch_projects(self.settings, self.fields)
-
     @pytest.mark.asyncio
     @patch("httpx.AsyncClient.post")
     async def test_fetch_projects_with_invalid_authentication(self, mock_post):
@@ -248,3 +227,55 @@ class TestBitbucketFetcher(FetcherTestHelper):
                 self.fetcher.client_secret,
                 job_logger=None,
             )
+
+    @pytest.mark.asyncio
+    async def test_paginate_follows_next_and_stops_at_limit(self):
+        """Test that _paginate follows next links and returns at most limit results."""
+        request = httpx.Request("GET", "https://api.example.com/repos")
+        pages = [
+            httpx.Response(
+                HTTPStatus.OK,
+                content=orjson.dumps(
+                    {"values": [{"id": 1}, {"id": 2}], "next": "https://next.page"}
+                ),
+                request=request,
+            ),
+            httpx.Response(
+                HTTPStatus.OK,
+                content=orjson.dumps(
+                    {"values": [{"id": 3, "score": 1.5}, {"id": 4}], "next": "x"}
+                ),
+                request=request,
+            ),
+        ]
+        client = Mock()
+        client.get = AsyncMock(side_effect=pages)
+
+        results = await self.fetcher._paginate(
+            client, "https://api.example.com/repos", {}, limit=3
+        )
+
+        assert results == [{"id": 1}, {"id": 2}, {"id": 3, "score": 1.5}]
+        assert client.get.await_args_list[1].args[0] == "https://next.page"
+
+    @pytest.mark.asyncio
+    async def test_process_tasks_concurrently_bounded_and_ordered(self):
+        """Test that tasks run at most max_concurrency at a time and results keep the task order."""
+        running = 0
+        peak = 0
+
+        async def task(index):
+            nonlocal running, peak
+            running += 1
+            peak = max(peak, running)
+            # Later tasks finish first
+            await asyncio.sleep(0.001 * (10 - index))
+            running -= 1
+            return index
+
+        results = await self.fetcher._process_tasks_concurrently(
+            [task(index) for index in range(10)], "Testing", max_concurrency=3
+        )
+
+        assert results == list(range(10))
+        assert peak == 3
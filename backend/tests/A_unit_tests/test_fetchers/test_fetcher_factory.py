@@ -0,0 +1,27 @@
+import pytest
+from backend.fetchers.fetcher_factory import FetcherFactory
+from backend.fetchers.graphql.github_fetcher import GitHubFetcher
+from backend.fetchers.graphql.gitlab_fetcher import GitLabFetcher
+from backend.fetchers.rest_api.bitbucket_fetcher import BitbucketFetcher
+from backend.graphql.enums import PlatformEnum
+
+
+@pytest.mark.parametrize(
+    "platform, fetcher_class",
+    [
+        (PlatformEnum.GITHUB, GitHubFetcher),
+        (PlatformEnum.GITLAB, GitLabFetcher),
+        (PlatformEnum.BITBUCKET, BitbucketFetcher),
+    ],
+)
+def test_get_fetcher_returns_platform_fetcher(platform, fetcher_class):
+    """Test that the factory creates a new fetcher of the platform's class."""
+    fetcher = FetcherFactory.get_fetcher(platform)
+    assert isinstance(fetcher, fetcher_class)
+    assert FetcherFactory.get_fetcher(platform) is not fetcher
+
+
+def test_get_fetcher_unsupported_platform():
+    """Test that an unknown platform raises a ValueError."""
+    with pytest.raises(ValueError, match="Unsupported platform"):
+        FetcherFactory.get_fetcher("unknown")
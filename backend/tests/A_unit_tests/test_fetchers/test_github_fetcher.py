@@ -1,3 +1,4 @@
+import re
 from unittest.mock import patch
 import pytest
 from backend.graphql.git_types import RepoData
@@ -76,7 +77,7 @@ class TestGitHubFetcher(FetcherTestHelper):
             {
                 "data": {
                     "search": {
-                        "edges": [{"node": {"name": "repo1"}}],
+                        "nodes": [{"name": "repo1"}],
                         "pageInfo": {"hasNextPage": True, "endCursor": "CURSOR1"},
                     }
                 }
@@ -85,7 +86,7 @@ class TestGitHubFetcher(FetcherTestHelper):
             {
                 "data": {
                     "search": {
-                        "edges": [{"node": {"name": "repo2"}}],
+                        "nodes": [{"name": "repo2"}],
                         "pageInfo": {"hasNextPage": False, "endCursor": None},
                     }
                 }
@@ -101,6 +102,15 @@ class TestGitHubFetcher(FetcherTestHelper):
         )
         assert 'after: "CURSOR"' in query
 
+    def test_build_query_reuses_template(self):
+        """Test that pages of a job only differ in their cursor."""
+        first = self.fetcher.build_query(self.settings, self.fields)
+        second = self.fetcher.build_query(
+            self.settings, self.fields, after_cursor="CURSOR"
+        )
+        assert second.replace(', after: "CURSOR"', "") == first
+        assert first.count("{") == first.count("}")
+
     @pytest.mark.asyncio
     async def test_execute_raw_query_empty(self):
         with pytest.raises(ValueError, match="The raw query must not be empty."):
@@ -114,3 +124,87 @@ class TestGitHubFetcher(FetcherTestHelper):
             RuntimeError, match="Failed to execute raw query on GitHub."
         ):
             await self.fetcher.execute_raw_query("query { dummy }")
+
+    @staticmethod
+    def _search_page(sort_mode):
+        return {
+            "nodes": [{"name": f"{sort_mode}-{i}"} for i in range(50)],
+            "pageInfo": {"hasNextPage": True, "endCursor": "CURSOR"},
+        }
+
+    @pytest.mark.asyncio
+    async def test_fetch_projects_batches_sort_modes(self):
+        """Test that large fetches request the next page of all sort modes in one batched query."""
+        requests = []
+
+        async def make_request(base_url, query, job_logger=None, use_cache=False):
+            aliases = re.findall(r"(q\d+): search\(query: \"[^\"]*sort:(\S+?)\"", query)
+            requests.append([sort_mode for _, sort_mode in aliases])
+            return {
+                "data": {
+                    alias: self._search_page(sort_mode) for alias, sort_mode in aliases
+                }
+            }
+
+        self.settings.repoCount = 1200
+        with patch.object(self.fetcher, "_make_request", side_effect=make_request):
+            result = await self.fetcher.fetch_projects(self.settings, ["name"])
+
+        assert len(result) == 1200
+        # Each of the 8 sort modes contributes 150 repositories in 3 rounds
+        assert len(requests) == 3
+        assert all(
+            sorted(modes) == sorted(self.fetcher.SORT_MODES) for modes in requests
+        )
+
+    @pytest.mark.asyncio
+    async def test_fetch_projects_stops_at_repo_count(self):
+        """Test that batched rounds request no more repositories than are still missing."""
+        requested = []
+
+        async def make_request(base_url, query, job_logger=None, use_cache=False):
+            aliases = re.findall(
+                r"(q\d+): search\(query: \"[^\"]*sort:(\S+?)\" type: REPOSITORY first: (\d+)",
+                query,
+            )
+            requested.append(sum(int(first) for _, _, first in aliases))
+            return {
+                "data": {
+                    alias: {
+                        "nodes": [
+                            {"name": f"{sort_mode}-{i}"} for i in range(int(first))
+                        ],
+                        "pageInfo": {"hasNextPage": True, "endCursor": "CURSOR"},
+                    }
+                    for alias, sort_mode, first in aliases
+                }
+            }
+
+        self.settings.repoCount = 1001
+        with patch.object(self.fetcher, "_make_request", side_effect=make_request):
+            result = await self.fetcher.fetch_projects(self.settings, ["name"])
+
+        assert len(result) == 1001
+        assert sum(requested) == 1001
+
+    @pytest.mark.asyncio
+    async def test_fetch_projects_falls_back_on_node_limit(self):
+        """Test that sort modes are fetched separately if the batched query exceeds the node limit."""
+        single_requests = []
+
+        async def make_request(base_url, query, job_logger=None, use_cache=False):
+            if "q0:" in query:
+                raise RuntimeError(
+                    "All tokens failed. Last error: MAX_NODE_LIMIT_EXCEEDED"
+                )
+            sort_mode = re.search(r"sort:(\S+?)\"", query).group(1)
+            single_requests.append(sort_mode)
+            return {"data": {"search": self._search_page(sort_mode)}}
+
+        self.settings.repoCount = 1200
+        with patch.object(self.fetcher, "_make_request", side_effect=make_request):
+            result = await self.fetcher.fetch_projects(self.settings, ["name"])
+
+        assert len(result) == 1200
+        assert set(single_requests) == set(self.fetcher.SORT_MODES)
+        assert len(single_requests) == 24
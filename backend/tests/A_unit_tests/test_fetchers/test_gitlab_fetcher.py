@@ -1,3 +1,4 @@
+import re
 from unittest.mock import patch
 import pytest
 
@@ -124,6 +125,38 @@ class TestGitLabFetcher:
         repo_names = [getattr(repo, "name", None) for repo in result]
         assert "Repo1" in repo_names and "Repo2" in repo_names
 
+    @pytest.mark.asyncio
+    async def test_fetch_projects_pages_with_cursor(self):
+        """Test that large fetches request bounded pages and follow the end cursor."""
+        self.settings.repoCount = 250
+        queries = []
+
+        async def make_request(base_url, query, job_logger=None, use_cache=False):
+            queries.append(query)
+            page = len(queries)
+            return {
+                "data": {
+                    "projects": {
+                        "nodes": [
+                            {"name": f"Repo{page}-{i}"}
+                            for i in range(100 if page < 3 else 50)
+                        ],
+                        "pageInfo": {"hasNextPage": True, "endCursor": f"C{page}"},
+                    }
+                }
+            }
+
+        with patch.object(self.fetcher, "_make_request", side_effect=make_request):
+            result = await self.fetcher.fetch_projects(self.settings, self.fields)
+
+        assert len(result) == 250
+        assert [re.search(r"first: (\d+)", q).group(1) for q in queries] == [
+            "100",
+            "100",
+            "50",
+        ]
+        assert 'after: "C2"' in queries[2]
+
     @pytest.mark.asyncio
     async def test_execute_raw_query_empty(self):
         """Test execute_raw_query with empty query."""
@@ -0,0 +1,25 @@
+import pytest
+from backend.utils.token_pool import TokenPool
+from backend.fetchers.base_graphql_fetcher import BaseGraphQLFetcher
+from backend.fetchers.http_client import close_http_client, get_http_client
+
+
+class DummyFetcher(BaseGraphQLFetcher):
+    def build_query(self, fetch_settings, fields):
+        return ""
+
+
+@pytest.mark.asyncio
+async def test_fetchers_share_http_client():
+    """Test that all fetchers use the same HTTP client and closing a fetcher keeps it open."""
+    first = DummyFetcher(token_pool=TokenPool(["token1"]))
+    second = DummyFetcher(token_pool=TokenPool(["token2"]))
+    assert first.client is second.client
+    assert first.client is get_http_client()
+
+    await first.close()
+    assert not second.client.is_closed
+
+    await close_http_client()
+    assert second.client.is_closed
+    assert get_http_client() is not second.client
@@ -1,6 +1,9 @@
+import httpx
+import orjson
 import pytest
 from unittest.mock import AsyncMock, patch, MagicMock
 from backend.utils.token_pool import TokenPool
+from backend.fetchers.base_fetcher import wait_retry_after
 from backend.fetchers.base_graphql_fetcher import BaseGraphQLFetcher
 
 
@@ -19,9 +22,9 @@ async def test_retry_on_rate_limit(monkeypatch):
     # Simulate rate limit error in response
     response_mock = MagicMock()
     response_mock.raise_for_status.return_value = None
-    response_mock.json.return_value = {
-        "errors": [{"message": "API rate limit exceeded"}]
-    }
+    response_mock.content = orjson.dumps(
+        {"errors": [{"message": "API rate limit exceeded"}]}
+    )
 
     fetcher.client.post = AsyncMock(return_value=response_mock)
 
@@ -44,7 +47,9 @@ async def test_retry_on_auth_error(monkeypatch):
     # Simulate authentication error in response
     response_mock = MagicMock()
     response_mock.raise_for_status.return_value = None
-    response_mock.json.return_value = {"errors": [{"message": "Authentication failed"}]}
+    response_mock.content = orjson.dumps(
+        {"errors": [{"message": "Authentication failed"}]}
+    )
 
     fetcher.client.post = AsyncMock(return_value=response_mock)
 
@@ -87,13 +92,13 @@ async def test_success_on_second_token(monkeypatch):
     # First call returns error, second call returns success
     response_error = MagicMock()
     response_error.raise_for_status.return_value = None
-    response_error.json.return_value = {
-        "errors": [{"message": "API rate limit exceeded"}]
-    }
+    response_error.content = orjson.dumps(
+        {"errors": [{"message": "API rate limit exceeded"}]}
+    )
 
     response_success = MagicMock()
     response_success.raise_for_status.return_value = None
-    response_success.json.return_value = {"data": {"ok": True}}
+    response_success.content = orjson.dumps({"data": {"ok": True}})
 
     fetcher.client.post = AsyncMock(side_effect=[response_error, response_success])
 
@@ -102,3 +107,105 @@ async def test_success_on_second_token(monkeypatch):
         assert result == {"data": {"ok": True}}
         assert "token1" in pool.banned
         assert "token2" not in pool.banned
+
+
+@pytest.mark.asyncio
+async def test_rate_limited_token_rotated_without_retry():
+    """Test that a 429 response moves on to the next token without waiting for Retry-After."""
+    pool = TokenPool(["token1", "token2"])
+    fetcher = DummyFetcher(token_pool=pool)
+    fetcher.client = MagicMock()
+    request = httpx.Request("POST", "https://example.com/graphql")
+    rate_limited = httpx.Response(429, headers={"Retry-After": "600"}, request=request)
+    success = httpx.Response(200, content=b'{"data": {"ok": true}}', request=request)
+
+    async def post(url, content, headers, timeout):
+        if headers["Authorization"] == "Bearer token1":
+            return rate_limited
+        return success
+
+    fetcher.client.post = AsyncMock(side_effect=post)
+
+    with patch("asyncio.sleep", new_callable=AsyncMock) as sleep:
+        result = await fetcher._make_request("url", "query")
+
+    assert result == {"data": {"ok": True}}
+    assert fetcher.client.post.await_count == 2
+    assert "token1" in pool.banned
+    sleep.assert_not_awaited()
+
+
+def test_wait_retry_after_header():
+    """Test that the Retry-After header of a 429 response overrides the fallback wait."""
+    request = httpx.Request("POST", "https://example.com/graphql")
+    wait = wait_retry_after(lambda retry_state: 1.0)
+
+    def retry_state_for(response):
+        error = httpx.HTTPStatusError("error", request=request, response=response)
+        retry_state = MagicMock()
+        retry_state.outcome.exception.return_value = error
+        return retry_state
+
+    rate_limited = httpx.Response(429, headers={"Retry-After": "7"}, request=request)
+    assert wait(retry_state_for(rate_limited)) == 7.0
+
+    # Without a Retry-After header or for other status codes the fallback is used
+    no_header = httpx.Response(429, request=request)
+    assert wait(retry_state_for(no_header)) == 1.0
+    server_error = httpx.Response(500, headers={"Retry-After": "7"}, request=request)
+    assert wait(retry_state_for(server_error)) == 1.0
+
+
+@pytest.mark.asyncio
+async def test_batch_query_merges_and_splits_queries():
+    """Test that queries are sent as aliased fields and the response is split per query."""
+    fetcher = DummyFetcher(token_pool=TokenPool(["token1"]))
+    fetcher.BATCH_SIZE = 2
+    sent_queries = []
+
+    async def make_request(base_url, query, job_logger=None, use_cache=False):
+        sent_queries.append(query)
+        aliases = [line.split(":", 1)[0] for line in query.splitlines()[1:-1]]
+        return {"data": {alias: {"alias": alias} for alias in aliases}}
+
+    with patch.object(fetcher, "_make_request", side_effect=make_request):
+        responses = await fetcher.batch_query(
+            "url",
+            [
+                '{ search(query: "a") { repositoryCount } }',
+                'query { search(query: "b") { repositoryCount } }',
+                "{ projects { count } }",
+            ],
+        )
+
+    assert len(sent_queries) == 2
+    assert 'q0: search(query: "a") { repositoryCount }' in sent_queries[0]
+    assert responses == [
+        {"data": {"search": {"alias": "q0"}}},
+        {"data": {"search": {"alias": "q1"}}},
+        {"data": {"projects": {"alias": "q2"}}},
+    ]
+
+
+@pytest.mark.asyncio
+async def test_rate_limited_token_banned_until_reset():
+    """Test that a 429 response bans the token until its X-RateLimit-Reset time."""
+    pool = TokenPool(["token1", "token2"])
+    fetcher = DummyFetcher(token_pool=pool)
+    request = httpx.Request("POST", "https://example.com/graphql")
+    rate_limited = httpx.Response(
+        429, headers={"X-RateLimit-Reset": "4102444800"}, request=request
+    )
+
+    async def make_request(token):
+        if token == "token1":
+            raise httpx.HTTPStatusError(
+                "rate limited", request=request, response=rate_limited
+            )
+        return {"data": {"ok": True}}
+
+    result = await fetcher._request_with_token_rotation(pool, make_request)
+
+    assert result == {"data": {"ok": True}}
+    assert pool.banned == {"token1": 4102444800.0}
+    assert pool.usage == {"token1": 1, "token2": 1}
@@ -0,0 +1,92 @@
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from backend.graphql.router import file_router, graphql_router
+
+app = FastAPI()
+app.include_router(graphql_router, prefix="/graphql")
+client = TestClient(app)
+
+
+def test_single_operation():
+    """Test that a single operation is answered with a single result."""
+    response = client.post("/graphql", json={"query": "{ __typename }"})
+    assert response.status_code == 200
+    assert response.json() == {"data": {"__typename": "Query"}}
+
+
+def test_batched_operations():
+    """Test that a batch of operations is answered with the results in order."""
+    response = client.post(
+        "/graphql",
+        json=[
+            {"query": "{ __typename }"},
+            {"query": "query Name { __schema { queryType { name } } }"},
+            {"query": "{ unknownField }"},
+        ],
+    )
+    assert response.status_code == 200
+    results = response.json()
+    assert results[0] == {"data": {"__typename": "Query"}}
+    assert results[1] == {"data": {"__schema": {"queryType": {"name": "Query"}}}}
+    assert results[2]["errors"]
+
+
+def test_batch_without_query():
+    """Test that a batch with a missing query is rejected."""
+    response = client.post("/graphql", json=[{"query": "{ __typename }"}, {}])
+    assert response.status_code == 400
+
+
+def test_fetch_projects_passes_nested_fields(mocker):
+    """Test that nested selections reach the fetcher as dot paths."""
+    fetcher = mocker.Mock()
+    fetcher.fetch_projects = mocker.AsyncMock(return_value=[])
+    mocker.patch(
+        "backend.graphql.query.FetcherFactory.get_fetcher", return_value=fetcher
+    )
+    query = """
+        fragment MrFields on MergeRequestData { createdAt }
+        {
+          fetchProjects(
+            platform: GITHUB
+            settings: {repoCount: 1, maxMRs: 1, searchTerm: "", programmingLanguage: ""}
+          ) { name mergeRequests { title ...MrFields } }
+        }
+    """
+    response = client.post("/graphql", json={"query": query})
+    assert response.json() == {"data": {"fetchProjects": []}}
+    requested_fields = fetcher.fetch_projects.await_args.args[1]
+    assert requested_fields == [
+        "name",
+        "mergeRequests.title",
+        "mergeRequests.createdAt",
+    ]
+
+
+def test_download_file_not_modified(tmp_path, mocker):
+    """Test that files are downloaded with validators and unchanged files answered with 304."""
+    mocker.patch("backend.graphql.router.gettempdir", return_value=str(tmp_path))
+    (tmp_path / "export.csv").write_text("name;count\nPython;1\n")
+    files_app = FastAPI()
+    files_app.include_router(file_router)
+    files_client = TestClient(files_app)
+
+    response = files_client.get("/files/export.csv")
+    assert response.status_code == 200
+    assert response.text == "name;count\nPython;1\n"
+    assert response.headers["content-length"] == "20"
+
+    cached = files_client.get(
+        "/files/export.csv", headers={"If-None-Match": response.headers["etag"]}
+    )
+    assert cached.status_code == 304
+    assert not cached.content
+    cached = files_client.get(
+        "/files/export.csv",
+        headers={"If-Modified-Since": response.headers["last-modified"]},
+    )
+    assert cached.status_code == 304
+
+    assert files_client.get("/files/%2E%2E").json() == {"error": "File not found"}
+    assert files_client.get("/files/missing.csv").json() == {"error": "File not found"}
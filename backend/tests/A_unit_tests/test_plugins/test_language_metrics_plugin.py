@@ -21,6 +21,40 @@ def test_collect_language_metrics(repo_data_language_metrics):
     assert tuple(sorted(["Python", "JavaScript"])) in metrics.combination_count
 
 
+def test_collect_language_metrics_combinations():
+    repo_data = [
+        {"name": "Repo1", "languages": ["Rust", "C", "Python"]},
+        {"name": "Repo2", "languages": ["Python", "C"]},
+        {"name": "Repo3", "languages": ["Go", "Go"]},
+        {"name": "Repo4", "languages": []},
+    ]
+    metrics = collect_language_metrics(repo_data)
+    assert metrics.total_repos == 4
+    assert metrics.total_language_mentions == 7
+    assert metrics.combination_count == {
+        ("C", "Python"): 2,
+        ("C", "Rust"): 1,
+        ("Python", "Rust"): 1,
+    }
+    assert metrics.multi_language_repo_count == {
+        "Rust": 1,
+        "C": 2,
+        "Python": 2,
+        "Go": 2,
+    }
+    assert metrics.single_language_repo_count == {}
+    assert metrics.language_repo_count["Go"] == {"Repo3"}
+
+
+def test_collect_language_metrics_dense_combinations():
+    repo_data = [
+        {"name": f"Repo{i}", "languages": ["Java", "Kotlin"]} for i in range(5)
+    ]
+    repo_data.append({"name": "Repo5", "languages": ["Kotlin", "Java", "Java"]})
+    metrics = collect_language_metrics(repo_data)
+    assert metrics.combination_count == {("Java", "Kotlin"): 6}
+
+
 def test_language_metrics_plugin_local_export(tmp_path, fetch_job_language_metrics):
     result = language_metrics_plugin(fetch_job_language_metrics, local_export=True)
     assert result.urls
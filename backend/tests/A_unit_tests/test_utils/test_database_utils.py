@@ -0,0 +1,27 @@
+from backend.graphql.git_types import MergeRequestData, RepoData
+from backend.utils.database_utils import convert_to_dataclass
+
+
+def test_convert_to_dataclass_nested():
+    """Test that repository dicts are converted with their merge requests."""
+    repo = convert_to_dataclass(
+        RepoData,
+        {
+            "name": "repo",
+            "starCount": 3,
+            "languages": ["Python", 1],
+            "mergeRequests": [{"title": "Fix bug", "authorName": "Alice"}],
+        },
+    )
+
+    assert isinstance(repo, RepoData)
+    assert repo.starCount == 3
+    assert repo.languages == ["Python", "1"]
+    assert repo.description is None
+    assert repo.mergeRequests == [
+        MergeRequestData(
+            authorName="Alice", createdAt=None, description=None, title="Fix bug"
+        )
+    ]
+    # Already converted instances are returned unchanged
+    assert convert_to_dataclass(RepoData, repo) is repo
@@ -0,0 +1,103 @@
+import asyncio
+from datetime import datetime
+
+import pytest
+
+from backend.graphql.enums import FetchJobMode, PlatformEnum, StateEnum
+from backend.graphql.git_types import FetchJob
+from backend.utils import mutation_utils
+
+
+@pytest.mark.asyncio
+async def test_process_fetch_jobs_bounded(mocker):
+    """Test that no more than the allowed number of fetch jobs run at the same time."""
+    running = 0
+    max_running = 0
+
+    async def execute_raw_query(raw_query, job_logger=None):
+        nonlocal running, max_running
+        running += 1
+        max_running = max(max_running, running)
+        await asyncio.sleep(0.01)
+        running -= 1
+        return []
+
+    fetcher = mocker.Mock()
+    fetcher.execute_raw_query = execute_raw_query
+    mocker.patch.object(
+        mutation_utils.FetcherFactory, "get_fetcher", return_value=fetcher
+    )
+    mocker.patch.object(mutation_utils, "update_job")
+    mocker.patch.object(mutation_utils, "update_job_log")
+    mocker.patch.object(mutation_utils, "_job_semaphore", asyncio.Semaphore(2))
+
+    jobs = [
+        FetchJob(
+            jobId=str(i),
+            name=f"Job {i}",
+            mode=FetchJobMode.EXPERT,
+            platform=PlatformEnum.GITHUB,
+            state=StateEnum.RUNNING,
+            startTime=datetime.now(),
+            rawQuery="{ viewer { login } }",
+        )
+        for i in range(5)
+    ]
+    await asyncio.gather(
+        *(mutation_utils.process_fetch_job_based_on_mode(job) for job in jobs)
+    )
+
+    assert max_running == 2
+    assert all(job.state == StateEnum.SUCCESSFUL for job in jobs)
+    assert any(
+        entry.endswith("Waiting for other jobs to finish")
+        for job in jobs
+        for entry in job.log
+    )
+
+
+def test_job_log_keeps_newest_entries(mocker):
+    """Test that the job log is capped to the newest entries."""
+    mocker.patch.object(mutation_utils, "update_job")
+    mocker.patch.object(mutation_utils, "update_job_log")
+    mocker.patch.object(
+        mutation_utils,
+        "app_configuration",
+        mutation_utils.app_configuration.model_copy(update={"MAX_JOB_LOG_LINES": 3}),
+    )
+    job = FetchJob(
+        jobId="1",
+        name="Job",
+        mode=FetchJobMode.EXPERT,
+        platform=PlatformEnum.GITHUB,
+        state=StateEnum.RUNNING,
+    )
+
+    for i in range(5):
+        mutation_utils.append_job_log(job, f"Entry {i}")
+
+    assert job.log == ["Entry 2", "Entry 3", "Entry 4"]
+
+
+def test_finalize_job_measures_monotonic_time(mocker):
+    """Test that the execution time is taken from the monotonic clock in whole seconds."""
+    mocker.patch.object(mutation_utils, "update_job")
+    mocker.patch.object(mutation_utils, "update_job_log")
+    monotonic_ns = mocker.patch.object(
+        mutation_utils.time, "monotonic_ns", return_value=1_000_000_000
+    )
+    job = FetchJob(
+        jobId="1",
+        name="Job",
+        mode=FetchJobMode.EXPERT,
+        platform=PlatformEnum.GITHUB,
+        state=StateEnum.CREATED,
+    )
+
+    mutation_utils.start_job(job)
+    assert job.state == StateEnum.RUNNING
+    monotonic_ns.return_value = 3_500_000_000
+    mutation_utils.finalize_job(job, StateEnum.SUCCESSFUL, "Completed", [])
+
+    assert job.executionTime == 2
+    assert job.log[-1].endswith("Completed with 0 repositories (2s)")
@@ -0,0 +1,27 @@
+from unittest.mock import patch
+
+from backend.utils.response_cache import ResponseCache
+
+
+def test_response_cache_evicts_and_expires():
+    """Test that the least recently used entry is evicted and entries expire after the TTL."""
+    cache = ResponseCache(ttl=10.0, maxsize=2)
+    cache.set("a", {"page": 1})
+    cache.set("b", {"page": 2})
+    assert cache.get("a") == {"page": 1}
+
+    # "b" is now the least recently used entry
+    cache.set("c", {"page": 3})
+    assert cache.get("b") is None
+    assert cache.get("c") == {"page": 3}
+
+    with patch("backend.utils.response_cache.time.monotonic", return_value=1e12):
+        assert cache.get("a") is None
+
+
+def test_response_cache_key():
+    """Test that keys depend on every part and are short."""
+    key = ResponseCache.make_key("url", "query")
+    assert key == ResponseCache.make_key("url", "query")
+    assert key != ResponseCache.make_key("urlquery", "")
+    assert len(key) == 32
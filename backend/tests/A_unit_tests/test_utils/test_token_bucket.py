@@ -0,0 +1,36 @@
+import time
+
+import pytest
+from backend.utils.token_bucket import TokenBucket
+
+
+@pytest.mark.asyncio
+async def test_token_bucket_burst_and_wait():
+    """Test that the bucket allows a burst up to its capacity and then paces requests."""
+    bucket = TokenBucket(rate=20.0, capacity=2)
+
+    start = time.monotonic()
+    await bucket.acquire()
+    await bucket.acquire()
+    assert time.monotonic() - start < 0.05
+
+    # The third request has to wait for a token to be refilled (1 / 20 s)
+    await bucket.acquire()
+    assert time.monotonic() - start >= 0.04
+
+
+def test_token_bucket_rate_adaptation():
+    """Test that the rate is clamped, halved on failure and raised slowly on success."""
+    bucket = TokenBucket(rate=10.0, capacity=5, min_rate=1.0)
+
+    bucket.update_rate(100.0)
+    assert bucket.rate == 10.0
+
+    bucket.observe(success=False)
+    assert bucket.rate == 5.0
+
+    bucket.observe(success=True)
+    assert bucket.rate == 6.0
+
+    bucket.update_rate(0.0)
+    assert bucket.rate == 1.0
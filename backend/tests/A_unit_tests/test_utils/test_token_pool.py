@@ -1,4 +1,6 @@
 import time
+
+import pytest
 from backend.utils.token_pool import TokenPool
 
 
@@ -70,3 +72,62 @@ def test_token_pool_no_tokens():
     pool = TokenPool([])
     assert pool.get_token() is None
     pool.ban_token("any")
+
+
+def test_token_pool_strategies():
+    """Test the fill-first and least-used token selection strategies."""
+    pool = TokenPool(["a", "b", "c"], strategy="fill_first")
+    assert [pool.get_token() for _ in range(3)] == ["a", "a", "a"]
+
+    pool.observe("a", "success")
+    pool.observe("a", "success")
+    pool.observe("b", "success")
+    assert pool.get_token(strategy="least_used") == "c"
+
+
+def test_token_pool_observe_rate_limit_until_reset():
+    """Test that a rate limited token stays banned until the reported reset time."""
+    pool = TokenPool(["a", "b"])
+    pool.cooldown = 1
+    reset_at = time.time() + 60
+
+    pool.observe("a", "ratelimit", reset_at=reset_at)
+    assert pool.banned["a"] == reset_at
+
+    # Plain errors are not banned, invalid tokens use the cooldown
+    pool.observe("b", "error")
+    assert "b" not in pool.banned
+    pool.observe("b", "invalid")
+    assert pool.banned["b"] <= time.time() + 1
+
+
+def test_token_pool_drops_expired_bans():
+    """Test that expired bans are removed and all tokens are rotated again."""
+    pool = TokenPool(["a", "b"])
+    pool.ban_token("a", until=time.time() + 60)
+    assert [pool.get_token() for _ in range(2)] == ["b", "b"]
+
+    pool.banned["a"] = time.time() - 1
+    assert {pool.get_token(), pool.get_token()} == {"a", "b"}
+    assert not pool.banned
+
+
+@pytest.mark.asyncio
+async def test_token_pool_paces_tokens():
+    """Test that each token is paced by its own bucket and re-sized from the reported quota."""
+    pool = TokenPool(["a", "b"], rate=20.0, burst=1)
+    pool.buckets["a"].jitter = pool.buckets["b"].jitter = 0.0
+
+    start = time.monotonic()
+    assert [await pool.acquire() for _ in range(2)] == ["a", "b"]
+    assert time.monotonic() - start < 0.04
+
+    # Both buckets are empty now, the next token waits for a refill (1 / 20 s)
+    await pool.acquire()
+    assert time.monotonic() - start >= 0.04
+
+    pool.update_rate_limit("b", remaining=10, reset_at=time.time() + 100)
+    assert pool.buckets["b"].rate == pytest.approx(0.1, rel=0.05)
+    # Without a quota the rate is left as is
+    pool.update_rate_limit("a", remaining=None, reset_at=None)
+    assert pool.buckets["a"].rate == 20.0
@@ -38,7 +38,7 @@ class TestExportAndPlugin(JobTestHelper):
         assert file_url.startswith("http://") or file_url.startswith("https://")
 
         # Test plugin execution (local)
-        plugin_result = mutation.execute_plugin(
+        plugin_result = await mutation.execute_plugin(
             job_id=created_job.jobId,
             plugin=PluginEnum.LANGUAGE_METRICS,
             local_export=True,
@@ -40,3 +40,13 @@ def repo_data_special_chars():
 @pytest.fixture
 def repo_data_empty():
     return []
+
+
+@pytest.fixture
+def export_dir(tmp_path, monkeypatch):
+    """Redirect server and local CSV exports to a temporary directory of the test."""
+    monkeypatch.setattr("backend.utils.csv_exporter.gettempdir", lambda: str(tmp_path))
+    monkeypatch.setattr(
+        "backend.utils.csv_exporter.get_export_path", lambda: str(tmp_path)
+    )
+    return tmp_path
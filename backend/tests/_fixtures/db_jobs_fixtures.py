@@ -1,16 +1,24 @@
 import mongomock
 import pytest
+from bson import ObjectId
 from backend.graphql.enums import PlatformEnum, StateEnum, FetchJobMode
 from backend.graphql.git_types import FetchJob, FetcherSettings
 
 
-@pytest.fixture
-def mock_collection():
-    """Provides a fresh mocked MongoDB collection for each test."""
+@pytest.fixture(scope="module")
+def module_mock_collection():
+    """Creates the mocked MongoDB collection once per test module."""
     client = mongomock.MongoClient()
-    db = client["test_db"]
-    collection = db["fetch_jobs"]
+    collection = client["test_db"]["fetch_jobs"]
     yield collection
+    collection.drop()
+
+
+@pytest.fixture
+def mock_collection(module_mock_collection):
+    """Provides the shared mocked MongoDB collection, emptied after each test."""
+    yield module_mock_collection
+    module_mock_collection.delete_many({})
 
 
 @pytest.fixture
@@ -34,9 +42,12 @@ def sample_fetch_job() -> FetchJob:
 
 @pytest.fixture
 def create_sample_job(mock_collection, sample_fetch_job):
-    """Creates a job in the mock collection and returns the job and its ID."""
+    """
+    Creates a job in the mock collection and returns the job, its ID and the parsed
+    ObjectId of that ID for document lookups.
+    """
     from backend.database.jobs import create_job
 
     job_id = create_job(sample_fetch_job, collection=mock_collection)
     sample_fetch_job.jobId = job_id
-    return sample_fetch_job, job_id
+    return sample_fetch_job, job_id, ObjectId(job_id)
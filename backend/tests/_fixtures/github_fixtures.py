@@ -73,25 +73,23 @@ def mock_github_response_success():
     return {
         "data": {
             "search": {
-                "edges": [
+                "nodes": [
                     {
-                        "node": {
-                            "name": "repo1",
-                            "description": "A test repository",
-                            "stargazers": {"totalCount": 5},
-                            "primaryLanguage": {"name": "Python"},
-                            "pullRequests": {
-                                "nodes": [
-                                    {
-                                        "author": {"login": "user1"},
-                                        "createdAt": "2025-01-01",
-                                        "bodyText": "Test pull request",
-                                        "title": "Fix issue",
-                                        "reactions": {"totalCount": 2},
-                                    }
-                                ]
-                            },
-                        }
+                        "name": "repo1",
+                        "description": "A test repository",
+                        "stargazers": {"totalCount": 5},
+                        "primaryLanguage": {"name": "Python"},
+                        "pullRequests": {
+                            "nodes": [
+                                {
+                                    "author": {"login": "user1"},
+                                    "createdAt": "2025-01-01",
+                                    "bodyText": "Test pull request",
+                                    "title": "Fix issue",
+                                    "reactions": {"totalCount": 2},
+                                }
+                            ]
+                        },
                     }
                 ],
                 "pageInfo": {"hasNextPage": False, "endCursor": None},
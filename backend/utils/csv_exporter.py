@@ -1,7 +1,8 @@
+import csv
 import os
 from datetime import datetime
 from tempfile import gettempdir
-from typing import List, Dict, Optional
+from typing import Iterable, List, Dict, Optional, Tuple
 
 import pandas as pd
 
@@ -66,21 +67,23 @@ class CSVExporter:
 
     @staticmethod
     def export_plugin_data_to_csv(
-        data: List[Dict],
+        data: Iterable[Dict],
         job_id: str,
         local_export: bool = False,
         file_name: Optional[str] = None,
     ) -> str:
         """
         Exports plugin generated data to a CSV file.
+        The columns are the keys of all rows in order of first appearance; cells of keys
+        missing in a row are left empty.
         If local_export is False (default), saves in temp dir (overwrites if exists) and returns the file URL.
         If local_export is True, saves in export path (with _01, _02, ...) and returns the local file path.
         You can optionally specify a custom file_name (should include .csv).
         """
-        if not data:
+        rows = list(data)
+        if not rows:
             raise ValueError("No data available for export.")
 
-        df = pd.DataFrame(data)
         timestamp = datetime.now().strftime("%Y%m%d_%H%M")
         if not file_name:
             file_name = f"plugin_data_{job_id}_{timestamp}.csv"
@@ -96,7 +99,18 @@ class CSVExporter:
             export_dir = get_export_path()
             file_path = get_unique_file_path(export_dir, file_name)
 
-        df.to_csv(file_path, index=False, sep=";", encoding="utf-8-sig")
+        # Same format as the pandas export of the repository data
+        fieldnames = list(dict.fromkeys(key for row in rows for key in row))
+        with open(file_path, "w", newline="", encoding="utf-8-sig") as file:
+            writer = csv.DictWriter(
+                file,
+                fieldnames=fieldnames,
+                restval="",
+                delimiter=";",
+                lineterminator=os.linesep,
+            )
+            writer.writeheader()
+            writer.writerows(rows)
 
         if not local_export:
             return CSVExporter.generate_file_url(file_path)
@@ -116,21 +130,27 @@ class CSVExporter:
         """
         Flattens nested dictionaries and lists into a flat dictionary with indexed keys.
         """
-        items = []
+        items: List[Tuple[str, object]] = []
+        CSVExporter._flatten_into(items, data, parent_key, sep)
+        return dict(items)
+
+    @staticmethod
+    def _flatten_into(
+        items: List[Tuple[str, object]], data: Dict, parent_key: str, sep: str
+    ) -> None:
+        """
+        Append the flattened (key, value) pairs of data to items.
+        All nesting levels share the one list, so no intermediate dicts are built.
+        """
         for key, value in data.items():
             new_key = f"{parent_key}{sep}{key}" if parent_key else key
             if isinstance(value, dict):
-                items.extend(CSVExporter.flatten_dict(value, new_key, sep=sep).items())
+                CSVExporter._flatten_into(items, value, new_key, sep)
             elif isinstance(value, list):
                 for i, item in enumerate(value, start=1):
                     if isinstance(item, dict):
-                        items.extend(
-                            CSVExporter.flatten_dict(
-                                item, f"{new_key}_{i}", sep=sep
-                            ).items()
-                        )
+                        CSVExporter._flatten_into(items, item, f"{new_key}_{i}", sep)
                     elif item is not None:
                         items.append((f"{new_key}_{i}", item))
             elif value is not None:
                 items.append((new_key, value))
-        return dict(items)
@@ -1,5 +1,38 @@
 from dataclasses import fields, is_dataclass
-from typing import get_args, get_origin, get_type_hints
+from functools import lru_cache
+from typing import Optional, Tuple, get_args, get_origin, get_type_hints
+
+
+@lru_cache(maxsize=None)
+def _get_conversion_plan(
+    cls: type,
+) -> Tuple[Tuple[str, Optional[type], Optional[type]], ...]:
+    """
+    Resolve the field types of a dataclass once per class.
+    Returns (field name, list item type, nested dataclass type) per field.
+    """
+    field_types = get_type_hints(cls)
+    plan = []
+    for f in fields(cls):
+        target_type = field_types.get(f.name)
+        item_type = None
+        if get_origin(target_type) is list and get_args(target_type):
+            item_type = get_args(target_type)[0]
+        nested_type = target_type if is_dataclass(target_type) else None
+        plan.append((f.name, item_type, nested_type))
+    return tuple(plan)
+
+
+@lru_cache(maxsize=None)
+def _get_flat_field_names(cls: type) -> Optional[Tuple[str, ...]]:
+    """
+    Return the field names of a dataclass without list or nested dataclass fields,
+    or None if it has any. Such classes are built directly from the dict.
+    """
+    plan = _get_conversion_plan(cls)
+    if any(item_type or nested_type for _, item_type, nested_type in plan):
+        return None
+    return tuple(name for name, _, _ in plan)
 
 
 def convert_to_dataclass(cls, data):
@@ -7,33 +40,29 @@ def convert_to_dataclass(cls, data):
     if isinstance(data, cls):
         return data
     if isinstance(data, dict):
-        field_types = get_type_hints(cls)
+        flat_field_names = _get_flat_field_names(cls)
+        if flat_field_names is not None:
+            return cls(**{name: data.get(name) for name in flat_field_names})
+
         converted_data = {}
-        for f in fields(cls):
-            value = data.get(f.name)
+        for name, item_type, nested_type in _get_conversion_plan(cls):
+            value = data.get(name)
             if value is None:
-                converted_data[f.name] = None
-                continue
-
-            target_type = field_types.get(f.name)
-            origin = get_origin(target_type)
-            args = get_args(target_type)
-
-            if f.name == "languages" and isinstance(value, list):
-                converted_data[f.name] = [str(lang) for lang in value]
-            elif origin is list and args:
-                item_type = args[0]
+                converted_data[name] = None
+            elif name == "languages" and isinstance(value, list):
+                converted_data[name] = [str(lang) for lang in value]
+            elif item_type is not None:
                 converted_list = []
                 for item in value:
                     if is_dataclass(item_type) and isinstance(item, str):
                         converted_list.append(item_type(name=item))
                     else:
                         converted_list.append(convert_to_dataclass(item_type, item))
-                converted_data[f.name] = converted_list
-            elif is_dataclass(target_type):
-                converted_data[f.name] = convert_to_dataclass(target_type, value)
+                converted_data[name] = converted_list
+            elif nested_type is not None:
+                converted_data[name] = convert_to_dataclass(nested_type, value)
             else:
-                converted_data[f.name] = value
+                converted_data[name] = value
 
         return cls(**converted_data)
     return data
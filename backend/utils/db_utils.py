@@ -1,5 +1,7 @@
-from dataclasses import is_dataclass
-from typing import Any, Optional
+from dataclasses import fields, is_dataclass
+from enum import Enum
+from functools import lru_cache
+from typing import Any, Optional, Tuple, get_type_hints
 
 from backend.graphql.enums import PlatformEnum, StateEnum, FetchJobMode
 from backend.graphql.git_types import FetcherSettings, FetchJob
@@ -17,22 +19,50 @@ def remove_object_id(document: dict) -> dict:
     return document
 
 
-def convert_enums_to_strings(data: dict) -> dict:
-    """Convert enum values to their string representations."""
-    if not isinstance(data, dict):
-        raise TypeError(f"Invalid input type: {type(data).__name__}")
-
-    conversions = {
-        'platform': PlatformEnum,
-        'state': StateEnum,
-        'mode': FetchJobMode
-    }
-
-    for key, enum in conversions.items():
-        if value := data.get(key):
-            data[key] = value.value if isinstance(value, enum) else value
-
-    return data
+@lru_cache(maxsize=None)
+def _get_fetch_job_fields() -> Tuple[Tuple[str, bool], ...]:
+    """Return the cached FetchJob field names with a flag for enum-typed fields."""
+    type_hints = get_type_hints(FetchJob)
+    return tuple(
+        (
+            f.name,
+            isinstance(type_hints[f.name], type)
+            and issubclass(type_hints[f.name], Enum),
+        )
+        for f in fields(FetchJob)
+    )
+
+
+@lru_cache(maxsize=None)
+def _get_field_names(cls: type) -> Tuple[str, ...]:
+    """Return the cached field names of a dataclass type."""
+    return tuple(f.name for f in fields(cls))
+
+
+def _to_document_value(value: Any) -> Any:
+    """Convert nested dataclasses and containers into plain dicts and lists."""
+    if is_dataclass(value):
+        return {
+            name: _to_document_value(getattr(value, name))
+            for name in _get_field_names(type(value))
+        }
+    if isinstance(value, list):
+        return [_to_document_value(item) for item in value]
+    if isinstance(value, dict):
+        return {key: _to_document_value(item) for key, item in value.items()}
+    return value
+
+
+def convert_job_to_document(job: FetchJob) -> dict:
+    """Convert a FetchJob into a MongoDB document in a single pass over its fields."""
+    document = {}
+    for name, is_enum in _get_fetch_job_fields():
+        value = getattr(job, name)
+        if is_enum:
+            document[name] = value.value if isinstance(value, Enum) else value
+        else:
+            document[name] = _to_document_value(value)
+    return document
 
 
 def convert_strings_to_enums(data: dict) -> FetchJob:
@@ -64,8 +94,10 @@ def convert_strings_to_enums(data: dict) -> FetchJob:
         raise ValueError(f"Data conversion failed: {e}") from e
 
 
-def find_one_as_dict(collection, query: dict) -> Optional[dict]:
-    """Retrieve single document as dictionary."""
-    if result := collection.find_one(query):
+def find_one_as_dict(
+    collection, query: dict, projection: Optional[dict] = None
+) -> Optional[dict]:
+    """Retrieve single document as dictionary, optionally limited to a projection."""
+    if result := collection.find_one(query, projection):
         return dict(result)
     return None
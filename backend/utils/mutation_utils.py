@@ -1,14 +1,23 @@
+import asyncio
 import logging
+import time
 from datetime import datetime
-from typing import Optional, List
+from typing import Dict, Optional, List
 
-from backend.database.jobs import update_job, get_job
+from backend.app.config import app_configuration
+from backend.database.jobs import update_job, update_job_log, get_job
 from backend.fetchers.fetcher_factory import FetcherFactory
 from backend.graphql.enums import StateEnum, FetchJobMode
 from backend.graphql.git_types import FetchJob, FetcherSettings, RequestedFieldInput
 
 logger = logging.getLogger(__name__)
 
+# Bounds the fetch jobs running at the same time, further started jobs wait for a slot
+_job_semaphore = asyncio.Semaphore(app_configuration.MAX_CONCURRENT_JOBS)
+
+# Monotonic start times (ns) of the jobs started by this process, keyed by job ID
+_job_start_times: Dict[str, int] = {}
+
 
 class JobException(Exception):
     """Custom exception for job processing errors."""
@@ -16,9 +25,16 @@ class JobException(Exception):
 
 
 def _log_to_job(job: FetchJob, message: str) -> None:
-    """Append a log entry to the job log and persist it."""
+    """
+    Append a log entry to the job log and persist it.
+    Only the newest MAX_JOB_LOG_LINES entries are kept, so long running jobs do not
+    grow their document (written on every entry) without bound.
+    """
     job.log.append(message)
-    update_job(job)
+    overflow = len(job.log) - app_configuration.MAX_JOB_LOG_LINES
+    if overflow > 0:
+        del job.log[:overflow]
+    update_job_log(job.jobId, job.log)
 
 
 def append_job_log(job: FetchJob, message: str) -> None:
@@ -65,6 +81,14 @@ def fetch_and_validate_job(
     return job
 
 
+def start_job(job: FetchJob) -> None:
+    """Mark a job as running and record its start time."""
+    job.state = StateEnum.RUNNING
+    job.startTime = datetime.now()
+    _job_start_times[job.jobId] = time.monotonic_ns()
+    update_job(job)
+
+
 def finalize_job(
     job: FetchJob, state: StateEnum, message: str, repo_data: Optional[List] = None
 ) -> None:
@@ -73,7 +97,14 @@ def finalize_job(
         raise JobException("Cannot finalize unstarted job")
     job.state = state
     job.endTime = datetime.now()
-    job.executionTime = (job.endTime - job.startTime).total_seconds()
+    # The execution time is measured on the monotonic clock, so clock adjustments
+    # during the job do not distort it
+    start_ns = _job_start_times.pop(job.jobId, None)
+    if start_ns is not None:
+        job.executionTime = (time.monotonic_ns() - start_ns) // 1_000_000_000
+    else:
+        # Started by another process or before a restart, only the wall clock is known
+        job.executionTime = int((job.endTime - job.startTime).total_seconds())
     if repo_data is not None:
         job.repoData = repo_data
         message += f" with {len(repo_data)} repositories"
@@ -94,18 +125,22 @@ async def process_fetch_job_based_on_mode(job: FetchJob) -> None:
         def job_logger(msg: str) -> None:
             append_job_log(job, msg)
 
-        intern_job_log(job, f"Starting {job.mode.value} mode processing")
-
-        if job.mode == FetchJobMode.ASSISTANT:
-            repo_data = await fetcher.fetch_projects(
-                job.settings, job.requestedFields, job_logger=job_logger
-            )
-        elif job.mode == FetchJobMode.EXPERT:
-            repo_data = await fetcher.execute_raw_query(
-                job.rawQuery, job_logger=job_logger
-            )
-        else:
-            raise ValueError(f"Invalid mode: {job.mode}")
+        if _job_semaphore.locked():
+            intern_job_log(job, "Waiting for other jobs to finish")
+
+        async with _job_semaphore:
+            intern_job_log(job, f"Starting {job.mode.value} mode processing")
+
+            if job.mode == FetchJobMode.ASSISTANT:
+                repo_data = await fetcher.fetch_projects(
+                    job.settings, job.requestedFields, job_logger=job_logger
+                )
+            elif job.mode == FetchJobMode.EXPERT:
+                repo_data = await fetcher.execute_raw_query(
+                    job.rawQuery, job_logger=job_logger
+                )
+            else:
+                raise ValueError(f"Invalid mode: {job.mode}")
 
         finalize_job(job, StateEnum.SUCCESSFUL, "Completed", repo_data)
     except Exception as e:
@@ -15,9 +15,10 @@ class PluginRegistry:
 
     @classmethod
     def get(cls, name: str) -> Callable[[FetchJob], str]:
-        if name not in cls._plugins:
+        func = cls._plugins.get(name)
+        if func is None:
             raise PluginException(f"Plugin '{name}' not found.")
-        return cls._plugins[name]
+        return func
 
     @classmethod
     def all_names(cls):
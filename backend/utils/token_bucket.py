@@ -0,0 +1,72 @@
+import asyncio
+import random
+import time
+from typing import Optional
+
+
+class TokenBucket:
+    """
+    Adaptive token bucket for pacing API requests.
+    Tokens refill continuously at the current rate (requests per second) up to the capacity.
+    The rate can be set from rate limit headers and adapts on success (additive increase)
+    and on failure (multiplicative decrease). Waits can be stretched by a random jitter
+    so that clients sharing a limit do not retry in lockstep.
+    """
+
+    def __init__(
+        self,
+        rate: float,
+        capacity: float,
+        min_rate: float = 0.1,
+        max_rate: Optional[float] = None,
+        jitter: float = 0.0,
+    ):
+        """
+        Initialize the bucket full, with the given refill rate and capacity.
+        """
+        self.capacity = capacity
+        self.tokens = capacity
+        self.min_rate = min_rate
+        self.max_rate = max_rate or rate
+        self.rate = max(min_rate, min(rate, self.max_rate))
+        self.jitter = jitter
+        self.last_refill = time.monotonic()
+        self._lock = asyncio.Lock()
+
+    def _refill(self) -> None:
+        """Add the tokens accumulated since the last refill."""
+        now = time.monotonic()
+        self.tokens = min(
+            self.capacity, self.tokens + (now - self.last_refill) * self.rate
+        )
+        self.last_refill = now
+
+    async def acquire(self, tokens: float = 1.0) -> None:
+        """
+        Take tokens from the bucket, waiting until enough have been refilled.
+        Waiters are served in order.
+        """
+        async with self._lock:
+            self._refill()
+            if self.tokens < tokens:
+                wait = (tokens - self.tokens) / self.rate
+                if self.jitter:
+                    wait += random.uniform(0, self.jitter * wait)
+                await asyncio.sleep(wait)
+                self._refill()
+            self.tokens -= tokens
+
+    def update_rate(self, rate: float) -> None:
+        """Set the refill rate, e.g. from the remaining quota and its reset time."""
+        self.rate = max(self.min_rate, min(rate, self.max_rate))
+
+    def decrease(self, factor: float = 0.5) -> None:
+        """Reduce the refill rate multiplicatively, e.g. after a rate limit error."""
+        self.update_rate(self.rate * factor)
+
+    def observe(self, success: bool) -> None:
+        """Adapt the rate to a request outcome: increase slowly on success, halve on failure."""
+        if success:
+            self.update_rate(self.rate + self.min_rate)
+        else:
+            self.decrease()
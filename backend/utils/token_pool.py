@@ -1,44 +1,121 @@
 import threading
 import time
-from typing import List, Optional
+from typing import Dict, List, Optional
 from backend.app.config import app_configuration
+from backend.utils.token_bucket import TokenBucket
+
+# Token selection strategies
+ROUND_ROBIN = "round_robin"
+FILL_FIRST = "fill_first"
+LEAST_USED = "least_used"
+
+# Request outcomes reported via TokenPool.observe
+OUTCOME_SUCCESS = "success"
+OUTCOME_RATE_LIMITED = "ratelimit"
+OUTCOME_INVALID = "invalid"
+OUTCOME_ERROR = "error"
+
 
 class TokenPool:
     """
     Token pool for managing API tokens.
-    Allows round-robin token selection and supports banning tokens (on rate limit or auth errors).
-    Uses a configurable cooldown for banned tokens.
+    Selects tokens round-robin, fill-first or least-used and supports banning tokens (on rate limit or auth errors).
+    Banned tokens cool down until the provider's rate limit reset or for a configurable cooldown.
+    With a rate, each token gets its own token bucket, so acquire() never hands out a token
+    faster than the provider allows.
     """
 
-    def __init__(self, tokens: List[str]):
+    def __init__(
+        self,
+        tokens: List[str],
+        strategy: Optional[str] = None,
+        rate: Optional[float] = None,
+        burst: Optional[int] = None,
+    ):
         """
-        Initialize the TokenPool with a list of tokens.
+        Initialize the TokenPool with a list of tokens and an optional rate (requests per second per token).
         """
         self.tokens = tokens
         self.lock = threading.Lock()
         self.index = 0
         self.banned = {}
+        self.usage: Dict[str, int] = {token: 0 for token in tokens}
         self.cooldown = getattr(app_configuration, "TOKEN_BAN_COOLDOWN", 600)
+        self.strategy = strategy or getattr(app_configuration, "TOKEN_STRATEGY", ROUND_ROBIN)
+        self.buckets: Dict[str, TokenBucket] = {}
+        if rate:
+            burst = burst or getattr(app_configuration, "TOKEN_RATE_BURST", 1)
+            jitter = getattr(app_configuration, "RATE_LIMIT_JITTER", 0.0)
+            self.buckets = {
+                token: TokenBucket(rate=rate, capacity=burst, jitter=jitter)
+                for token in tokens
+            }
 
-    def get_token(self) -> Optional[str]:
+    def get_token(self, strategy: Optional[str] = None) -> Optional[str]:
         """
-        Get the next token in a round-robin model.
+        Get the next available token using the given or the pool's strategy.
         Returns None if no tokens are available.
         """
+        strategy = strategy or self.strategy
         with self.lock:
-            now = time.time()
-            available = [t for t in self.tokens if t not in self.banned or self.banned[t] < now]
+            available = self.tokens
+            if self.banned:
+                # Expired bans are dropped, so the pool rotates over all tokens again once none is banned
+                now = time.time()
+                self.banned = {t: until for t, until in self.banned.items() if until >= now}
+                available = [t for t in self.tokens if t not in self.banned]
             if not available:
                 return None
+            if strategy == FILL_FIRST:
+                return available[0]
+            if strategy == LEAST_USED:
+                return min(available, key=lambda t: self.usage.get(t, 0))
             token = available[self.index % len(available)]
             self.index = (self.index + 1) % len(available)
             return token
 
-    def ban_token(self, token: str, cooldown: Optional[int] = None):
+    async def acquire(self, strategy: Optional[str] = None) -> Optional[str]:
+        """
+        Get the next available token like get_token and wait until its rate allows another request.
+        Returns None if no tokens are available.
+        """
+        token = self.get_token(strategy)
+        bucket = self.buckets.get(token)
+        if bucket is not None:
+            await bucket.acquire()
+        return token
+
+    def update_rate_limit(self, token: str, remaining: Optional[int], reset_at: Optional[float]):
+        """
+        Pace a token by the quota reported by the provider: the remaining requests are spread
+        evenly until reset_at (a Unix timestamp).
+        """
+        bucket = self.buckets.get(token)
+        if bucket is None or remaining is None or reset_at is None:
+            return
+        bucket.update_rate(remaining / max(1.0, reset_at - time.time()))
+
+    def ban_token(self, token: str, cooldown: Optional[int] = None, until: Optional[float] = None):
         """
         Remove a token from the pool (e.g. if it is rate-limited or invalid).
+        The token is available again at the given timestamp or after the cooldown.
         """
         with self.lock:
             if token in self.tokens:
-                until = time.time() + (cooldown or self.cooldown)
-                self.banned[token] = until
\ No newline at end of file
+                if until is None or until <= time.time():
+                    until = time.time() + (cooldown or self.cooldown)
+                self.banned[token] = until
+
+    def observe(self, token: str, outcome: str, reset_at: Optional[float] = None):
+        """
+        Record the outcome of a request made with the token.
+        Rate limited tokens are banned until reset_at (a Unix timestamp) if known,
+        invalid tokens for the cooldown; other outcomes only count as usage.
+        """
+        if outcome == OUTCOME_RATE_LIMITED:
+            self.ban_token(token, until=reset_at)
+        elif outcome == OUTCOME_INVALID:
+            self.ban_token(token)
+        with self.lock:
+            if token in self.usage:
+                self.usage[token] += 1